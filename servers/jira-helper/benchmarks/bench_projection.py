@@ -0,0 +1,79 @@
+"""
+Benchmark search-row extraction on synthetic 1,000-issue pages.
+
+Compares the compiled `projection.extract_search_row` with the previous
+hand-written extractor (kept here as the baseline), then the JSON size and
+encode time of `search_jira_issues` rows versus `format="table"`.
+
+    python benchmarks/bench_projection.py [--pages 50] [--issues 1000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from output_sanitizer import sanitize_string, truncate_string  # noqa: E402
+from projection import extract_search_row, to_table  # noqa: E402
+from tools.search import TABLE_INTERNED_COLUMNS  # noqa: E402
+
+
+def legacy_extract_issue(issue: dict) -> dict:
+    fields = issue.get("fields", {})
+    raw_summary = fields.get("summary", "")
+    return {
+        "key": issue.get("key", ""),
+        "summary": truncate_string(sanitize_string(raw_summary), 200),
+        "status": fields.get("status", {}).get("name", "") if fields.get("status") else "",
+        "assignee": fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
+        "priority": fields.get("priority", {}).get("name", "") if fields.get("priority") else "",
+        "issue_type": fields.get("issuetype", {}).get("name", "") if fields.get("issuetype") else "",
+        "project": fields.get("project", {}).get("key", "") if fields.get("project") else "",
+    }
+
+
+def make_page(count: int) -> list[dict]:
+    page = []
+    for i in range(count):
+        page.append({
+            "key": f"PROJ-{i}",
+            "fields": {
+                "summary": f"Fix <timeout> in worker {i} " + "detail " * (i % 60),
+                "status": {"name": ("To Do", "In Progress", "Done")[i % 3], "id": str(i % 3)},
+                "assignee": {"displayName": f"User {i % 20}"} if i % 4 else None,
+                "priority": {"name": "Medium"},
+                "issuetype": {"name": "Bug" if i % 2 else "Task"},
+                "project": {"key": "PROJ", "name": "Project"},
+            },
+        })
+    return page
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=50, help="pages per timing run")
+    parser.add_argument("--issues", type=int, default=1000, help="issues per page")
+    args = parser.parse_args()
+
+    page = make_page(args.issues)
+    assert [legacy_extract_issue(i) for i in page] == [extract_search_row(i) for i in page]
+
+    results = {}
+    for label, func in (("legacy", legacy_extract_issue), ("compiled", extract_search_row)):
+        best = min(timeit.repeat(lambda: [func(i) for i in page], number=args.pages, repeat=5))
+        results[label] = best / args.pages * 1000
+        print(f"{label:>9}: {results[label]:.3f} ms per {args.issues}-issue page")
+    print(f"  speedup: {results['legacy'] / results['compiled']:.2f}x")
+
+    rows = [extract_search_row(i) for i in page]
+    for label, payload in (("rows", rows), ("table", to_table(rows, TABLE_INTERNED_COLUMNS))):
+        size = len(json.dumps(payload).encode("utf-8"))
+        encode = min(timeit.repeat(lambda: json.dumps(payload), number=args.pages, repeat=5)) / args.pages * 1000
+        print(f"{label:>9}: {size / 1024:.1f} KB, {encode:.3f} ms to encode")
+
+
+if __name__ == "__main__":
+    main()
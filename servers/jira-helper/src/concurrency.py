@@ -0,0 +1,77 @@
+"""
+Concurrency helpers for the tool layer.
+
+atlassian-python-api is a blocking, requests-based client, and FastMCP runs
+plain (sync) tool functions directly on the event loop thread. A single slow
+JQL search therefore stalls every other request the server is handling.
+`as_async_tool` wraps a sync tool in a coroutine that runs the call on a
+bounded worker pool, so concurrent tool calls overlap their network waits
+while sharing the pooled keep-alive sessions from jira_client.
+
+Inside a tool, `map_concurrently` fans a blocking call out over a small
+thread pool (chunked searches, bulk transitions, etc.).
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+
+def as_async_tool(func: Callable, executor: Executor | None = None) -> Callable:
+    """
+    Wrap a blocking tool function in a coroutine that runs it off the event loop.
+
+    The wrapper keeps the wrapped function's name, docstring and signature
+    (via ``functools.wraps``) so MCP schema generation is unchanged.
+
+    Args:
+        func: The sync tool function.
+        executor: Worker pool to run calls on. None uses the loop's default.
+
+    Returns:
+        An async function with the same signature as ``func``.
+    """
+
+    @functools.wraps(func)
+    async def async_tool(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+        return await loop.run_in_executor(executor, call)
+
+    return async_tool
+
+
+def map_concurrently(
+    func: Callable, items: Iterable, max_workers: int = 4
+) -> list[tuple[Any, Exception | None]]:
+    """
+    Call ``func(item)`` for each item on a short-lived thread pool.
+
+    Exceptions are captured per item rather than raised, so one failing
+    request does not discard the results of the others.
+
+    Args:
+        func: Blocking function taking a single item.
+        items: Items to process.
+        max_workers: Upper bound on concurrent calls.
+
+    Returns:
+        ``(result, None)`` or ``(None, exception)`` per item, in input order.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item):
+        try:
+            return func(item), None
+        except Exception as e:
+            return None, e
+
+    if len(items) == 1 or max_workers <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(call, items))
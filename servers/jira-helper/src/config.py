@@ -4,11 +4,17 @@ Configuration module for the Jira MCP server.
 Loads a YAML config that lists Jira/Confluence instances under
 `instances.<name>.jira` / `instances.<name>.confluence`. Path discovery
 delegates to `mcp_commons.find_server_config` (mcp-manager-first, then
-XDG, then CWD).
+XDG, then CWD). Instance definitions are indexed once and hot-reloaded
+when the file's mtime changes.
 """
 
 import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 from mcp_commons import find_server_config
@@ -57,12 +63,45 @@ class ConfluenceInstance:
         return f"ConfluenceInstance(name='{self.name}', url='{self.url}', user='{self.user}')"
 
 
+class HttpSettings:
+    """HTTP connection pool and timeout tuning for one Atlassian instance."""
+
+    def __init__(
+        self, pool_connections: int = 4, pool_maxsize: int = 16,
+        connect_timeout: float = 10.0, read_timeout: float = 60.0, max_retries: int = 2,
+    ):
+        self.pool_connections = int(pool_connections)
+        self.pool_maxsize = int(pool_maxsize)
+        self.connect_timeout = float(connect_timeout)
+        self.read_timeout = float(read_timeout)
+        self.max_retries = int(max_retries)
+
+    def __repr__(self):
+        return (
+            f"HttpSettings(pool_maxsize={self.pool_maxsize}, "
+            f"timeouts=({self.connect_timeout}, {self.read_timeout}))"
+        )
+
+
 class Settings:
-    """Server settings loaded from the resolved YAML config file."""
+    """Server settings loaded from the resolved YAML config file.
+
+    Jira/Confluence instances are parsed once into read-only indexes. The
+    config file's mtime is re-checked at most every `RELOAD_CHECK_INTERVAL`
+    seconds; when it changes, the indexes are rebuilt and reload listeners
+    are told which instance names changed so cached clients can be dropped.
+    Server-level settings (host, port, logging) are only read at startup.
+    """
+
+    RELOAD_CHECK_INTERVAL = 2.0
 
-    def __init__(self):
-        self.config_file = _resolve_config_path()
-        self.config_data = self._load_config()
+    def __init__(self, config_file: Path | None = None):
+        self.config_file = config_file or _resolve_config_path()
+        self._reload_lock = threading.Lock()
+        self._reload_listeners: list[Callable[[set[str]], None]] = []
+        self._config_mtime = self._stat_mtime()
+        self._last_reload_check = time.monotonic()
+        self._apply_config(self._load_config())
 
         server_config = self.config_data.get("server", {})
         self.server_name: str = server_config.get("name", "jira-helper-server")
@@ -72,8 +111,45 @@ class Settings:
         self.debug_mode: bool = server_config.get("debug_mode", False)
         self.log_level: str = server_config.get("log_level", "INFO")
         self.log_file: str = server_config.get("log_file", "/tmp/jira_helper_debug.log")
+        self.max_concurrent_tools: int = int(server_config.get("max_concurrent_tools", 16))
+        self.warm_up_on_start: bool = server_config.get("warm_up_on_start", True)
+        self.health_check_ttl: float = float(server_config.get("health_check_ttl", 60))
+        self.federated_search_timeout: float = float(server_config.get("federated_search_timeout", 20))
+
+        cache_config = self.config_data.get("cache") or {}
+        self.issue_cache_enabled: bool = cache_config.get("issues", True)
+        self.issue_cache_fresh_seconds: float = float(cache_config.get("issue_fresh_seconds", 30))
+        self.issue_cache_max_age: float = float(cache_config.get("issue_max_age_seconds", 600))
+        self.issue_cache_max_entries: int = int(cache_config.get("issue_max_entries", 512))
+        self.field_catalog_ttl: float = float(cache_config.get("field_catalog_ttl_seconds", 3600))
+        self.transition_cache_ttl: float = float(cache_config.get("transitions_ttl_seconds", 3600))
+        self.link_types_ttl: float = float(cache_config.get("link_types_ttl_seconds", 3600))
+        self.workflow_cache_ttl: float = float(cache_config.get("workflow_ttl_seconds", 3600))
+        self.cache_dir: Path = Path(cache_config.get("directory", "~/.cache/jira-helper")).expanduser()
+        self.render_cache_max_bytes: int = int(float(cache_config.get("render_cache_mb", 50)) * 1024 * 1024)
+
+        attachment_config = self.config_data.get("attachments") or {}
+        max_upload_mb = attachment_config.get("max_upload_mb")
+        self.attachment_max_upload_bytes: int | None = (
+            int(float(max_upload_mb) * 1024 * 1024) if max_upload_mb else None
+        )
+        self.attachment_upload_workers: int = int(attachment_config.get("upload_workers", 4))
+        self.attachment_cache_max_bytes: int = int(float(attachment_config.get("cache_mb", 500)) * 1024 * 1024)
+
+        mirror_config = self.config_data.get("mirror") or {}
+        self.mirror_enabled: bool = bool(mirror_config.get("enabled", False))
+        self.mirror_path: Path = Path(
+            mirror_config.get("path") or self.cache_dir / "mirror.sqlite3"
+        ).expanduser()
+        self.mirror_interval: float = float(mirror_config.get("interval_seconds", 300))
+        self.mirror_max_staleness: float = float(mirror_config.get("max_staleness_seconds", 900))
+        self.mirror_full_sync_hours: float = float(mirror_config.get("full_sync_hours", 24))
+        self.mirror_projects: dict[str, list[str]] = {
+            name: list(keys or []) for name, keys in (mirror_config.get("projects") or {}).items()
+        }
 
-        self.default_jira_instance: str | None = self.config_data.get("default_jira_instance")
+        output_config = self.config_data.get("output") or {}
+        self.elided_content_ttl: float = float(output_config.get("elided_ttl_seconds", 900))
 
     def _load_config(self) -> dict:
         try:
@@ -85,61 +161,147 @@ class Settings:
             logger.error(f"Failed to parse YAML config file {self.config_file}: {e}")
             raise
 
-    def get_jira_instances(self) -> dict[str, JiraInstance]:
-        """All Jira instances under `instances.<name>.jira` in the config."""
-        instances: dict[str, JiraInstance] = {}
-        for instance_name, instance_data in self.config_data.get("instances", {}).items():
+    def _stat_mtime(self) -> int:
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return 0
+
+    def _apply_config(self, data: dict) -> None:
+        """Build the instance indexes for a freshly loaded config dict."""
+        jira_instances: dict[str, JiraInstance] = {}
+        confluence_instances: dict[str, ConfluenceInstance] = {}
+        for instance_name, instance_data in (data.get("instances") or {}).items():
+            instance_data = instance_data or {}
             jira_config = instance_data.get("jira") or {}
             if jira_config.get("url"):
-                instances[instance_name] = JiraInstance(
+                jira_instances[instance_name] = JiraInstance(
                     name=instance_name,
                     url=jira_config.get("url", ""),
                     user=jira_config.get("username", jira_config.get("user", "")),
                     token=jira_config.get("api_token", jira_config.get("token", "")),
                     description=instance_data.get("description", ""),
                 )
-        return instances
-
-    def get_default_instance_name(self) -> str | None:
-        instances = self.get_jira_instances()
-        if not instances:
-            return None
-        if self.default_jira_instance and self.default_jira_instance in instances:
-            return self.default_jira_instance
-        if "primary" in instances:
-            return "primary"
-        return next(iter(instances.keys()))
-
-    def get_jira_instance(self, instance_name: str | None = None) -> JiraInstance | None:
-        instances = self.get_jira_instances()
-        if not instances:
-            return None
-        if instance_name is None:
-            instance_name = self.get_default_instance_name()
-        return instances.get(instance_name) if instance_name else None
-
-    def get_confluence_instances(self) -> dict[str, ConfluenceInstance]:
-        """All Confluence instances under `instances.<name>.confluence` in the config."""
-        instances: dict[str, ConfluenceInstance] = {}
-        for instance_name, instance_data in self.config_data.get("instances", {}).items():
             confluence_config = instance_data.get("confluence") or {}
             if confluence_config.get("url"):
-                instances[instance_name] = ConfluenceInstance(
+                confluence_instances[instance_name] = ConfluenceInstance(
                     name=instance_name,
                     url=confluence_config.get("url", ""),
                     user=confluence_config.get("username", confluence_config.get("user", "")),
                     token=confluence_config.get("api_token", confluence_config.get("token", "")),
                     description=instance_data.get("description", ""),
                 )
-        return instances
+
+        default_jira_instance = data.get("default_jira_instance")
+        if not jira_instances:
+            default_name = None
+        elif default_jira_instance and default_jira_instance in jira_instances:
+            default_name = default_jira_instance
+        elif "primary" in jira_instances:
+            default_name = "primary"
+        else:
+            default_name = next(iter(jira_instances.keys()))
+
+        # Swap in whole objects so concurrent readers never see a partial index.
+        self.config_data = data
+        self.default_jira_instance: str | None = default_jira_instance
+        self._jira_index = MappingProxyType(jira_instances)
+        self._confluence_index = MappingProxyType(confluence_instances)
+        self._default_instance_name = default_name
+
+    def add_reload_listener(self, listener: Callable[[set[str]], None]) -> None:
+        """Register a callback invoked with the instance names changed by a reload."""
+        self._reload_listeners.append(listener)
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """
+        Reload the instance indexes if config.yaml's mtime has changed.
+
+        Args:
+            force: Skip the `RELOAD_CHECK_INTERVAL` throttle and stat now.
+
+        Returns:
+            True if the config was reloaded.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_reload_check < self.RELOAD_CHECK_INTERVAL:
+            return False
+        with self._reload_lock:
+            self._last_reload_check = now
+            mtime = self._stat_mtime()
+            if mtime == self._config_mtime:
+                return False
+            self._config_mtime = mtime
+            try:
+                data = self._load_config()
+            except (OSError, yaml.YAMLError) as e:
+                logger.warning(f"Keeping previous config; reload of {self.config_file} failed: {e}")
+                return False
+            old_data = self.config_data
+            self._apply_config(data)
+
+        changed = _changed_instance_names(old_data, data)
+        logger.info(f"Reloaded config from {self.config_file}; changed instances: {sorted(changed)}")
+        for listener in self._reload_listeners:
+            try:
+                listener(changed)
+            except Exception as e:
+                logger.warning(f"Config reload listener failed: {e}")
+        return True
+
+    def get_jira_instances(self) -> Mapping[str, JiraInstance]:
+        """All Jira instances under `instances.<name>.jira` in the config (read-only)."""
+        self.reload_if_changed()
+        return self._jira_index
+
+    def get_default_instance_name(self) -> str | None:
+        self.reload_if_changed()
+        return self._default_instance_name
+
+    def get_jira_instance(self, instance_name: str | None = None) -> JiraInstance | None:
+        self.reload_if_changed()
+        if instance_name is None:
+            instance_name = self._default_instance_name
+        return self._jira_index.get(instance_name) if instance_name else None
+
+    def get_http_settings(self, instance_name: str | None = None) -> HttpSettings:
+        """HTTP tuning from the top-level `http` block, overridden per instance."""
+        merged = dict(self.config_data.get("http") or {})
+        if instance_name:
+            instance_data = (self.config_data.get("instances") or {}).get(instance_name) or {}
+            merged.update(instance_data.get("http") or {})
+        known = ("pool_connections", "pool_maxsize", "connect_timeout", "read_timeout", "max_retries")
+        return HttpSettings(**{k: v for k, v in merged.items() if k in known})
+
+    def get_response_budget(self, tool_name: str) -> int:
+        """Response size budget in bytes for a tool (`output.tools` overrides `output.max_response_kb`); 0 disables."""
+        output = self.config_data.get("output") or {}
+        kb = (output.get("tools") or {}).get(tool_name, output.get("max_response_kb", 256))
+        return int(float(kb or 0) * 1024)
+
+    def get_confluence_instances(self) -> Mapping[str, ConfluenceInstance]:
+        """All Confluence instances under `instances.<name>.confluence` in the config (read-only)."""
+        self.reload_if_changed()
+        return self._confluence_index
 
     def get_confluence_instance(self, instance_name: str | None = None) -> ConfluenceInstance | None:
-        instances = self.get_confluence_instances()
-        if not instances:
-            return None
+        self.reload_if_changed()
         if instance_name is None:
-            instance_name = self.get_default_instance_name()
-        return instances.get(instance_name) if instance_name else None
+            instance_name = self._default_instance_name
+        return self._confluence_index.get(instance_name) if instance_name else None
+
+
+def _changed_instance_names(old_data: dict, new_data: dict) -> set[str]:
+    """Instance names whose config block differs between two config dicts.
+
+    A change to the shared top-level `http` block affects every instance.
+    """
+    old_instances = old_data.get("instances") or {}
+    new_instances = new_data.get("instances") or {}
+    names = set(old_instances) | set(new_instances)
+    if old_data.get("http") != new_data.get("http"):
+        return names
+    return {n for n in names if old_instances.get(n) != new_instances.get(n)}
 
 
 # Module-level singleton imported by other modules.
@@ -0,0 +1,151 @@
+"""
+Size-bounded, content-addressed file store.
+
+Values are bytes stored under a hash-derived path inside a cache directory.
+Writes go through a temporary file and `os.replace`, so readers never see a
+partial file. When the total size exceeds `max_bytes`, the least recently
+used files (by mtime, which `get` refreshes) are deleted.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def content_key(*parts: bytes | str) -> str:
+    """SHA-256 hex digest over the given parts, usable as a cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8") if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Content-addressed bytes store with LRU eviction by total size."""
+
+    def __init__(self, directory: Path | str, max_bytes: int):
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._total: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get_path(self, key: str) -> Path | None:
+        """Return the stored file's path (refreshing its LRU position), or None."""
+        if not self.enabled:
+            return None
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def get(self, key: str) -> bytes | None:
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes) -> Path | None:
+        """Store `data` under `key`. Values larger than the whole store are skipped."""
+        if not self.enabled or len(data) > self.max_bytes:
+            return None
+        path = self.path_for(key)
+        tmp = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            self.put_file(key, Path(tmp))
+        except OSError as e:
+            logger.warning(f"Disk cache write failed for {key}: {e}")
+            if tmp and os.path.exists(tmp):
+                os.unlink(tmp)
+            return None
+        return path
+
+    def put_file(self, key: str, source: Path) -> Path:
+        """Move an already-written file (on the same filesystem) into the store."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = source.stat().st_size
+        with self._lock:
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(source, path)
+            if self._total is not None:
+                self._total += size - previous
+        self._evict()
+        return path
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        if not self.directory.exists():
+            return entries
+        for path in self.directory.glob("??/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        with self._lock:
+            if self._total is not None and self._total <= self.max_bytes:
+                return
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                self.evictions += 1
+            self._total = total
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            self._total = total
+            hits = self.hits
+            lookups = hits + self.misses
+            return {
+                "directory": str(self.directory),
+                "files": len(entries),
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,117 @@
+"""
+Cached Jira field catalog with name/id resolution.
+
+`client.get_all_fields()` can return thousands of fields on large Cloud
+sites. The catalog is fetched once per instance, indexed by id and by
+lower-cased display name, and kept for `cache.field_catalog_ttl_seconds`.
+Tools use it to accept custom fields by display name and to render custom
+field values without further requests.
+"""
+
+import logging
+
+from cache import TTLCache
+from config import settings
+from exceptions import JiraValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class FieldCatalog:
+    """Index over the field definitions returned by `GET /field`."""
+
+    def __init__(self, fields: list[dict]):
+        self.fields = fields
+        self.by_id: dict[str, dict] = {}
+        self._ids_by_name: dict[str, list[str]] = {}
+        for field in fields:
+            field_id = field.get("id", "")
+            if not field_id:
+                continue
+            self.by_id[field_id] = field
+            name = (field.get("name") or "").strip().lower()
+            if name:
+                self._ids_by_name.setdefault(name, []).append(field_id)
+
+    def custom_fields(self) -> list[dict]:
+        return [f for f in self.fields if f.get("custom", False)]
+
+    def schema(self, field_id: str) -> dict:
+        return self.by_id.get(field_id, {}).get("schema") or {}
+
+    def name(self, field_id: str) -> str:
+        return self.by_id.get(field_id, {}).get("name", field_id)
+
+    def resolve(self, name_or_id: str) -> str:
+        """
+        Resolve a field id or display name (case-insensitive) to a field id.
+
+        Raises:
+            JiraValidationError: Unknown name, or a name shared by several fields.
+        """
+        key = str(name_or_id).strip()
+        if key in self.by_id:
+            return key
+        ids = self._ids_by_name.get(key.lower(), [])
+        if len(ids) == 1:
+            return ids[0]
+        if not ids:
+            raise JiraValidationError(f"Unknown field '{name_or_id}'.")
+        raise JiraValidationError(
+            f"Field name '{name_or_id}' is ambiguous; use one of the ids: {ids}"
+        )
+
+    def resolve_values(self, values: dict) -> dict:
+        """Map a {name or id: value} dict to {field id: value}."""
+        return {self.resolve(k): v for k, v in (values or {}).items()}
+
+
+def render_field_value(value, schema: dict | None = None):
+    """
+    Render a raw Jira field value into a compact, readable form.
+
+    Users become display names, options become their value, and arrays are
+    rendered element-wise. Unknown object shapes are returned unchanged.
+    """
+    schema = schema or {}
+    if value is None:
+        return None
+    if isinstance(value, list):
+        item_schema = {"type": schema.get("items", "")}
+        return [render_field_value(v, item_schema) for v in value]
+    if isinstance(value, dict):
+        if schema.get("type") == "user" or "displayName" in value:
+            return value.get("displayName", value.get("name", ""))
+        if "value" in value:
+            rendered = value["value"]
+            child = value.get("child")
+            return f"{rendered} / {child['value']}" if isinstance(child, dict) and "value" in child else rendered
+        if "name" in value:
+            return value["name"]
+        if "key" in value:
+            return value["key"]
+    return value
+
+
+_catalogs = TTLCache(max_entries=32, ttl=settings.field_catalog_ttl)
+
+
+def get_field_catalog(client, instance_name: str) -> FieldCatalog:
+    """Get the cached field catalog for an instance, fetching it if needed."""
+    catalog = _catalogs.get(instance_name)
+    if catalog is None:
+        catalog = FieldCatalog(client.get_all_fields() or [])
+        _catalogs.put(instance_name, catalog)
+        logger.info(f"Cached {len(catalog.fields)} field definitions for instance '{instance_name}'")
+    return catalog
+
+
+def _on_config_reload(names: set[str]) -> None:
+    _catalogs.invalidate(lambda k: k in names)
+
+
+settings.add_reload_listener(_on_config_reload)
+
+
+def get_stats() -> dict:
+    return _catalogs.stats()
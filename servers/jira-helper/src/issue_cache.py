@@ -0,0 +1,111 @@
+"""
+Read-through cache for `client.issue` calls.
+
+Entries are keyed by (instance, issue key, requested fields). An entry
+younger than `cache.issue_fresh_seconds` is served as-is. An older one (up
+to `cache.issue_max_age_seconds`) is revalidated with a `fields=updated`
+request: if the issue's `updated` timestamp is unchanged the cached copy is
+served, otherwise the issue is refetched. Tools that modify an issue call
+`invalidate_issue` so their own writes are never masked by the cache.
+"""
+
+import logging
+import threading
+from typing import Callable
+
+from cache import TTLCache
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_cache = TTLCache(
+    max_entries=settings.issue_cache_max_entries,
+    ttl=settings.issue_cache_max_age,
+)
+_stats_lock = threading.Lock()
+_revalidated = 0
+_refetched = 0
+# Called with (instance, issue key) after a write through this server.
+_invalidation_listeners: list[Callable[[str, str], None]] = []
+
+
+def _with_updated(fields: str) -> str:
+    if fields == "*all" or "updated" in fields.split(","):
+        return fields
+    return f"{fields},updated" if fields else "updated"
+
+
+def get_issue(client, instance_name: str, issue_key: str, fields: str) -> dict:
+    """Fetch an issue through the cache. `fields` is the Jira `fields` parameter."""
+    global _revalidated, _refetched
+    if not settings.issue_cache_enabled:
+        return client.issue(issue_key, fields=fields)
+
+    fields = _with_updated(fields)
+    cache_key = (instance_name, issue_key, fields)
+    entry = _cache.get_entry(cache_key)
+    if entry is not None:
+        issue, age = entry
+        if age < settings.issue_cache_fresh_seconds:
+            return issue
+        latest = client.issue(issue_key, fields="updated")
+        cached_updated = issue.get("fields", {}).get("updated")
+        if cached_updated and latest.get("fields", {}).get("updated") == cached_updated:
+            _cache.touch(cache_key)
+            with _stats_lock:
+                _revalidated += 1
+            return issue
+        with _stats_lock:
+            _refetched += 1
+
+    issue = client.issue(issue_key, fields=fields)
+    _cache.put(cache_key, issue)
+    return issue
+
+
+def add_invalidation_listener(listener: Callable[[str, str], None]) -> None:
+    """Register `listener(instance, issue_key)` to run whenever an issue is invalidated."""
+    _invalidation_listeners.append(listener)
+
+
+def invalidate_issue(instance_name: str, issue_key: str) -> int:
+    """Drop every cached field projection of an issue after a write."""
+    for listener in _invalidation_listeners:
+        try:
+            listener(instance_name, issue_key)
+        except Exception as e:
+            logger.warning(f"Invalidation listener failed for {issue_key}: {e}")
+    return _cache.invalidate(lambda k: k[0] == instance_name and k[1] == issue_key)
+
+
+def invalidate_field(instance_name: str, field: str) -> int:
+    """Drop cached issues of an instance whose projection includes `field`.
+
+    Used when a write's target issue is unknown (e.g. deleting an attachment
+    by id).
+    """
+    return _cache.invalidate(
+        lambda k: k[0] == instance_name and (k[2] == "*all" or field in k[2].split(","))
+    )
+
+
+def invalidate_instance(instance_name: str) -> int:
+    """Drop every cached issue for an instance."""
+    return _cache.invalidate(lambda k: k[0] == instance_name)
+
+
+def _on_config_reload(names: set[str]) -> None:
+    for name in names:
+        invalidate_instance(name)
+
+
+settings.add_reload_listener(_on_config_reload)
+
+
+def get_stats() -> dict:
+    stats = _cache.stats()
+    stats["enabled"] = settings.issue_cache_enabled
+    stats["fresh_seconds"] = settings.issue_cache_fresh_seconds
+    stats["revalidated_unchanged"] = _revalidated
+    stats["revalidated_refetched"] = _refetched
+    return stats
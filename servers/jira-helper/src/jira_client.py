@@ -3,12 +3,29 @@ Jira and Confluence client factory.
 
 Consolidates client creation, caching, and instance resolution from the
 old infrastructure/atlassian_repository.py, config_adapter, and confluence adapter.
+
+Clients are created without a validation round trip. Instance health is
+tracked passively from every request made through the pooled sessions and
+actively by `warm_up_instances()`, which the server runs in the background
+at startup. A failure to connect (or a 401), or `FAIL_FAST_AFTER`
+consecutive failures of other kinds, makes `get_jira_client` fail fast
+until `server.health_check_ttl` expires. Meanwhile one call every
+`PROBE_INTERVAL_SECONDS` is let through to test whether the instance has
+recovered.
 """
 
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError, ProtocolError
+from urllib3.util.retry import Retry
 
-from config import settings
+from config import HttpSettings, settings
 from exceptions import (
     JiraAuthenticationError,
     JiraConnectionError,
@@ -22,11 +39,34 @@ logger = logging.getLogger(__name__)
 _jira_clients: dict = {}
 _confluence_clients: dict = {}
 
+# Pooled HTTP sessions keyed by (instance name, "jira" | "confluence"). Jira and
+# Confluence get separate sessions because each client sets its own auth on
+# the session it is given.
+_sessions: dict[tuple[str, str], requests.Session] = {}
+
+# Guards client/session creation and invalidation; tools run on worker threads.
+_client_lock = threading.RLock()
+
+# Last known health per (instance name, product), keyed like _sessions.
+_health: dict[tuple[str, str], dict] = {}
+_health_lock = threading.Lock()
+
+FAIL_FAST_AFTER = 3  # consecutive non-connect failures before failing fast
+PROBE_INTERVAL_SECONDS = 5  # while failing fast, let one call through this often
+
+# Methods safe to resend when a pooled keep-alive connection turns out stale.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 ISSUE_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
 
 
 def resolve_instance_name(instance_name: str = None) -> str:
-    """Resolve instance name, falling back to default."""
+    """Resolve instance name, falling back to default.
+
+    Also picks up config.yaml edits (throttled), so cached clients for
+    changed instances are dropped even when callers name the instance.
+    """
+    settings.reload_if_changed()
     if instance_name:
         return instance_name
     default = settings.get_default_instance_name()
@@ -35,14 +75,205 @@ def resolve_instance_name(instance_name: str = None) -> str:
     return default
 
 
+class _PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies the configured (connect, read) timeout pair.
+
+    atlassian-python-api only passes a single integer timeout to requests;
+    splitting it lets a dead host fail on connect quickly while slow JQL
+    searches still get the full read timeout.
+    """
+
+    def __init__(self, http: HttpSettings, health_key: tuple[str, str]):
+        self._timeout = (http.connect_timeout, http.read_timeout)
+        self._health_key = health_key
+        self.pool_maxsize = http.pool_maxsize
+        retries = Retry(
+            total=http.max_retries, connect=http.max_retries, read=0, status=0,
+            backoff_factor=0.3, raise_on_status=False,
+        )
+        super().__init__(
+            pool_connections=http.pool_connections,
+            pool_maxsize=http.pool_maxsize,
+            max_retries=retries,
+            pool_block=False,
+        )
+
+    def send(self, request, **kwargs):
+        kwargs["timeout"] = self._timeout
+        try:
+            response = super().send(request, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            reason = _failure_reason(e)
+            if isinstance(reason, ProtocolError) and request.method in _IDEMPOTENT_METHODS:
+                # The server closed an idle pooled connection; resend once on
+                # a fresh one before counting it as a failure.
+                try:
+                    response = super().send(request, **kwargs)
+                except requests.exceptions.ConnectionError as retry_error:
+                    e, reason = retry_error, _failure_reason(retry_error)
+                else:
+                    reason = None
+            if reason is not None:
+                # Read timeouts on slow queries are not ConnectionErrors and
+                # are not a sign the instance is down.
+                _record_failure(
+                    self._health_key, "connection", f"{type(e).__name__}: {e}",
+                    trip=isinstance(e, requests.exceptions.ConnectTimeout)
+                    or isinstance(reason, (NewConnectionError, ConnectTimeoutError)),
+                )
+                raise e
+        if response.status_code == 401:
+            _record_health(self._health_key, False, "auth", "HTTP 401 Unauthorized")
+        elif response.status_code < 500:
+            _record_health(self._health_key, True)
+        return response
+
+
+def _failure_reason(error: requests.exceptions.ConnectionError):
+    """The urllib3 exception behind a requests ConnectionError."""
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return reason
+
+
+def _record_health(
+    key: tuple[str, str], healthy: bool, kind: str = "", error: str = "", failures: int = 0
+) -> None:
+    _health[key] = {
+        "healthy": healthy,
+        "kind": kind,
+        "error": error,
+        "failures": failures,
+        "checked_at": time.time(),
+    }
+
+
+def _record_failure(key: tuple[str, str], kind: str, error: str, trip: bool) -> None:
+    """Count a failed request; fail fast if `trip` or after `FAIL_FAST_AFTER` in a row."""
+    with _health_lock:
+        failures = (_health.get(key) or {}).get("failures", 0) + 1
+        _record_health(key, not trip and failures < FAIL_FAST_AFTER, kind, error, failures)
+
+
+def _raise_if_unhealthy(key: tuple[str, str]) -> None:
+    """Fail fast if the instance failed recently, instead of waiting on a timeout.
+
+    One caller per `PROBE_INTERVAL_SECONDS` is let through as a probe; its
+    request records the instance healthy again or restarts the interval.
+    """
+    with _health_lock:
+        state = _health.get(key)
+        if not state or state["healthy"]:
+            return
+        now = time.time()
+        age = now - state["checked_at"]
+        if age >= settings.health_check_ttl:
+            return
+        if now - max(state["checked_at"], state.get("probe_at", 0)) >= PROBE_INTERVAL_SECONDS:
+            state["probe_at"] = now
+            return
+    name, product = key
+    retry_in = settings.health_check_ttl - age
+    message = (
+        f"{product.capitalize()} instance '{name}' failed {age:.0f}s ago: {state['error']}. "
+        f"Retrying after {retry_in:.0f}s."
+    )
+    if state["kind"] == "auth":
+        raise JiraAuthenticationError(message, instance_name=name)
+    raise JiraConnectionError(message, instance_name=name)
+
+
+def _get_session(name: str, product: str) -> requests.Session:
+    """Get or create the pooled keep-alive session for an instance/product pair."""
+    key = (name, product)
+    with _client_lock:
+        session = _sessions.get(key)
+        if session is not None:
+            return session
+
+        http = settings.get_http_settings(name)
+        session = requests.Session()
+        adapter = _PooledHTTPAdapter(http, key)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        _sessions[key] = session
+        logger.debug(f"Created pooled {product} session for '{name}': {http}")
+        return session
+
+
+def _invalidate_instances(names: set[str]) -> None:
+    """Drop cached clients and sessions for instances changed by a config reload."""
+    with _client_lock:
+        for name in names:
+            _jira_clients.pop(name, None)
+            _confluence_clients.pop(name, None)
+            for product in ("jira", "confluence"):
+                session = _sessions.pop((name, product), None)
+                if session is not None:
+                    session.close()
+                _health.pop((name, product), None)
+    if names:
+        logger.info(f"Invalidated cached clients for instances: {sorted(names)}")
+
+
+settings.add_reload_listener(_invalidate_instances)
+
+
+def get_pool_stats() -> list[dict]:
+    """Connection pool statistics for every pooled session created so far."""
+    stats = []
+    for (name, product), session in list(_sessions.items()):
+        adapter = session.get_adapter("https://")
+        pools = []
+        for pool_key in list(adapter.poolmanager.pools.keys()):
+            pool = adapter.poolmanager.pools.get(pool_key)
+            if pool is None:
+                continue
+            pools.append({
+                "host": pool.host,
+                "port": pool.port,
+                "connections_opened": pool.num_connections,
+                "requests_sent": pool.num_requests,
+                # The pool queue is pre-filled with None placeholders
+                "idle_connections": sum(1 for c in list(pool.pool.queue) if c is not None) if pool.pool else 0,
+                "max_size": pool.pool.maxsize if pool.pool else 0,
+            })
+        stats.append({
+            "instance": name,
+            "product": product,
+            "pool_maxsize": adapter.pool_maxsize,
+            "timeout": list(adapter._timeout),
+            "pools": pools,
+        })
+    return stats
+
+
 def get_jira_client(instance_name: str = None):
-    """Get or create a cached Jira client for the given instance."""
-    from atlassian import Jira
+    """Get or create a cached Jira client for the given instance.
 
+    No validation request is made here; raises immediately if the instance
+    failed a request within the last `server.health_check_ttl` seconds.
+    """
     name = resolve_instance_name(instance_name)
+    _raise_if_unhealthy((name, "jira"))
+    client = _jira_clients.get(name)
+    if client is not None:
+        return client
+    return _create_jira_client(name)
+
 
-    if name in _jira_clients:
-        return _jira_clients[name]
+def is_cloud_url(url: str) -> bool:
+    """Whether an instance URL is Atlassian Cloud (paging and APIs differ)."""
+    return url.endswith(".atlassian.net")
+
+
+def _create_jira_client(name: str):
+    from atlassian import Jira
 
     instance = settings.get_jira_instance(name)
     if not instance:
@@ -53,22 +284,70 @@ def get_jira_client(instance_name: str = None):
             url=instance.url,
             username=instance.user,
             password=instance.token,
-            cloud=instance.url.endswith(".atlassian.net"),
+            cloud=is_cloud_url(instance.url),
+            session=_get_session(name, "jira"),
+            timeout=settings.get_http_settings(name).read_timeout,
         )
-        # Validate connection
-        client.myself()
-        _jira_clients[name] = client
-        logger.info(f"Connected to Jira instance '{name}' at {instance.url}")
-        return client
     except Exception as e:
-        error_msg = str(e).lower()
-        if "401" in error_msg or "403" in error_msg or "unauthorized" in error_msg:
-            raise JiraAuthenticationError(
-                f"Authentication failed for instance '{name}': {e}", instance_name=name
-            )
         raise JiraConnectionError(
-            f"Failed to connect to Jira instance '{name}': {e}", instance_name=name
+            f"Failed to create Jira client for instance '{name}': {e}", instance_name=name
         )
+    with _client_lock:
+        client = _jira_clients.setdefault(name, client)
+    logger.info(f"Created Jira client for instance '{name}' at {instance.url}")
+    return client
+
+
+def check_instance_health(name: str) -> dict:
+    """Validate a Jira instance with a `myself` request and record the result."""
+    key = (name, "jira")
+    start = time.perf_counter()
+    try:
+        client = _jira_clients.get(name) or _create_jira_client(name)
+        client.myself()
+        _record_health(key, True)
+    except Exception as e:
+        error_msg = str(e).lower()
+        with _health_lock:
+            if "401" in error_msg or "403" in error_msg or "unauthorized" in error_msg:
+                _record_health(key, False, "auth", f"Authentication failed: {e}")
+            else:
+                _record_health(key, False, "connection", f"Failed to connect: {e}")
+    state = dict(_health[key])
+    state["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    if state["healthy"]:
+        logger.info(f"Jira instance '{name}' is reachable ({state['latency_ms']} ms)")
+    else:
+        logger.warning(f"Jira instance '{name}' is unhealthy: {state['error']}")
+    return state
+
+
+def warm_up_instances(names: list[str] | None = None) -> dict[str, dict]:
+    """Validate all (or the given) Jira instances in parallel, warming their pools."""
+    names = list(names) if names is not None else list(settings.get_jira_instances())
+    if not names:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="jira-warm-up") as pool:
+        return dict(zip(names, pool.map(check_instance_health, names)))
+
+
+def start_background_warm_up() -> threading.Thread:
+    """Run `warm_up_instances` on a daemon thread so startup is not delayed."""
+    thread = threading.Thread(target=warm_up_instances, name="jira-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_instance_health(name: str, product: str = "jira") -> dict | None:
+    """Last recorded health for an instance, or None if it has not been used yet."""
+    state = _health.get((name, product))
+    if state is None:
+        return None
+    return {
+        "healthy": state["healthy"],
+        "error": state["error"],
+        "age_seconds": round(time.time() - state["checked_at"], 1),
+    }
 
 
 def get_confluence_client(instance_name: str = None):
@@ -76,9 +355,11 @@ def get_confluence_client(instance_name: str = None):
     from atlassian import Confluence
 
     name = resolve_instance_name(instance_name)
+    _raise_if_unhealthy((name, "confluence"))
 
-    if name in _confluence_clients:
-        return _confluence_clients[name]
+    client = _confluence_clients.get(name)
+    if client is not None:
+        return client
 
     instance = settings.get_confluence_instance(name)
     if not instance:
@@ -89,9 +370,12 @@ def get_confluence_client(instance_name: str = None):
             url=instance.url,
             username=instance.user,
             password=instance.token,
-            cloud=instance.url.endswith(".atlassian.net"),
+            cloud=is_cloud_url(instance.url),
+            session=_get_session(name, "confluence"),
+            timeout=settings.get_http_settings(name).read_timeout,
         )
-        _confluence_clients[name] = client
+        with _client_lock:
+            client = _confluence_clients.setdefault(name, client)
         logger.info(f"Connected to Confluence instance '{name}' at {instance.url}")
         return client
     except Exception as e:
@@ -119,6 +403,7 @@ def get_instances_info() -> list[dict]:
             "user": inst.user,
             "description": inst.description,
             "is_default": name == default_name,
+            "health": get_instance_health(name),
         })
     return result
 
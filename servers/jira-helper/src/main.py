@@ -16,10 +16,15 @@ import encodings.idna  # noqa: F401
 from mcp_commons import create_mcp_app, run_cli
 
 from config import settings
+from jira_client import start_background_warm_up
+from mirror import start_background_sync
 from tool_config import get_tools_config
 
 
 def main() -> None:
+    if settings.warm_up_on_start:
+        start_background_warm_up()
+    start_background_sync()
     run_cli(
         server_name=settings.server_name,
         tools_config=get_tools_config(),
@@ -34,6 +39,9 @@ def main() -> None:
 
 def create_app():
     """ASGI factory for running under an external server (uvicorn, etc.)."""
+    if settings.warm_up_on_start:
+        start_background_warm_up()
+    start_background_sync()
     return create_mcp_app(
         server_name=settings.server_name,
         tools_config=get_tools_config(),
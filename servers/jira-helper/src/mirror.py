@@ -0,0 +1,509 @@
+"""
+Opt-in local SQLite mirror of selected Jira projects.
+
+When `mirror.enabled` is set, the projects listed under `mirror.projects`
+are copied into a SQLite database and kept current by a background thread
+that runs `updated >= "-Nm"` JQL deltas every `mirror.interval_seconds`
+(relative dates, so the instance's timezone does not matter). A full resync,
+which also drops deleted or moved issues, runs on the first sync and every
+`mirror.full_sync_hours`.
+
+`get_issue_details` and `search_jira_issues` (and so `list_project_tickets`)
+consult the mirror first. A read is served locally only when every project
+it touches was synced within `mirror.max_staleness_seconds` and has not been
+written through this server since; otherwise it goes to Jira as before.
+Searches are served only for a JQL subset: AND-ed `=`, `!=`, `in`, `not in`,
+`is EMPTY` and `is not EMPTY` clauses on project, key, status, assignee,
+reporter, issuetype and priority, with an optional ORDER BY on updated,
+created or key. EMPTY/null outside `is`, and numeric ids for project,
+status, type or priority, are left to Jira. Locally served responses carry
+a `freshness` entry.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+import issue_cache
+from config import settings
+from projection import ISSUE_DETAIL_FIELDS, build_fields_param
+
+logger = logging.getLogger(__name__)
+
+SYNC_PAGE_SIZE = 100
+DIRTY_DEBOUNCE_SECONDS = 2
+DELTA_OVERLAP_MINUTES = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    instance TEXT NOT NULL,
+    key TEXT NOT NULL COLLATE NOCASE,
+    project TEXT NOT NULL COLLATE NOCASE,
+    number INTEGER NOT NULL,
+    status TEXT COLLATE NOCASE,
+    assignee_id TEXT COLLATE NOCASE,
+    assignee_name TEXT COLLATE NOCASE,
+    reporter_id TEXT COLLATE NOCASE,
+    reporter_name TEXT COLLATE NOCASE,
+    issue_type TEXT COLLATE NOCASE,
+    priority TEXT COLLATE NOCASE,
+    created_ts REAL,
+    updated_ts REAL,
+    synced_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (instance, key)
+);
+CREATE INDEX IF NOT EXISTS issues_project ON issues (instance, project, number);
+CREATE INDEX IF NOT EXISTS issues_updated ON issues (instance, project, updated_ts);
+CREATE TABLE IF NOT EXISTS sync_state (
+    instance TEXT NOT NULL,
+    project TEXT NOT NULL COLLATE NOCASE,
+    last_started REAL,
+    last_finished REAL,
+    last_full_sync REAL,
+    dirty_at REAL,
+    issue_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    PRIMARY KEY (instance, project)
+);
+"""
+
+# JQL field -> mirror columns (a clause matches if any column matches).
+JQL_COLUMNS = {
+    "project": ("project",),
+    "key": ("key",),
+    "issuekey": ("key",),
+    "status": ("status",),
+    "assignee": ("assignee_id", "assignee_name"),
+    "reporter": ("reporter_id", "reporter_name"),
+    "issuetype": ("issue_type",),
+    "type": ("issue_type",),
+    "priority": ("priority",),
+}
+# Fields whose numeric values are ids in JQL; the mirror only stores names.
+ID_FIELDS = {"project", "status", "issuetype", "type", "priority"}
+ORDER_COLUMNS = {
+    "updated": ("updated_ts",),
+    "created": ("created_ts",),
+    "key": ("project", "number"),
+    "issuekey": ("project", "number"),
+}
+
+_AND = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_OR_NOT = re.compile(r"\b(OR|NOT)\b", re.IGNORECASE)
+_QUOTED = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'')
+_LIST_ITEM = re.compile(r'\s*("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|[^,]+)')
+_ORDER_BY = re.compile(r"\s+ORDER\s+BY\s+(.+)$", re.IGNORECASE | re.DOTALL)
+_CLAUSE = re.compile(r"^(\w+)\s*(!=|=|not\s+in|in|is\s+not|is)\s*(.+)$", re.IGNORECASE | re.DOTALL)
+_VALUE = re.compile(r'^"((?:[^"\\]|\\.)*)"$|^\'((?:[^\'\\]|\\.)*)\'$|^([\w.@+-]+)$')
+
+
+def _jira_timestamp(value: str | None) -> float | None:
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="seconds")
+
+
+def _user(value: dict | None) -> tuple[str | None, str | None]:
+    if not value:
+        return None, None
+    return value.get("accountId") or value.get("name") or value.get("key"), value.get("displayName")
+
+
+def _parse_value(text: str) -> str | None:
+    m = _VALUE.match(text.strip())
+    if not m:
+        return None
+    value = next(g for g in m.groups() if g is not None)
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def _split_top_level(text: str) -> list[str] | None:
+    """Split JQL on AND outside quotes and lists; None if it uses OR, NOT or nesting."""
+    masked = _QUOTED.sub(lambda m: "_" * len(m.group()), text)
+    if '"' in masked or "'" in masked:
+        return None
+    masked = re.sub(r"\([^()]*\)", lambda m: "_" * len(m.group()), masked)
+    if "(" in masked or ")" in masked:
+        return None
+    if _OR_NOT.search(re.sub(r"\bnot\s+in\b|\bis\s+not\b", "", masked, flags=re.IGNORECASE)):
+        return None
+    parts, start = [], 0
+    for m in _AND.finditer(masked):
+        parts.append(text[start:m.start()].strip())
+        start = m.end()
+    parts.append(text[start:].strip())
+    return parts
+
+
+def parse_jql(jql: str) -> dict | None:
+    """
+    Translate a supported JQL subset to SQL.
+
+    Returns `{"where": [...], "params": [...], "order": "...", "projects":
+    set, "keys": set}` or None when the query is outside the subset.
+    """
+    text = jql.strip()
+    order_sql = "project, number DESC"
+    m = _ORDER_BY.search(text)
+    if m:
+        text = text[:m.start()]
+        terms = []
+        for term in m.group(1).split(","):
+            words = term.split()
+            if not words or len(words) > 2 or words[0].lower() not in ORDER_COLUMNS:
+                return None
+            direction = words[1].upper() if len(words) == 2 else "ASC"
+            if direction not in ("ASC", "DESC"):
+                return None
+            terms += [f"{col} {direction}" for col in ORDER_COLUMNS[words[0].lower()]]
+        order_sql = ", ".join(terms)
+    elif text.upper().startswith("ORDER BY"):
+        return None
+
+    clauses = _split_top_level(text)
+    if not clauses or any(not c for c in clauses):
+        return None
+    where, params, projects, keys = [], [], set(), set()
+    for clause in clauses:
+        m = _CLAUSE.match(clause)
+        if not m:
+            return None
+        field, op, raw = m.group(1).lower(), " ".join(m.group(2).lower().split()), m.group(3).strip()
+        columns = JQL_COLUMNS.get(field)
+        if columns is None:
+            return None
+        if op in ("is", "is not"):
+            if raw.upper() not in ("EMPTY", "NULL"):
+                return None
+            joiner = " AND " if op == "is" else " OR "
+            test = "IS NULL" if op == "is" else "IS NOT NULL"
+            where.append("(" + joiner.join(f"{c} {test}" for c in columns) + ")")
+            continue
+        if op in ("in", "not in"):
+            if not (raw.startswith("(") and raw.endswith(")")):
+                return None
+            items = [v.strip() for v in _LIST_ITEM.findall(raw[1:-1]) if v.strip()]
+        else:
+            items = [raw]
+        # Unquoted EMPTY/null and numeric ids are left to Jira.
+        if any(item.upper() in ("EMPTY", "NULL") for item in items):
+            return None
+        values = [_parse_value(item) for item in items]
+        if not values or any(v is None for v in values):
+            return None
+        if field in ID_FIELDS and any(v.isdigit() for v in values):
+            return None
+        marks = ",".join("?" * len(values))
+        if op in ("=", "in"):
+            where.append("(" + " OR ".join(f"{c} IN ({marks})" for c in columns) + ")")
+        else:
+            # JQL's != / not in never match empty values.
+            where.append(f"({columns[0]} IS NOT NULL AND " + " AND ".join(
+                f"COALESCE({c}, '') COLLATE NOCASE NOT IN ({marks})" for c in columns
+            ) + ")")
+        params += values * len(columns)
+        if field == "project" and op in ("=", "in"):
+            projects.update(v.upper() for v in values)
+        if field in ("key", "issuekey") and op in ("=", "in"):
+            keys.update(v.upper() for v in values)
+    return {"where": where, "params": params, "order": order_sql, "projects": projects, "keys": keys}
+
+
+class Mirror:
+    """SQLite store plus the sync logic for the configured projects."""
+
+    def __init__(self, path, projects: dict[str, list[str]]):
+        self.path = path
+        self.projects = {name: [p.upper() for p in keys] for name, keys in projects.items()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._sync_lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+        self.served = 0
+        self.bypassed = 0
+
+    # Sync
+
+    def _state(self, instance: str, project: str) -> sqlite3.Row | None:
+        with self._lock:
+            return self._db.execute(
+                "SELECT * FROM sync_state WHERE instance = ? AND project = ?", (instance, project)
+            ).fetchone()
+
+    def _upsert(self, instance: str, issues: list[dict], synced_at: float) -> None:
+        rows = []
+        for issue in issues:
+            key = issue.get("key", "")
+            project, _, number = key.rpartition("-")
+            f = issue.get("fields") or {}
+            assignee_id, assignee_name = _user(f.get("assignee"))
+            reporter_id, reporter_name = _user(f.get("reporter"))
+            rows.append((
+                instance, key, project, int(number) if number.isdigit() else 0,
+                (f.get("status") or {}).get("name"), assignee_id, assignee_name, reporter_id, reporter_name,
+                (f.get("issuetype") or {}).get("name"), (f.get("priority") or {}).get("name"),
+                _jira_timestamp(f.get("created")), _jira_timestamp(f.get("updated")),
+                synced_at, json.dumps({"key": key, "fields": f}),
+            ))
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def sync_project(self, instance: str, project: str, full: bool = False) -> dict:
+        """Bring one project up to date. Returns counts and timing."""
+        from jira_client import get_jira_client
+        from tools.search import fetch_page
+
+        started = time.time()
+        state = self._state(instance, project)
+        full = (
+            full or state is None or state["last_started"] is None or state["last_full_sync"] is None
+            or started - state["last_full_sync"] > settings.mirror_full_sync_hours * 3600
+        )
+        jql = f'project = "{project}"'
+        if not full:
+            minutes = int((started - state["last_started"]) // 60) + DELTA_OVERLAP_MINUTES
+            jql += f' AND updated >= "-{minutes}m"'
+        # Key order is stable while paging: an issue edited mid-sync keeps its
+        # position, and new issues land at the end.
+        jql += " ORDER BY key ASC"
+
+        client = get_jira_client(instance)
+        fields = build_fields_param(ISSUE_DETAIL_FIELDS)
+        fetched, start, token = 0, 0, None
+        try:
+            while True:
+                page = fetch_page(client, jql, fields, SYNC_PAGE_SIZE, start_at=0 if client.cloud else start,
+                                   next_page_token=token)
+                self._upsert(instance, page["issues"], started)
+                fetched += len(page["issues"])
+                start, token = start + len(page["issues"]), page["next_page_token"]
+                if page["is_last"] or not page["issues"]:
+                    break
+        except Exception as e:
+            with self._lock, self._db:
+                self._db.execute(
+                    "INSERT INTO sync_state (instance, project, error) VALUES (?, ?, ?) "
+                    "ON CONFLICT (instance, project) DO UPDATE SET error = excluded.error",
+                    (instance, project, str(e)),
+                )
+            raise
+
+        finished = time.time()
+        with self._lock, self._db:
+            if full:
+                self._db.execute(
+                    "DELETE FROM issues WHERE instance = ? AND project = ? AND synced_at < ?",
+                    (instance, project, started),
+                )
+            count = self._db.execute(
+                "SELECT COUNT(*) FROM issues WHERE instance = ? AND project = ?", (instance, project)
+            ).fetchone()[0]
+            self._db.execute(
+                """INSERT INTO sync_state (instance, project, last_started, last_finished, last_full_sync,
+                                           issue_count, error)
+                   VALUES (?, ?, ?, ?, ?, ?, NULL)
+                   ON CONFLICT (instance, project) DO UPDATE SET
+                       last_started = excluded.last_started,
+                       last_finished = excluded.last_finished,
+                       last_full_sync = COALESCE(excluded.last_full_sync, sync_state.last_full_sync),
+                       issue_count = excluded.issue_count,
+                       error = NULL,
+                       dirty_at = CASE WHEN sync_state.dirty_at <= excluded.last_started
+                                       THEN NULL ELSE sync_state.dirty_at END""",
+                (instance, project, started, finished, started if full else None, count),
+            )
+        return {
+            "instance": instance, "project": project, "full": full, "fetched": fetched,
+            "issue_count": count, "elapsed_ms": round((finished - started) * 1000, 1),
+        }
+
+    def sync_due(self, force: bool = False) -> list[dict]:
+        """Sync every configured project that is dirty, failed or older than the interval."""
+        results = []
+        with self._sync_lock:
+            for instance, projects in self.projects.items():
+                for project in projects:
+                    state = self._state(instance, project)
+                    due = (
+                        force or state is None or state["last_started"] is None or state["dirty_at"] is not None
+                        or time.time() - state["last_started"] >= settings.mirror_interval
+                    )
+                    if not due:
+                        continue
+                    try:
+                        results.append(self.sync_project(instance, project))
+                    except Exception as e:
+                        logger.warning(f"Mirror sync of {instance}/{project} failed: {e}")
+                        results.append({"instance": instance, "project": project, "error": str(e)})
+        return results
+
+    def run_forever(self) -> None:
+        while True:
+            try:
+                self.sync_due()
+            except Exception:
+                logger.exception("Mirror sync pass failed")
+            if self._wake.wait(timeout=min(settings.mirror_interval, 60)):
+                self._wake.clear()
+                time.sleep(DIRTY_DEBOUNCE_SECONDS)
+
+    def mark_dirty(self, instance: str, issue_key: str) -> None:
+        """Stop serving an issue's project locally until the next sync, and sync soon."""
+        project = issue_key.rpartition("-")[0].upper()
+        if project not in self.projects.get(instance, ()):
+            return
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE sync_state SET dirty_at = ? WHERE instance = ? AND project = ?",
+                (time.time(), instance, project),
+            )
+        self._wake.set()
+
+    # Reads
+
+    def _freshness(self, instance: str, projects: set[str]) -> dict | None:
+        """Freshness of the given projects, or None if any cannot be served locally."""
+        if not projects or not projects <= set(self.projects.get(instance, ())):
+            return None
+        marks = ",".join("?" * len(projects))
+        with self._lock:
+            states = self._db.execute(
+                f"SELECT * FROM sync_state WHERE instance = ? AND project IN ({marks})",
+                (instance, *projects),
+            ).fetchall()
+        if len(states) != len(projects):
+            return None
+        oldest = None
+        for s in states:
+            if s["last_started"] is None or s["dirty_at"] is not None:
+                return None
+            oldest = s["last_started"] if oldest is None else min(oldest, s["last_started"])
+        age = time.time() - oldest
+        if age > settings.mirror_max_staleness:
+            return None
+        return {"source": "mirror", "synced_at": _iso(oldest), "age_seconds": round(age, 1)}
+
+    def _count(self, served: bool) -> None:
+        with self._lock:
+            if served:
+                self.served += 1
+            else:
+                self.bypassed += 1
+
+    def get_issue(self, instance: str, key: str) -> tuple[dict, dict] | None:
+        """Return `(issue, freshness)` from the mirror, or None to go to Jira."""
+        freshness = self._freshness(instance, {key.rpartition("-")[0].upper()})
+        row = None
+        if freshness is not None:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT data FROM issues WHERE instance = ? AND key = ?", (instance, key)
+                ).fetchone()
+        self._count(row is not None)
+        return (json.loads(row["data"]), freshness) if row else None
+
+    def search(
+        self, instance: str, jql: str, start_at: int, limit: int, complete_only: bool = False
+    ) -> tuple[list, int, dict] | None:
+        """
+        Return `(issues, total, freshness)` for a supported JQL query, or None
+        to go to Jira. With `complete_only`, results that do not fit in
+        `limit` rows also go to Jira (so Jira issues the paging cursor).
+        """
+        query = parse_jql(jql)
+        freshness = None
+        if query is not None:
+            projects = query["projects"] | {k.rpartition("-")[0] for k in query["keys"]}
+            freshness = self._freshness(instance, projects)
+        if freshness is None:
+            self._count(False)
+            return None
+        where = " AND ".join(["instance = ?", *query["where"]])
+        params = [instance, *query["params"]]
+        with self._lock:
+            total = self._db.execute(f"SELECT COUNT(*) FROM issues WHERE {where}", params).fetchone()[0]
+            if complete_only and start_at + limit < total:
+                self.bypassed += 1
+                return None
+            rows = self._db.execute(
+                f"SELECT data FROM issues WHERE {where} ORDER BY {query['order']} LIMIT ? OFFSET ?",
+                (*params, limit, start_at),
+            ).fetchall()
+        self._count(True)
+        return [json.loads(r["data"]) for r in rows], total, freshness
+
+    def status(self) -> dict:
+        with self._lock:
+            states = [dict(r) for r in self._db.execute("SELECT * FROM sync_state ORDER BY instance, project")]
+            served, bypassed = self.served, self.bypassed
+        now = time.time()
+        projects = []
+        for s in states:
+            projects.append({
+                "instance": s["instance"],
+                "project": s["project"],
+                "issue_count": s["issue_count"],
+                "synced_at": _iso(s["last_started"]) if s["last_started"] else None,
+                "age_seconds": round(now - s["last_started"], 1) if s["last_started"] else None,
+                "last_full_sync": _iso(s["last_full_sync"]) if s["last_full_sync"] else None,
+                "dirty": s["dirty_at"] is not None,
+                "error": s["error"],
+            })
+        return {
+            "enabled": True,
+            "path": str(self.path),
+            "projects": projects,
+            "reads_served": served,
+            "reads_bypassed": bypassed,
+        }
+
+
+_mirror: Mirror | None = None
+_mirror_lock = threading.Lock()
+
+
+def get_mirror() -> Mirror | None:
+    """The process-wide mirror, or None when `mirror.enabled` is off."""
+    global _mirror
+    if not settings.mirror_enabled:
+        return None
+    with _mirror_lock:
+        if _mirror is None:
+            _mirror = Mirror(settings.mirror_path, settings.mirror_projects)
+        return _mirror
+
+
+def start_background_sync() -> threading.Thread | None:
+    """Start the sync loop on a daemon thread if the mirror is enabled."""
+    mirror = get_mirror()
+    if mirror is None:
+        return None
+    thread = threading.Thread(target=mirror.run_forever, name="jira-mirror-sync", daemon=True)
+    thread.start()
+    return thread
+
+
+def _on_issue_written(instance_name: str, issue_key: str) -> None:
+    mirror = get_mirror()
+    if mirror is not None:
+        mirror.mark_dirty(instance_name, issue_key)
+
+
+issue_cache.add_invalidation_listener(_on_issue_written)
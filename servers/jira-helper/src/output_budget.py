@@ -0,0 +1,160 @@
+"""
+Response-size budgets for tool outputs.
+
+Tools that can return large text (issue descriptions, comment bodies,
+Confluence storage bodies, raw issue JSON) pass their finished response
+through `apply_budget`. When the JSON-encoded response exceeds the budget,
+the longest strings are cut to a common length with `truncate_string` until
+it fits. The full text of each cut string is kept in memory behind a
+continuation cursor (read it with the `get_elided_content` tool), and the
+response lists what was elided under `elided`.
+
+Budgets come from `output.max_response_kb` in config.yaml, overridable per
+tool under `output.tools` and per call with `max_response_bytes`. Roughly
+four bytes of JSON correspond to one model token.
+"""
+
+import copy
+import json
+import logging
+import uuid
+
+from cache import TTLCache
+from config import settings
+from exceptions import JiraValidationError
+from output_sanitizer import truncate_string
+
+logger = logging.getLogger(__name__)
+
+MIN_KEPT_CHARS = 200  # strings are never cut below this length
+MIN_BUDGET_BYTES = 4 * 1024
+MAX_PASSES = 4
+
+# response id -> full texts of the strings elided from that response, so a
+# response with many elided strings cannot evict its own cursors
+_elided = TTLCache(max_entries=256, ttl=settings.elided_content_ttl)
+
+
+def _encoded_size(value) -> int:
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _long_strings(value, path: str = ""):
+    """Yield (container, key, path, text) for every string longer than MIN_KEPT_CHARS."""
+    if isinstance(value, dict):
+        items = value.items()
+        fmt = "{}.{}" if path else "{}{}"
+    elif isinstance(value, list):
+        items = enumerate(value)
+        fmt = "{}[{}]"
+    else:
+        return
+    for k, v in items:
+        child = fmt.format(path, k)
+        if isinstance(v, str):
+            if len(v) > MIN_KEPT_CHARS:
+                yield value, k, child, v
+        elif isinstance(v, (dict, list)):
+            yield from _long_strings(v, child)
+
+
+def _common_cap(lengths: list[int], excess: int) -> int:
+    """Largest cap such that cutting every length above it frees at least `excess` chars."""
+    lo, hi = MIN_KEPT_CHARS, max(lengths)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if sum(n - mid for n in lengths if n > mid) >= excess:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def resolve_budget(tool_name: str, max_response_bytes: int | None = None) -> int:
+    if max_response_bytes is not None:
+        budget = int(max_response_bytes)
+        if budget < MIN_BUDGET_BYTES:
+            raise JiraValidationError(f"max_response_bytes must be at least {MIN_BUDGET_BYTES}.")
+        return budget
+    return settings.get_response_budget(tool_name)
+
+
+def apply_budget(result: dict, tool_name: str, max_response_bytes: int | None = None) -> dict:
+    """
+    Fit `result` into the tool's response budget, cutting long strings.
+
+    Returns `result` unchanged when it already fits (or budgets are
+    disabled). Otherwise a copy is returned (values may be shared with
+    caches) with long strings truncated, plus `elided` (path, original and
+    returned length, cursor per string) and `response_budget`.
+    """
+    budget = resolve_budget(tool_name, max_response_bytes)
+    if budget <= 0:
+        return result
+    original = _encoded_size(result)
+    if original <= budget:
+        return result
+
+    result = copy.deepcopy(result)
+    originals: dict[str, str] = {}
+    elided: dict[str, dict] = {}
+    size = original
+    for _ in range(MAX_PASSES):
+        candidates = list(_long_strings(result))
+        if not candidates:
+            break
+        # Leave room for the elided report itself.
+        excess = size - budget + 200 * (len(candidates) + 1)
+        cap = _common_cap([len(c[3]) for c in candidates], excess)
+        for container, key, path, text in candidates:
+            if len(text) <= cap + 3:
+                continue
+            full = originals.setdefault(path, text)
+            container[key] = truncate_string(full, cap)
+            elided[path] = {"path": path, "original_chars": len(full), "returned_chars": cap}
+        result["elided"] = list(elided.values())
+        size = _encoded_size(result)
+        if size <= budget or cap <= MIN_KEPT_CHARS:
+            break
+
+    if not elided:
+        return result
+    response_id = uuid.uuid4().hex
+    _elided.put(response_id, [originals[path] for path in elided])
+    for index, entry in enumerate(elided.values()):
+        entry["cursor"] = f"{response_id}.{index}:{entry['returned_chars']}"
+    result["elided"] = list(elided.values())
+    result["response_budget"] = {
+        "max_bytes": budget,
+        "original_bytes": original,
+        "returned_bytes": _encoded_size(result),
+    }
+    if result["response_budget"]["returned_bytes"] > budget:
+        logger.info(f"{tool_name} response still exceeds its {budget} byte budget after truncation")
+    return result
+
+
+def read_elided(cursor: str, max_chars: int) -> dict:
+    """Return the next `max_chars` of an elided string and the cursor after them."""
+    cursor_id, _, offset = (cursor or "").partition(":")
+    response_id, _, index = cursor_id.partition(".")
+    if not response_id or not index.isdigit() or not offset.isdigit():
+        raise JiraValidationError(f"Invalid cursor: {cursor!r}")
+    texts = _elided.get(response_id)
+    text = texts[int(index)] if texts is not None and int(index) < len(texts) else None
+    if text is None:
+        raise JiraValidationError(
+            "Cursor has expired or is unknown. Repeat the original call (optionally with a larger max_response_bytes)."
+        )
+    start = int(offset)
+    end = min(start + max_chars, len(text))
+    return {
+        "content": text[start:end],
+        "offset": start,
+        "total_chars": len(text),
+        "next_cursor": f"{cursor_id}:{end}" if end < len(text) else None,
+    }
+
+
+def get_stats() -> dict:
+    return _elided.stats()
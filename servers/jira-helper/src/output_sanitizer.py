@@ -52,4 +52,19 @@ def truncate_string(value: str, max_length: int, suffix: str = "...") -> str:
         return value if value == "" else ""
     if len(value) <= max_length:
         return value
-    return value[:max_length] + suffix
\ No newline at end of file
+    return value[:max_length] + suffix
+
+def sanitize_value(value):
+    """
+    Sanitize every string inside a JSON-like value (raw or rendered field values).
+
+    Dicts and lists are copied, never modified in place, since the input may
+    be shared with a cache. Non-string scalars are returned unchanged.
+    """
+    if isinstance(value, str):
+        return sanitize_string(value)
+    if isinstance(value, dict):
+        return {k: sanitize_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [sanitize_value(v) for v in value]
+    return value
@@ -0,0 +1,242 @@
+"""
+Field projection for Jira issue reads.
+
+Without a `fields` argument, `GET /issue/{key}` returns every field on the
+issue, including large custom fields and rendered content the tools never
+look at. Each read tool declares the fields it extracts here, and
+`build_fields_param` turns that (plus any caller-requested extras) into the
+comma-separated `fields` query parameter.
+
+The same declarations drive response extraction: an output spec maps each
+response key to a `Extract` (built with `top`, `raw`, `text`, `attr` or
+`each`), and `compile_projection` turns it into a single generated function
+with one lookup per field, calling `output_sanitizer` for user-authored
+text, instead of repeated `x.get(...).get(...) if x.get(...) else ...` chains per tool.
+"""
+
+from typing import Callable, NamedTuple
+
+from output_sanitizer import sanitize_string, sanitize_value, truncate_string
+
+# Fields extracted by get_issue_details.
+ISSUE_DETAIL_FIELDS = (
+    "summary", "status", "assignee", "reporter", "priority", "issuetype",
+    "project", "description", "created", "updated", "labels", "components",
+)
+
+# get_full_issue_details additionally renders links and attachments.
+FULL_ISSUE_FIELDS = ISSUE_DETAIL_FIELDS + ("issuelinks", "attachment")
+
+# Fields shown for each row of a JQL search result.
+SEARCH_RESULT_FIELDS = ("summary", "status", "assignee", "priority", "issuetype", "project")
+
+# get_issue_links only needs the link list (linked issues carry their own
+# summary/status stubs).
+ISSUE_LINK_FIELDS = ("issuelinks",)
+
+
+def normalize_field_list(fields: list | str | None) -> list[str]:
+    """
+    Normalize a caller-supplied field list.
+
+    Accepts a list of names or a comma-separated string; strips whitespace,
+    drops empties and duplicates while preserving order.
+    """
+    if not fields:
+        return []
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    result = []
+    for f in fields:
+        name = str(f).strip()
+        if name and name not in result:
+            result.append(name)
+    return result
+
+
+def build_fields_param(base: tuple | list, extra: list | str | None = None) -> str:
+    """
+    Build the `fields` query parameter for an issue read.
+
+    Args:
+        base: Fields the tool always extracts.
+        extra: Optional caller-requested fields (list or comma-separated).
+
+    Returns:
+        Comma-separated field list with duplicates removed.
+    """
+    return ",".join(normalize_field_list(list(base) + normalize_field_list(extra)))
+
+
+def extract_extra_fields(issue_fields: dict, extra: list | str | None) -> dict:
+    """Return the (sanitized) raw values of caller-requested fields, keyed by field id."""
+    return {name: sanitize_value(issue_fields.get(name)) for name in normalize_field_list(extra)}
+
+
+class Extract(NamedTuple):
+    """How one response key is produced from a Jira object."""
+    kind: str           # "top", "raw", "text", "attr" or "each"
+    field: str
+    attr: str = ""
+    default: object = ""
+    truncate: int | None = None
+
+
+def top(name: str, default="") -> Extract:
+    """A value on the object itself (e.g. an issue's `key`), not under `fields`."""
+    return Extract("top", name, default=default)
+
+
+def raw(field: str, default="") -> Extract:
+    """A field value returned as-is."""
+    return Extract("raw", field, default=default)
+
+
+def text(field: str, truncate: int | None = None) -> Extract:
+    """User-authored text: passed through `sanitize_string`, optionally then `truncate_string`."""
+    return Extract("text", field, truncate=truncate)
+
+
+def attr(field: str, name: str, default="") -> Extract:
+    """An attribute of an object-valued field (e.g. `status.name`); `default` if the field is empty."""
+    return Extract("attr", field, attr=name, default=default)
+
+
+def each(field: str, name: str) -> Extract:
+    """One attribute from every element of an array field (e.g. component names)."""
+    return Extract("each", field, attr=name)
+
+
+def compile_projection(spec: dict[str, Extract], nested: str | None = "fields") -> Callable[[dict], dict]:
+    """
+    Compile an output spec into an extractor function.
+
+    Args:
+        spec: Response key -> `Extract`, in output order.
+        nested: Key of the sub-object holding the fields (`"fields"` for
+            issues), or None when fields live on the object itself.
+
+    Returns:
+        A function taking the raw Jira object and returning the response dict.
+    """
+    lines = ["def extract(item):"]
+    lines.append(f"    f = item.get({nested!r}) or {{}}" if nested else "    f = item")
+    lines.append("    get = f.get")
+    entries = []
+    for i, (key, e) in enumerate(spec.items()):
+        src = "item.get" if e.kind == "top" else "get"
+        var = f"v{i}"
+        if e.kind in ("top", "raw"):
+            expr = f"{src}({e.field!r}, {e.default!r})"
+        elif e.kind == "attr":
+            lines.append(f"    {var} = get({e.field!r})")
+            expr = f"({var}.get({e.attr!r}, {e.default!r}) if {var} else {e.default!r})"
+        elif e.kind == "text":
+            expr = f"sanitize_string(get({e.field!r}))"
+            if e.truncate is not None:
+                expr = f"truncate_string({expr}, {e.truncate})"
+        elif e.kind == "each":
+            expr = f"[c.get({e.attr!r}, '') for c in get({e.field!r}) or ()]"
+        else:
+            raise ValueError(f"Unknown extract kind: {e.kind}")
+        entries.append(f"        {key!r}: {expr},")
+    lines += ["    return {", *entries, "    }"]
+    namespace: dict = {"sanitize_string": sanitize_string, "truncate_string": truncate_string}
+    exec(compile("\n".join(lines), "<projection>", "exec"), namespace)
+    return namespace["extract"]
+
+
+# Output specs, compiled once at import.
+
+extract_issue_detail = compile_projection({
+    "key": top("key"),
+    "summary": text("summary"),
+    "status": attr("status", "name"),
+    "assignee": attr("assignee", "displayName", "Unassigned"),
+    "reporter": attr("reporter", "displayName"),
+    "priority": attr("priority", "name"),
+    "issue_type": attr("issuetype", "name"),
+    "project": attr("project", "key"),
+    "description": text("description"),
+    "created": raw("created"),
+    "updated": raw("updated"),
+    "labels": raw("labels", []),
+    "components": each("components", "name"),
+})
+
+# List view: summaries are truncated.
+extract_search_row = compile_projection({
+    "key": top("key"),
+    "summary": text("summary", truncate=200),
+    "status": attr("status", "name"),
+    "assignee": attr("assignee", "displayName", "Unassigned"),
+    "priority": attr("priority", "name"),
+    "issue_type": attr("issuetype", "name"),
+    "project": attr("project", "key"),
+})
+
+# The stub of the issue on the other end of a link.
+extract_linked_issue = compile_projection({
+    "issue_key": top("key"),
+    "summary": text("summary"),
+    "status": attr("status", "name"),
+})
+
+extract_comment = compile_projection({
+    "id": raw("id"),
+    "author": attr("author", "displayName"),
+    "body": text("body"),
+    "created": raw("created"),
+    "updated": raw("updated"),
+}, nested=None)
+
+extract_attachment = compile_projection({
+    "id": raw("id"),
+    "filename": raw("filename"),
+    "size": raw("size", 0),
+    "mime_type": raw("mimeType"),
+    "created": raw("created"),
+    "author": attr("author", "displayName"),
+}, nested=None)
+
+
+def to_table(rows: list[dict], intern: tuple = ()) -> dict:
+    """
+    Convert extracted rows to columnar form: `columns` plus one value list per row.
+
+    Columns named in `intern` whose values repeat (at most half as many
+    distinct values as rows) are stored once under `values[column]`, and
+    rows hold the index into that list instead of the value.
+    """
+    columns = list(rows[0]) if rows else []
+    table_rows = [[row.get(c) for c in columns] for row in rows]
+    values: dict[str, list] = {}
+    for c in intern:
+        if c not in columns:
+            continue
+        i = columns.index(c)
+        index: dict = {}
+        for r in table_rows:
+            index.setdefault(r[i], len(index))
+        if len(index) * 2 > len(table_rows):
+            continue
+        for r in table_rows:
+            r[i] = index[r[i]]
+        values[c] = list(index)
+    return {"columns": columns, "rows": table_rows, "values": values}
+
+
+def extract_links(issue_links: list) -> list[dict]:
+    """Render an issue's `issuelinks` with direction and the linked issue's stub."""
+    links = []
+    for link in issue_links or ():
+        link_type = link.get("type")
+        entry = {"type": link_type.get("name", "") if link_type else ""}
+        if "outwardIssue" in link:
+            entry["direction"] = "outward"
+            entry.update(extract_linked_issue(link["outwardIssue"]))
+        elif "inwardIssue" in link:
+            entry["direction"] = "inward"
+            entry.update(extract_linked_issue(link["inwardIssue"]))
+        links.append(entry)
+    return links
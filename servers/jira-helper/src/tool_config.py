@@ -2,21 +2,32 @@
 Tool configuration for Jira Helper MCP Server.
 
 Maps tool names to their implementation functions using mcp-commons pattern.
+Tool bodies are blocking; they are registered as async wrappers that run on
+a bounded worker pool so concurrent calls do not serialize.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+from concurrency import as_async_tool
+from config import settings
+
 from tools.issues import (
     list_jira_projects,
     get_issue_details,
     get_full_issue_details,
+    get_issues_bulk,
     create_jira_ticket,
+    create_issues_bulk,
     update_jira_issue,
     transition_jira_issue,
+    transition_issues_bulk,
     change_issue_assignee,
     list_jira_instances,
     get_custom_field_mappings,
 )
 from tools.search import (
     search_jira_issues,
+    search_all_instances,
     list_project_tickets,
     validate_jql_query,
 )
@@ -49,13 +60,21 @@ from tools.confluence import (
 )
 from tools.files import (
     upload_file_to_jira,
+    upload_files_to_jira,
+    download_issue_attachment,
     list_issue_attachments,
     delete_issue_attachment,
 )
+from tools.continuation import get_elided_content
+from tools.diagnostics import (
+    get_connection_pool_stats,
+    get_cache_stats,
+    get_mirror_status,
+)
 
 
 JIRA_TOOLS = {
-    # Core Jira operations (13 tools)
+    # Core Jira operations (16 tools)
     "list_jira_projects": {
         "function": list_jira_projects,
         "description": "List all projects available in the Jira instance.",
@@ -68,10 +87,18 @@ JIRA_TOOLS = {
         "function": get_full_issue_details,
         "description": "Get comprehensive information about a specific Jira issue with formatting options.",
     },
+    "get_issues_bulk": {
+        "function": get_issues_bulk,
+        "description": "Get details for many Jira issues in one call, in input order with per-key errors.",
+    },
     "create_jira_ticket": {
         "function": create_jira_ticket,
         "description": "Create a new Jira ticket (issue).",
     },
+    "create_issues_bulk": {
+        "function": create_issues_bulk,
+        "description": "Create many Jira issues via the bulk-create endpoint, with optional links between them.",
+    },
     "add_comment_to_jira_ticket": {
         "function": add_comment_to_jira_ticket,
         "description": "Add a comment to an existing Jira ticket.",
@@ -80,6 +107,10 @@ JIRA_TOOLS = {
         "function": transition_jira_issue,
         "description": "Transition a Jira issue through its workflow.",
     },
+    "transition_issues_bulk": {
+        "function": transition_issues_bulk,
+        "description": "Transition many Jira issues (by keys or JQL) concurrently, with a per-issue result table.",
+    },
     "get_issue_transitions": {
         "function": get_issue_transitions,
         "description": "Get available workflow transitions for a Jira issue.",
@@ -108,7 +139,7 @@ JIRA_TOOLS = {
         "function": update_jira_issue,
         "description": "Update an existing Jira issue with new field values.",
     },
-    # Search & advanced operations (6 tools)
+    # Search & advanced operations (7 tools)
     "search_jira_issues": {
         "function": search_jira_issues,
         "description": "Execute a JQL search query to find Jira issues.",
@@ -117,6 +148,10 @@ JIRA_TOOLS = {
         "function": validate_jql_query,
         "description": "Validate JQL syntax without executing the query.",
     },
+    "search_all_instances": {
+        "function": search_all_instances,
+        "description": "Run a JQL search on every configured Jira instance and merge the results.",
+    },
     "create_issue_link": {
         "function": create_issue_link,
         "description": "Create a link between two Jira issues.",
@@ -150,11 +185,19 @@ JIRA_TOOLS = {
         "function": update_time_estimates,
         "description": "Update time estimates for a Jira issue.",
     },
-    # File operations (3 tools)
+    # File operations (5 tools)
     "upload_file_to_jira": {
         "function": upload_file_to_jira,
         "description": "Upload a file to a Jira issue as an attachment.",
     },
+    "upload_files_to_jira": {
+        "function": upload_files_to_jira,
+        "description": "Upload several files (list or glob) to a Jira issue concurrently.",
+    },
+    "download_issue_attachment": {
+        "function": download_issue_attachment,
+        "description": "Download an attachment to the local cache, or return its first bytes/lines.",
+    },
     "list_issue_attachments": {
         "function": list_issue_attachments,
         "description": "List all attachments for a Jira issue.",
@@ -188,8 +231,33 @@ JIRA_TOOLS = {
         "function": update_confluence_page,
         "description": "Update an existing Confluence page.",
     },
+    # Response continuation (1 tool)
+    "get_elided_content": {
+        "function": get_elided_content,
+        "description": "Read text that was truncated from an earlier response, using its cursor.",
+    },
+    # Diagnostics (3 tools)
+    "get_connection_pool_stats": {
+        "function": get_connection_pool_stats,
+        "description": "Get HTTP connection pool statistics for each Atlassian instance.",
+    },
+    "get_cache_stats": {
+        "function": get_cache_stats,
+        "description": "Get hit/miss counters for the server's in-memory caches.",
+    },
+    "get_mirror_status": {
+        "function": get_mirror_status,
+        "description": "Get the local Jira mirror's sync state per project, optionally syncing now.",
+    },
 }
 
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.max_concurrent_tools, thread_name_prefix="jira-tool"
+)
+
+for _tool in JIRA_TOOLS.values():
+    _tool["function"] = as_async_tool(_tool["function"], _TOOL_EXECUTOR)
+
 
 def get_tools_config() -> dict:
     """Get the tools configuration for mcp-commons registration."""
@@ -2,6 +2,8 @@
 
 import logging
 
+import transition_cache
+from issue_cache import invalidate_issue
 from jira_client import get_jira_client, validate_issue_key, resolve_instance_name
 from exceptions import JiraError, JiraValidationError, JiraApiError
 
@@ -19,6 +21,7 @@ def add_comment_to_jira_ticket(
     client = get_jira_client(name)
     try:
         client.issue_add_comment(key, comment)
+        invalidate_issue(name, key)
         return {"key": key, "instance": name, "message": f"Successfully added comment to {key}"}
     except JiraError:
         raise
@@ -32,15 +35,16 @@ def get_issue_transitions(issue_key: str, instance_name: str = None, **kwargs) -
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        transitions = client.get_issue_transitions(key)
-        result = []
-        for t in transitions:
-            result.append({
-                "id": t.get("id", ""),
-                "name": t.get("name", ""),
-                "to_status": t.get("to", {}).get("name", "") if t.get("to") else "",
-            })
-        return {"key": key, "instance": name, "transitions": result, "count": len(result)}
+        issue = client.issue(key, fields="project,issuetype,status", expand="transitions")
+        context, transitions = transition_cache.learn_from_issue(name, issue)
+        result = [
+            {"id": t["id"], "name": t["name"], "to_status": t["to_status"]}
+            for t in transitions
+        ]
+        return {
+            "key": key, "instance": name, "current_status": context[2],
+            "transitions": result, "count": len(result),
+        }
     except JiraError:
         raise
     except Exception as e:
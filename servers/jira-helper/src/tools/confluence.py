@@ -4,6 +4,7 @@ import logging
 
 from jira_client import get_confluence_client, resolve_instance_name
 from exceptions import JiraError, JiraValidationError, JiraApiError
+from output_budget import apply_budget
 from output_sanitizer import sanitize_string
 
 logger = logging.getLogger(__name__)
@@ -58,9 +59,13 @@ def list_confluence_pages(
 
 def get_confluence_page(
     page_id: str = None, title: str = None, space_key: str = None,
-    instance_name: str = None, **kwargs
+    max_response_bytes: int = None, instance_name: str = None, **kwargs
 ) -> dict:
-    """Get detailed information about a specific Confluence page."""
+    """Get detailed information about a specific Confluence page.
+
+    Bodies larger than the response budget are truncated; the rest is
+    readable with `get_elided_content`.
+    """
     if not page_id and not (title and space_key):
         raise JiraValidationError("Either page_id or both title and space_key are required.")
     name = resolve_instance_name(instance_name)
@@ -74,7 +79,7 @@ def get_confluence_page(
         if not page:
             return {"instance": name, "found": False, "message": "Page not found."}
 
-        return {
+        return apply_budget({
             "instance": name, "found": True,
             "id": page.get("id", ""),
             "title": sanitize_string(page.get("title", "")),
@@ -82,7 +87,7 @@ def get_confluence_page(
             "version": page.get("version", {}).get("number", 0) if page.get("version") else 0,
             "body": sanitize_string(page.get("body", {}).get("storage", {}).get("value", "") if page.get("body") else ""),
             "status": page.get("status", ""),
-        }
+        }, "get_confluence_page", max_response_bytes)
     except JiraError:
         raise
     except Exception as e:
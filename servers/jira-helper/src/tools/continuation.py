@@ -0,0 +1,24 @@
+"""Continuation of responses cut down to their size budget."""
+
+import logging
+
+from exceptions import JiraValidationError
+from output_budget import read_elided
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_CHARS = 50_000
+
+
+def get_elided_content(cursor: str, max_chars: int = DEFAULT_CHUNK_CHARS, **kwargs) -> dict:
+    """Read text elided from an earlier response, starting at `cursor`.
+
+    Cursors come from the `elided` list of a budgeted response; pass the
+    returned `next_cursor` to continue.
+    """
+    if not cursor:
+        raise JiraValidationError("cursor is required.")
+    max_chars = int(max_chars or DEFAULT_CHUNK_CHARS)
+    if max_chars < 1:
+        raise JiraValidationError("max_chars must be positive.")
+    return dict({"cursor": cursor}, **read_elided(cursor, max_chars))
@@ -0,0 +1,46 @@
+"""Diagnostic operations: connection pool, cache and mirror statistics."""
+
+import logging
+
+import field_catalog
+import issue_cache
+import mirror
+import output_budget
+import transition_cache
+from tools import workflow
+from tools.files import get_attachment_cache_stats
+from tools.links import get_link_type_cache_stats
+from jira_client import get_pool_stats
+
+logger = logging.getLogger(__name__)
+
+
+def get_connection_pool_stats(**kwargs) -> dict:
+    """Get keep-alive connection pool statistics for each Atlassian instance."""
+    sessions = get_pool_stats()
+    return {"sessions": sessions, "count": len(sessions)}
+
+
+def get_cache_stats(**kwargs) -> dict:
+    """Get hit/miss counters for the server's in-memory caches."""
+    return {
+        "issue_cache": issue_cache.get_stats(),
+        "field_catalog": field_catalog.get_stats(),
+        "transition_cache": transition_cache.get_stats(),
+        "link_types": get_link_type_cache_stats(),
+        "workflow": workflow.get_stats(),
+        "attachments": get_attachment_cache_stats(),
+        "elided_content": output_budget.get_stats(),
+    }
+
+
+def get_mirror_status(sync_now: bool = False, **kwargs) -> dict:
+    """Get the local mirror's per-project sync state, optionally syncing first."""
+    local = mirror.get_mirror()
+    if local is None:
+        return {"enabled": False}
+    synced = local.sync_due(force=True) if sync_now else None
+    status = local.status()
+    if synced is not None:
+        status["synced"] = synced
+    return status
@@ -1,44 +1,278 @@
-"""File attachment operations: upload, list, delete."""
+"""File attachment operations: upload, download, list, delete."""
 
+import glob
+import hashlib
+import json
 import logging
+import mimetypes
 import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
 
+from urllib3.fields import format_multipart_header_param
+
+from cache import TTLCache
+from concurrency import map_concurrently
+from config import settings
+from disk_cache import DiskCache, content_key
+from issue_cache import get_issue, invalidate_issue, invalidate_field
 from jira_client import get_jira_client, validate_issue_key, resolve_instance_name
 from exceptions import JiraError, JiraValidationError, JiraApiError
+from output_sanitizer import sanitize_string
+from projection import extract_attachment
 
 logger = logging.getLogger(__name__)
 
-MAX_FILE_SIZE = 25 * 1024 * 1024  # 25 MB
+# instance -> {"enabled": bool, "upload_limit": int | None} from attachment/meta
+_attachment_meta = TTLCache(max_entries=32, ttl=3600)
+settings.add_reload_listener(lambda names: _attachment_meta.invalidate(lambda k: k in names))
 
+# Downloaded attachments, stored by SHA-256 of their content, plus a small
+# JSON index entry per (instance, attachment id). Attachment content never
+# changes for a given id, so index entries need no revalidation.
+_attachment_store = DiskCache(settings.cache_dir / "attachments", settings.attachment_cache_max_bytes)
 
-def upload_file_to_jira(
-    issue_key: str, file_path: str, instance_name: str = None, **kwargs
-) -> dict:
-    """Upload a file to a Jira issue as an attachment."""
-    key = validate_issue_key(issue_key)
+DOWNLOAD_BLOCK_SIZE = 64 * 1024
+INLINE_TEXT_LIMIT = 64 * 1024  # full downloads return text content up to this size
+MAX_PARTIAL_BYTES = 1024 * 1024  # cap on content returned for max_bytes / max_lines
+TEXT_MIME_TYPES = ("application/json", "application/xml", "application/x-yaml", "application/javascript")
+
+MAX_UPLOAD_FILES = 100
+
+
+class MultipartFileStream:
+    """
+    A single-file multipart/form-data body that reads the file on demand.
+
+    requests sends objects with `read()` and `__len__` as a streamed body
+    with a Content-Length header, so memory use stays at the transport's
+    block size regardless of file size.
+    """
+
+    def __init__(self, file_path: str, field_name: str = "file"):
+        self.boundary = uuid.uuid4().hex
+        filename = os.path.basename(file_path)
+        mime_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f"Content-Disposition: form-data; name=\"{field_name}\"; "
+            f"{format_multipart_header_param('filename', filename)}\r\n"
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self.file_size = os.path.getsize(file_path)
+        self._file = open(file_path, "rb")
+        self._parts = [self._head, None, self._tail]
+        self._offset = 0  # offset within the current in-memory part
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self.file_size + len(self._tail)
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self)
+        chunks = []
+        while size > 0 and self._parts:
+            part = self._parts[0]
+            if part is None:
+                data = self._file.read(size)
+                if not data:
+                    self._parts.pop(0)
+                    continue
+            else:
+                data = part[self._offset:self._offset + size]
+                self._offset += len(data)
+                if self._offset >= len(part):
+                    self._parts.pop(0)
+                    self._offset = 0
+            chunks.append(data)
+            size -= len(data)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def get_upload_limit(client, name: str) -> int | None:
+    """
+    Upload limit in bytes for an instance: the smaller of the instance's
+    `attachment/meta` limit and `attachments.max_upload_mb`, or None if
+    neither is known.
+
+    Raises:
+        JiraValidationError: Attachments are disabled on the instance.
+    """
+    meta = _attachment_meta.get(name)
+    if meta is None:
+        try:
+            raw = client.get_attachment_meta() or {}
+            meta = {"enabled": raw.get("enabled", True), "upload_limit": raw.get("uploadLimit")}
+        except Exception as e:
+            logger.warning(f"Could not read attachment settings for '{name}': {e}")
+            meta = {"enabled": True, "upload_limit": None}
+        _attachment_meta.put(name, meta)
+    if not meta["enabled"]:
+        raise JiraValidationError(f"Attachments are disabled on instance '{name}'.")
+    limits = [v for v in (meta["upload_limit"], settings.attachment_max_upload_bytes) if v]
+    return min(limits) if limits else None
+
+
+def _validate_upload_file(file_path: str) -> int:
+    """Check that a file exists and return its size."""
     if not file_path:
         raise JiraValidationError("file_path is required.")
-    if not os.path.exists(file_path):
+    if not os.path.isfile(file_path):
         raise JiraValidationError(f"File not found: {file_path}")
-    file_size = os.path.getsize(file_path)
-    if file_size > MAX_FILE_SIZE:
+    return os.path.getsize(file_path)
+
+
+def _check_upload_size(file_path: str, file_size: int, limit: int | None) -> None:
+    if limit is not None and file_size > limit:
         raise JiraValidationError(
-            f"File too large: {file_size / (1024*1024):.1f} MB. Maximum is 25 MB."
+            f"File too large: {os.path.basename(file_path)} is {file_size / (1024*1024):.1f} MB. "
+            f"Maximum is {limit / (1024*1024):.1f} MB."
+        )
+
+
+def stream_attachment(client, issue_key: str, file_path: str) -> dict:
+    """
+    POST a file to `issue/{key}/attachments` as a streamed multipart body.
+
+    Returns the created attachment metadata plus `size`, `duration_seconds`
+    and `throughput_mb_s`.
+    """
+    body = MultipartFileStream(file_path)
+    url = client.url_joiner(client.url, client.resource_url(f"issue/{issue_key}/attachments"))
+    started = time.monotonic()
+    try:
+        response = client.session.post(
+            url, data=body,
+            headers={
+                "Content-Type": body.content_type,
+                "X-Atlassian-Token": "no-check",
+                "Accept": "application/json",
+            },
         )
+    finally:
+        body.close()
+    client.raise_for_status(response)
+    duration = time.monotonic() - started
+    created = response.json() if response.content else []
+    attachment = created[0] if isinstance(created, list) and created else {}
+    return {
+        "attachment_id": attachment.get("id", ""),
+        "filename": attachment.get("filename", os.path.basename(file_path)),
+        "size": body.file_size,
+        "duration_seconds": round(duration, 3),
+        "throughput_mb_s": round(body.file_size / (1024 * 1024) / duration, 2) if duration > 0 else None,
+    }
+
+
+def upload_file_to_jira(
+    issue_key: str, file_path: str, instance_name: str = None, **kwargs
+) -> dict:
+    """Upload a file to a Jira issue as an attachment.
+
+    The file is streamed from disk, so its size is bounded only by the
+    instance's attachment limit (and `attachments.max_upload_mb`, if set).
+    """
+    key = validate_issue_key(issue_key)
+    file_size = _validate_upload_file(file_path)
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        result = client.add_attachment(key, file_path)
-        filename = os.path.basename(file_path)
+        _check_upload_size(file_path, file_size, get_upload_limit(client, name))
+        result = stream_attachment(client, key, file_path)
+        invalidate_issue(name, key)
+        return dict(
+            {"key": key, "instance": name},
+            **result,
+            message=f"Successfully uploaded {result['filename']} to {key}",
+        )
+    except JiraError:
+        raise
+    except Exception as e:
+        raise JiraApiError(f"Failed to upload file to {key}: {e}", instance_name=name)
+
+
+def _expand_upload_paths(file_paths, glob_pattern: str | None) -> list[str]:
+    if isinstance(file_paths, str):
+        file_paths = [p.strip() for p in file_paths.split(",") if p.strip()]
+    paths = list(file_paths or [])
+    if glob_pattern:
+        matches = sorted(p for p in glob.glob(os.path.expanduser(glob_pattern), recursive=True) if os.path.isfile(p))
+        if not matches:
+            raise JiraValidationError(f"No files match '{glob_pattern}'.")
+        paths.extend(matches)
+    # Keep the first occurrence of each file.
+    return list(dict.fromkeys(os.path.expanduser(p) for p in paths))
+
+
+def upload_files_to_jira(
+    issue_key: str, file_paths: list[str] = None, glob_pattern: str = None,
+    max_workers: int = None, instance_name: str = None, **kwargs
+) -> dict:
+    """Upload several files to a Jira issue concurrently.
+
+    Every file is checked (exists, within the size limit) before anything is
+    uploaded. Uploads then run `max_workers` at a time (default
+    `attachments.upload_workers`, bounded by the instance's connection pool)
+    over the instance's pooled session.
+    """
+    key = validate_issue_key(issue_key)
+    paths = _expand_upload_paths(file_paths, glob_pattern)
+    if not paths:
+        raise JiraValidationError("Provide file_paths or glob_pattern.")
+    if len(paths) > MAX_UPLOAD_FILES:
+        raise JiraValidationError(f"Too many files: {len(paths)}. Maximum is {MAX_UPLOAD_FILES} per call.")
+    name = resolve_instance_name(instance_name)
+    client = get_jira_client(name)
+    workers = max(1, min(int(max_workers or settings.attachment_upload_workers),
+                         settings.get_http_settings(name).pool_maxsize))
+    try:
+        limit = get_upload_limit(client, name)
+        problems = []
+        for path in paths:
+            try:
+                _check_upload_size(path, _validate_upload_file(path), limit)
+            except JiraValidationError as e:
+                problems.append(str(e))
+        if problems:
+            raise JiraValidationError("Nothing was uploaded. " + " ".join(problems))
+
+        started = time.monotonic()
+        outcomes = map_concurrently(lambda p: stream_attachment(client, key, p), paths, workers)
+        elapsed = time.monotonic() - started
+        invalidate_issue(name, key)
+
+        files = []
+        for path, (result, error) in zip(paths, outcomes):
+            if error is None:
+                files.append(dict({"file_path": path, "status": "ok"}, **result))
+            else:
+                files.append({
+                    "file_path": path, "filename": os.path.basename(path),
+                    "size": os.path.getsize(path), "status": "error", "error": str(error),
+                })
+        uploaded = [f for f in files if f["status"] == "ok"]
+        total_bytes = sum(f["size"] for f in uploaded)
         return {
-            "key": key, "instance": name, "filename": filename,
-            "size": file_size,
-            "message": f"Successfully uploaded {filename} to {key}",
+            "key": key, "instance": name, "files": files,
+            "uploaded": len(uploaded), "failed": len(files) - len(uploaded),
+            "total_bytes": total_bytes, "max_workers": workers,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_mb_s": round(total_bytes / (1024 * 1024) / elapsed, 2) if elapsed > 0 else None,
         }
     except JiraError:
         raise
     except Exception as e:
-        raise JiraApiError(f"Failed to upload file to {key}: {e}", instance_name=name)
+        raise JiraApiError(f"Failed to upload files to {key}: {e}", instance_name=name)
 
 
 def list_issue_attachments(issue_key: str, instance_name: str = None, **kwargs) -> dict:
@@ -47,18 +281,8 @@ def list_issue_attachments(issue_key: str, instance_name: str = None, **kwargs)
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        issue = client.issue(key, fields="attachment")
-        attachments_raw = issue.get("fields", {}).get("attachment", [])
-        attachments = []
-        for a in attachments_raw:
-            attachments.append({
-                "id": a.get("id", ""),
-                "filename": a.get("filename", ""),
-                "size": a.get("size", 0),
-                "mime_type": a.get("mimeType", ""),
-                "created": a.get("created", ""),
-                "author": a.get("author", {}).get("displayName", "") if a.get("author") else "",
-            })
+        issue = get_issue(client, name, key, "attachment")
+        attachments = [extract_attachment(a) for a in issue.get("fields", {}).get("attachment") or ()]
         return {"key": key, "instance": name, "attachments": attachments, "count": len(attachments)}
     except JiraError:
         raise
@@ -76,6 +300,7 @@ def delete_issue_attachment(
     client = get_jira_client(name)
     try:
         client.delete_attachment(attachment_id)
+        invalidate_field(name, "attachment")
         return {
             "attachment_id": attachment_id, "instance": name,
             "message": f"Successfully deleted attachment {attachment_id}",
@@ -83,4 +308,199 @@ def delete_issue_attachment(
     except JiraError:
         raise
     except Exception as e:
-        raise JiraApiError(f"Failed to delete attachment {attachment_id}: {e}", instance_name=name)
\ No newline at end of file
+        raise JiraApiError(f"Failed to delete attachment {attachment_id}: {e}", instance_name=name)
+
+
+def _index_key(name: str, attachment_id: str) -> str:
+    return content_key("attachment", name, str(attachment_id))
+
+
+def _is_text(mime_type: str) -> bool:
+    return mime_type.startswith("text/") or mime_type in TEXT_MIME_TYPES
+
+
+def _take(chunks, max_bytes: int | None, max_lines: int | None) -> tuple[bytes, bool]:
+    """
+    Collect bytes from `chunks` until `max_bytes` or `max_lines` lines (and
+    at most `MAX_PARTIAL_BYTES`). Returns (data, truncated).
+    """
+    limit = min(max_bytes or MAX_PARTIAL_BYTES, MAX_PARTIAL_BYTES)
+    buf = bytearray()
+    lines = 0
+    for chunk in chunks:
+        if max_lines:
+            start = 0
+            while lines < max_lines:
+                nl = chunk.find(b"\n", start)
+                if nl < 0:
+                    break
+                lines += 1
+                start = nl + 1
+            if lines >= max_lines:
+                buf += chunk[:start]
+                return bytes(buf[:limit]), True
+        buf += chunk
+        if len(buf) >= limit:
+            return bytes(buf[:limit]), True
+    return bytes(buf), False
+
+
+def _read_file_chunks(path: Path, offset: int):
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while chunk := f.read(DOWNLOAD_BLOCK_SIZE):
+            yield chunk
+
+
+def _cached_attachment(name: str, attachment_id: str) -> tuple[dict, Path] | None:
+    raw = _attachment_store.get(_index_key(name, attachment_id))
+    if raw is None:
+        return None
+    info = json.loads(raw)
+    path = _attachment_store.get_path(info["sha256"])
+    return (info, path) if path is not None else None
+
+
+def _download_to_store(client, name: str, attachment_id: str, meta: dict) -> tuple[dict, Path]:
+    """Stream an attachment into the store, hashing it on the way."""
+    _attachment_store.directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=_attachment_store.directory, prefix=".tmp-")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        response = client.session.get(meta["content"], stream=True, headers={"Accept": "*/*"})
+        try:
+            client.raise_for_status(response)
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(DOWNLOAD_BLOCK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+        finally:
+            response.close()
+        info = {
+            "sha256": digest.hexdigest(),
+            "filename": meta.get("filename", ""),
+            "size": size,
+            "mime_type": meta.get("mimeType", "application/octet-stream"),
+        }
+        path = _attachment_store.put_file(info["sha256"], Path(tmp))
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    _attachment_store.put(_index_key(name, attachment_id), json.dumps(info).encode("utf-8"))
+    return info, path
+
+
+def _fetch_range(client, meta: dict, offset: int, max_bytes: int | None, max_lines: int | None) -> dict:
+    """Read part of an attachment without downloading all of it."""
+    headers = {"Accept": "*/*"}
+    if max_bytes:
+        headers["Range"] = f"bytes={offset}-{offset + min(max_bytes, MAX_PARTIAL_BYTES) - 1}"
+    elif offset:
+        headers["Range"] = f"bytes={offset}-"
+    response = client.session.get(meta["content"], stream=True, headers=headers)
+    try:
+        client.raise_for_status(response)
+        chunks = response.iter_content(DOWNLOAD_BLOCK_SIZE)
+        ranged = response.status_code == 206
+        if offset and not ranged:
+            # Server ignored the Range header; skip to the offset ourselves.
+            chunks = _skip(chunks, offset)
+        data, truncated = _take(chunks, max_bytes, max_lines)
+    finally:
+        response.close()
+    if ranged and max_bytes:
+        truncated = offset + len(data) < meta.get("size", 0)
+    return {"data": data, "truncated": truncated, "range_request": ranged}
+
+
+def _skip(chunks, count: int):
+    for chunk in chunks:
+        if count >= len(chunk):
+            count -= len(chunk)
+            continue
+        yield chunk[count:]
+        count = 0
+
+
+def download_issue_attachment(
+    attachment_id: str, max_bytes: int = None, max_lines: int = None, offset: int = 0,
+    instance_name: str = None, **kwargs
+) -> dict:
+    """Download an attachment into the local cache, optionally returning part of it.
+
+    Without `max_bytes`/`max_lines`, the whole file is downloaded into the
+    content-addressed cache and its local `path` and SHA-256 are returned
+    (plus the text, for small text files). With them, only that slice from
+    `offset` is returned, read from the cache if present, otherwise fetched
+    with an HTTP range request (or by reading just enough of the stream).
+    """
+    if not attachment_id:
+        raise JiraValidationError("attachment_id is required.")
+    if (max_bytes is not None and int(max_bytes) <= 0) or (max_lines is not None and int(max_lines) <= 0):
+        raise JiraValidationError("max_bytes and max_lines must be positive.")
+    offset = max(int(offset or 0), 0)
+    attachment_id = str(attachment_id).strip()
+    name = resolve_instance_name(instance_name)
+    client = get_jira_client(name)
+    partial = bool(max_bytes or max_lines)
+    try:
+        cached = _cached_attachment(name, attachment_id)
+        if cached is None:
+            meta = client.get_attachment(attachment_id) or {}
+            size = int(meta.get("size", 0))
+            cacheable = _attachment_store.enabled and size <= _attachment_store.max_bytes
+            if not partial and not cacheable and not _is_text(meta.get("mimeType", "")):
+                return {
+                    "attachment_id": attachment_id, "instance": name,
+                    "filename": meta.get("filename", ""), "size": size,
+                    "mime_type": meta.get("mimeType", ""), "cached": False,
+                    "message": (
+                        "Binary attachment exceeds the local cache size and was not downloaded. "
+                        "Pass max_bytes (and offset) to read part of it."
+                    ),
+                }
+            if partial or not cacheable:
+                part = _fetch_range(client, meta, offset, max_bytes or (None if partial else INLINE_TEXT_LIMIT), max_lines)
+                response = {
+                    "attachment_id": attachment_id, "instance": name,
+                    "filename": meta.get("filename", ""), "size": size,
+                    "mime_type": meta.get("mimeType", ""), "cached": False,
+                    "offset": offset, "bytes_returned": len(part["data"]),
+                    "truncated": part["truncated"], "range_request": part["range_request"],
+                    "content": sanitize_string(part["data"].decode("utf-8", errors="replace")),
+                }
+                if not cacheable and not partial:
+                    response["message"] = (
+                        "Attachment exceeds the local cache size; returned the first bytes only. "
+                        "Pass max_bytes and offset to read further."
+                    )
+                return response
+            info, path = _download_to_store(client, name, attachment_id, meta)
+        else:
+            info, path = cached
+
+        response = {
+            "attachment_id": attachment_id, "instance": name,
+            "filename": info["filename"], "size": info["size"], "mime_type": info["mime_type"],
+            "sha256": info["sha256"], "path": str(path), "cached": cached is not None,
+        }
+        if partial:
+            data, truncated = _take(_read_file_chunks(path, offset), max_bytes, max_lines)
+            response.update({
+                "offset": offset, "bytes_returned": len(data), "truncated": truncated,
+                "content": sanitize_string(data.decode("utf-8", errors="replace")),
+            })
+        elif _is_text(info["mime_type"]) and info["size"] <= INLINE_TEXT_LIMIT:
+            response["content"] = sanitize_string(path.read_bytes().decode("utf-8", errors="replace"))
+        return response
+    except JiraError:
+        raise
+    except Exception as e:
+        raise JiraApiError(f"Failed to download attachment {attachment_id}: {e}", instance_name=name)
+
+
+def get_attachment_cache_stats() -> dict:
+    return _attachment_store.stats()
@@ -1,13 +1,41 @@
 """Issue operations: get, create, update, transition, assign."""
 
 import logging
+import time
 
+import transition_cache
+from mirror import get_mirror
+from concurrency import map_concurrently
+from issue_cache import get_issue, invalidate_issue
 from jira_client import get_jira_client, validate_issue_key, resolve_instance_name
 from exceptions import JiraError, JiraValidationError, JiraApiError
-from output_sanitizer import sanitize_string
+from field_catalog import get_field_catalog, render_field_value
+from output_budget import apply_budget
+from output_sanitizer import sanitize_value
+from tools.links import create_links, resolve_link_type
+from tools.search import fetch_all_pages
+from projection import (
+    ISSUE_DETAIL_FIELDS,
+    FULL_ISSUE_FIELDS,
+    build_fields_param,
+    extract_attachment,
+    extract_comment,
+    extract_extra_fields,
+    extract_issue_detail,
+    extract_links,
+    normalize_field_list,
+)
 
 logger = logging.getLogger(__name__)
 
+MAX_BULK_ISSUES = 500
+BULK_CHUNK_SIZE = 50  # keys per `key in (...)` search
+BULK_MAX_WORKERS = 4
+TRANSITION_MAX_WORKERS = 8
+BULK_CREATE_BATCH_SIZE = 50  # Jira's limit per issue/bulk request
+CONTEXT_FIELDS = "project,issuetype,status"
+COMMENT_PAGE_SIZE = 50
+
 
 def list_jira_projects(instance_name: str = None, **kwargs) -> dict:
     """List all projects available in the Jira instance."""
@@ -30,112 +58,245 @@ def list_jira_projects(instance_name: str = None, **kwargs) -> dict:
         raise JiraApiError(f"Failed to list projects: {e}", instance_name=name)
 
 
-def get_issue_details(issue_key: str, instance_name: str = None, **kwargs) -> dict:
-    """Get detailed information about a specific Jira issue."""
+def get_issue_details(
+    issue_key: str, instance_name: str = None, fields: list = None,
+    max_response_bytes: int = None, use_mirror: bool = True, **kwargs
+) -> dict:
+    """Get detailed information about a specific Jira issue.
+
+    Only the fields shown in the response are requested from Jira. Pass
+    `fields` to also return the raw values of additional fields by id.
+    Long text is cut to the response budget (see `output_budget`).
+
+    If the issue's project is in the local mirror and fresh, it is served
+    from there (without `fields`), with a `freshness` entry.
+    """
     key = validate_issue_key(issue_key)
     name = resolve_instance_name(instance_name)
+    mirror = get_mirror() if use_mirror and not fields else None
+    mirrored = mirror.get_issue(name, key) if mirror is not None else None
+    if mirrored is not None:
+        issue, freshness = mirrored
+        result = _extract_issue_details(issue, key, name)
+        result["freshness"] = freshness
+        return apply_budget(result, "get_issue_details", max_response_bytes)
     client = get_jira_client(name)
     try:
-        issue = client.issue(key)
-        fields = issue.get("fields", {})
-        return {
-            "key": issue.get("key", key),
-            "summary": sanitize_string(fields.get("summary", "")),
-            "status": fields.get("status", {}).get("name", "") if fields.get("status") else "",
-            "assignee": fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
-            "reporter": fields.get("reporter", {}).get("displayName", "") if fields.get("reporter") else "",
-            "priority": fields.get("priority", {}).get("name", "") if fields.get("priority") else "",
-            "issue_type": fields.get("issuetype", {}).get("name", "") if fields.get("issuetype") else "",
-            "project": fields.get("project", {}).get("key", "") if fields.get("project") else "",
-            "description": sanitize_string(fields.get("description", "")),
-            "created": fields.get("created", ""),
-            "updated": fields.get("updated", ""),
-            "labels": fields.get("labels", []),
-            "components": [c.get("name", "") for c in fields.get("components", [])],
-            "instance": name,
-        }
+        issue = get_issue(client, name, key, build_fields_param(ISSUE_DETAIL_FIELDS, fields))
+        result = _extract_issue_details(issue, key, name)
+        if fields:
+            issue_fields = issue.get("fields", {})
+            result["fields"] = extract_extra_fields(issue_fields, fields)
+        return apply_budget(result, "get_issue_details", max_response_bytes)
     except JiraError:
         raise
     except Exception as e:
         raise JiraApiError(f"Failed to get issue {key}: {e}", instance_name=name)
 
 
+def _extract_issue_details(issue: dict, key: str, name: str) -> dict:
+    """Extract the standard detail fields shared by the issue read tools."""
+    result = extract_issue_detail(issue)
+    result["key"] = result["key"] or key
+    result["instance"] = name
+    return result
+
+
+def get_issues_bulk(
+    issue_keys: list, fields: list = None, instance_name: str = None, **kwargs
+) -> dict:
+    """Fetch many issues at once using chunked `key in (...)` JQL searches.
+
+    Returns one entry per input key, in input order. Keys that are invalid,
+    missing or not visible get an `error` entry instead of failing the call.
+    """
+    if isinstance(issue_keys, str):
+        issue_keys = [k for k in issue_keys.split(",") if k.strip()]
+    if not issue_keys:
+        raise JiraValidationError("issue_keys is required.")
+    if len(issue_keys) > MAX_BULK_ISSUES:
+        raise JiraValidationError(f"At most {MAX_BULK_ISSUES} issue keys per call.")
+    name = resolve_instance_name(instance_name)
+    client = get_jira_client(name)
+
+    errors: dict[str, str] = {}
+    valid_keys = _parse_issue_keys(issue_keys, errors)
+
+    found, request_count = _search_keys(
+        client, valid_keys, build_fields_param(ISSUE_DETAIL_FIELDS, fields), errors
+    )
+
+    results = []
+    for raw_key in issue_keys:
+        try:
+            k = validate_issue_key(raw_key)
+        except JiraValidationError:
+            k = str(raw_key)
+        if k in found:
+            entry = _extract_issue_details(found[k], k, name)
+            if fields:
+                entry["fields"] = extract_extra_fields(found[k].get("fields", {}), fields)
+            results.append(entry)
+        else:
+            results.append({"key": k, "error": errors.get(k, "Issue not found or not visible.")})
+
+    found_count = sum(1 for r in results if "error" not in r)
+    return {
+        "instance": name,
+        "issues": results,
+        "count": len(results),
+        "found": found_count,
+        "errors": len(results) - found_count,
+        "requests": request_count,
+    }
+
+
+def _parse_issue_keys(issue_keys: list | str, errors: dict) -> list[str]:
+    """Validate and de-duplicate keys, recording invalid ones in `errors`."""
+    if isinstance(issue_keys, str):
+        issue_keys = [k for k in issue_keys.split(",") if k.strip()]
+    valid_keys: list[str] = []
+    for raw_key in issue_keys or []:
+        try:
+            cleaned = validate_issue_key(raw_key)
+        except JiraValidationError as e:
+            errors[str(raw_key)] = str(e)
+            continue
+        if cleaned not in valid_keys:
+            valid_keys.append(cleaned)
+    return valid_keys
+
+
+def _search_keys(client, keys: list[str], fields_param: str, errors: dict) -> tuple[dict, int]:
+    """
+    Fetch issues by key with concurrent `key in (...)` searches of
+    `BULK_CHUNK_SIZE` keys. Returns ``({key: issue}, request count)``;
+    keys that could not be fetched are recorded in `errors`.
+
+    Jira rejects the whole search with a 400 when one key does not exist or
+    is not visible (Cloud's /search/jql has no `validateQuery=warn`), so a
+    rejected chunk is split in half and retried until the bad keys are
+    isolated.
+    """
+    chunks = [keys[i:i + BULK_CHUNK_SIZE] for i in range(0, len(keys), BULK_CHUNK_SIZE)]
+
+    def fetch_chunk(chunk: list[str]) -> tuple[list[dict], dict[str, str], int]:
+        jql = f"key in ({', '.join(chunk)})"
+        try:
+            # Server/DC honours validate_query="warn" and skips missing keys.
+            result = client.jql(jql, fields=fields_param, limit=len(chunk), validate_query="warn")
+        except Exception as e:
+            if getattr(getattr(e, "response", None), "status_code", None) != 400:
+                raise
+            if len(chunk) == 1:
+                return [], {chunk[0]: "Issue not found or not visible."}, 1
+            mid = len(chunk) // 2
+            left, left_errors, left_requests = fetch_chunk(chunk[:mid])
+            right, right_errors, right_requests = fetch_chunk(chunk[mid:])
+            return left + right, {**left_errors, **right_errors}, 1 + left_requests + right_requests
+        return (result.get("issues", []) if isinstance(result, dict) else []), {}, 1
+
+    found: dict[str, dict] = {}
+    request_count = 0
+    for chunk, (outcome, error) in zip(chunks, map_concurrently(fetch_chunk, chunks, BULK_MAX_WORKERS)):
+        if error is not None:
+            request_count += 1
+            for k in chunk:
+                errors[k] = f"Failed to fetch: {error}"
+            continue
+        issues, chunk_errors, requests = outcome
+        request_count += requests
+        errors.update(chunk_errors)
+        for issue in issues:
+            found[issue.get("key", "")] = issue
+    return found, request_count
+
+
+def _fetch_comment_page(client, key: str, offset: int, limit: int, newest_first: bool) -> dict:
+    """One page of an issue's comments, ordered by creation time."""
+    url = f"{client.resource_url('issue')}/{key}/comment"
+    page = client.get(url, params={
+        "startAt": offset, "maxResults": limit,
+        "orderBy": "-created" if newest_first else "created",
+    }) or {}
+    raw_comments = page.get("comments", []) if isinstance(page, dict) else page
+    comments = [extract_comment(c) for c in raw_comments[:limit]]
+    total = page.get("total", offset + len(comments)) if isinstance(page, dict) else offset + len(comments)
+    end = offset + len(comments)
+    return {
+        "comments": comments,
+        "comment_count": len(comments),
+        "comment_total": total,
+        "next_comment_offset": end if comments and end < total else None,
+    }
+
+
 def get_full_issue_details(
     issue_key: str, instance_name: str = None, include_comments: bool = True,
-    raw_data: bool = False, format: str = "structured", **kwargs
+    raw_data: bool = False, format: str = "structured", fields: list = None,
+    comment_limit: int = COMMENT_PAGE_SIZE, comment_offset: int = 0, newest_first: bool = False,
+    max_response_bytes: int = None, **kwargs
 ) -> dict:
-    """Get comprehensive information about a Jira issue with formatting options."""
+    """Get comprehensive information about a Jira issue with formatting options.
+
+    Structured output requests only the fields it renders (plus `fields`, if
+    given). `raw_data=True` returns every field unless `fields` is given.
+    `fields` may name fields by id or display name; custom fields among them
+    are also rendered under `custom_fields`, keyed by display name.
+
+    Comments are fetched one page at a time (`comment_limit` from
+    `comment_offset`, oldest first unless `newest_first`) alongside the
+    issue. Pass the returned `next_comment_offset` as `comment_offset` to
+    continue.
+
+    The response, including `raw_data`, is fitted to the tool's size budget:
+    the longest strings are truncated and listed under `elided` with cursors
+    for `get_elided_content`.
+    """
     key = validate_issue_key(issue_key)
+    comment_limit = int(comment_limit or COMMENT_PAGE_SIZE)
+    comment_offset = int(comment_offset or 0)
+    if comment_limit < 1 or comment_offset < 0:
+        raise JiraValidationError("comment_limit must be positive and comment_offset non-negative.")
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        issue = client.issue(key)
+        catalog = None
+        if fields:
+            catalog = get_field_catalog(client, name)
+            fields = [catalog.resolve(f) for f in normalize_field_list(fields)]
+
         if raw_data:
-            return {"key": key, "raw_data": issue, "instance": name}
-
-        fields = issue.get("fields", {})
-        result = {
-            "key": issue.get("key", key),
-            "summary": sanitize_string(fields.get("summary", "")),
-            "status": fields.get("status", {}).get("name", "") if fields.get("status") else "",
-            "assignee": fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
-            "reporter": fields.get("reporter", {}).get("displayName", "") if fields.get("reporter") else "",
-            "priority": fields.get("priority", {}).get("name", "") if fields.get("priority") else "",
-            "issue_type": fields.get("issuetype", {}).get("name", "") if fields.get("issuetype") else "",
-            "project": fields.get("project", {}).get("key", "") if fields.get("project") else "",
-            "description": sanitize_string(fields.get("description", "")),
-            "created": fields.get("created", ""),
-            "updated": fields.get("updated", ""),
-            "labels": fields.get("labels", []),
-            "components": [c.get("name", "") for c in fields.get("components", [])],
-            "instance": name,
-        }
+            issue = client.issue(key, fields=build_fields_param((), fields) or "*all")
+            return apply_budget(
+                {"key": key, "raw_data": issue, "instance": name}, "get_full_issue_details", max_response_bytes
+            )
 
+        requests = [lambda: get_issue(client, name, key, build_fields_param(FULL_ISSUE_FIELDS, fields))]
         if include_comments:
-            comments_data = client.issue_get_comments(key)
-            comments = []
-            raw_comments = comments_data.get("comments", []) if isinstance(comments_data, dict) else comments_data
-            for c in raw_comments:
-                comments.append({
-                    "id": c.get("id", ""),
-                    "author": c.get("author", {}).get("displayName", "") if c.get("author") else "",
-                    "body": sanitize_string(c.get("body", "")),
-                    "created": c.get("created", ""),
-                    "updated": c.get("updated", ""),
-                })
-            result["comments"] = comments
-            result["comment_count"] = len(comments)
-
-        # Add links
-        issue_links = fields.get("issuelinks", [])
-        links = []
-        for link in issue_links:
-            link_info = {"type": link.get("type", {}).get("name", "")}
-            if "outwardIssue" in link:
-                link_info["direction"] = "outward"
-                link_info["issue_key"] = link["outwardIssue"].get("key", "")
-                link_info["summary"] = sanitize_string(link["outwardIssue"].get("fields", {}).get("summary", ""))
-            elif "inwardIssue" in link:
-                link_info["direction"] = "inward"
-                link_info["issue_key"] = link["inwardIssue"].get("key", "")
-                link_info["summary"] = sanitize_string(link["inwardIssue"].get("fields", {}).get("summary", ""))
-            links.append(link_info)
-        result["links"] = links
-
-        # Add attachments
-        attachments = fields.get("attachment", [])
-        result["attachments"] = [
-            {
-                "id": a.get("id", ""),
-                "filename": a.get("filename", ""),
-                "size": a.get("size", 0),
-                "created": a.get("created", ""),
-                "author": a.get("author", {}).get("displayName", "") if a.get("author") else "",
+            requests.append(lambda: _fetch_comment_page(client, key, comment_offset, comment_limit, newest_first))
+        outcomes = map_concurrently(lambda request: request(), requests, len(requests))
+        for _, error in outcomes:
+            if error is not None:
+                raise error
+        issue = outcomes[0][0]
+        issue_fields = issue.get("fields", {})
+        result = _extract_issue_details(issue, key, name)
+
+        if include_comments:
+            result.update(outcomes[1][0])
+
+        result["links"] = extract_links(issue_fields.get("issuelinks"))
+        result["attachments"] = [extract_attachment(a) for a in issue_fields.get("attachment") or ()]
+        if fields:
+            result["fields"] = extract_extra_fields(issue_fields, fields)
+            result["custom_fields"] = {
+                catalog.name(f): sanitize_value(render_field_value(issue_fields.get(f), catalog.schema(f)))
+                for f in fields
+                if catalog.by_id.get(f, {}).get("custom", False)
             }
-            for a in attachments
-        ]
 
-        return result
+        return apply_budget(result, "get_full_issue_details", max_response_bytes)
     except JiraError:
         raise
     except Exception as e:
@@ -145,37 +306,26 @@ def get_full_issue_details(
 def create_jira_ticket(
     project_key: str, summary: str, issue_type: str = "Task",
     description: str = "", priority: str = None, assignee: str = None,
-    labels: list = None, components: list = None,
+    labels: list = None, components: list = None, custom_fields: dict = None,
     instance_name: str = None, **kwargs
 ) -> dict:
-    """Create a new Jira ticket."""
+    """Create a new Jira ticket.
+
+    `custom_fields` maps field display names or ids to raw values, e.g.
+    `{"Story Points": 3}`.
+    """
     if not project_key or not summary:
         raise JiraValidationError("project_key and summary are required.")
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        fields = {
-            "project": {"key": project_key.strip().upper()},
-            "summary": summary.strip(),
-            "issuetype": {"name": issue_type},
-        }
-        if description:
-            fields["description"] = description
-        if priority:
-            fields["priority"] = {"name": priority}
-        if assignee:
-            fields["assignee"] = {"name": assignee}
-        if labels:
-            fields["labels"] = labels
-        if components:
-            fields["components"] = [{"name": c} for c in components]
-
-        # Add any extra fields from kwargs
-        for k, v in kwargs.items():
-            if k.startswith("customfield_"):
-                fields[k] = v
-
+        fields = _build_create_fields(client, name, dict(
+            kwargs, project_key=project_key, summary=summary, issue_type=issue_type,
+            description=description, priority=priority, assignee=assignee,
+            labels=labels, components=components, custom_fields=custom_fields,
+        ))
         result = client.issue_create(fields=fields)
+        invalidate_issue(name, result.get("key", ""))
         return {
             "key": result.get("key", ""),
             "id": result.get("id", ""),
@@ -189,12 +339,194 @@ def create_jira_ticket(
         raise JiraApiError(f"Failed to create issue: {e}", instance_name=name)
 
 
+def _build_create_fields(client, name: str, spec: dict) -> dict:
+    """Build the `fields` payload for a new issue from `create_jira_ticket` arguments."""
+    project_key = spec.get("project_key")
+    summary = spec.get("summary")
+    if not project_key or not summary:
+        raise JiraValidationError("project_key and summary are required.")
+    fields = {
+        "project": {"key": project_key.strip().upper()},
+        "summary": summary.strip(),
+        "issuetype": {"name": spec.get("issue_type") or "Task"},
+    }
+    if spec.get("description"):
+        fields["description"] = spec["description"]
+    if spec.get("priority"):
+        fields["priority"] = {"name": spec["priority"]}
+    if spec.get("assignee"):
+        fields["assignee"] = {"name": spec["assignee"]}
+    if spec.get("labels"):
+        fields["labels"] = spec["labels"]
+    if spec.get("components"):
+        fields["components"] = [{"name": c} for c in spec["components"]]
+
+    # Add any extra fields given by id
+    for k, v in spec.items():
+        if k.startswith("customfield_"):
+            fields[k] = v
+    if spec.get("custom_fields"):
+        fields.update(get_field_catalog(client, name).resolve_values(spec["custom_fields"]))
+    return fields
+
+
+def _bulk_create_error(error: dict) -> str:
+    """Flatten one entry of a bulk-create response's `errors` list."""
+    element = error.get("elementErrors", {}) or {}
+    messages = list(element.get("errorMessages", []) or [])
+    messages += [f"{field}: {msg}" for field, msg in (element.get("errors", {}) or {}).items()]
+    return "; ".join(messages) or f"HTTP {error.get('status', '')}".strip()
+
+
+def _create_batch(client, payloads: list[dict]) -> dict:
+    """
+    POST one `issue/bulk` batch. Jira answers 400 when every element fails;
+    that body has the same shape as a partial success, so it is returned too.
+    """
+    try:
+        return client.create_issues(payloads) or {}
+    except Exception as e:
+        response = getattr(e, "response", None)
+        if getattr(response, "status_code", None) == 400:
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and "errors" in body:
+                return body
+        raise
+
+
+def create_issues_bulk(
+    issues: list, project_key: str = None, instance_name: str = None, **kwargs
+) -> dict:
+    """Create many issues with Jira's bulk-create endpoint.
+
+    Each entry of `issues` takes the `create_jira_ticket` arguments
+    (`project_key` defaults to the top-level one) plus optional `links`:
+    `[{"issue_key": "PROJ-1", "link_type": "Blocks"}]`. A link target of
+    `"#3"` refers to the issue created from `issues[3]`. Issues are sent in
+    batches of 50, batches run concurrently, and links are created in
+    parallel once every batch is done.
+    """
+    if not issues or not isinstance(issues, list):
+        raise JiraValidationError("issues must be a non-empty list.")
+    if len(issues) > MAX_BULK_ISSUES:
+        raise JiraValidationError(f"At most {MAX_BULK_ISSUES} issues per call.")
+    name = resolve_instance_name(instance_name)
+    client = get_jira_client(name)
+    started = time.monotonic()
+    try:
+        results: list[dict] = [{"index": i} for i in range(len(issues))]
+        payloads: list[tuple[int, dict]] = []
+        for i, spec in enumerate(issues):
+            if not isinstance(spec, dict):
+                results[i]["error"] = "Issue spec must be an object."
+                continue
+            results[i]["summary"] = spec.get("summary", "")
+            links = spec.get("links")
+            if links is not None and (
+                not isinstance(links, list) or not all(isinstance(link, dict) for link in links)
+            ):
+                # Checked before creating anything: a bad link spec found after
+                # the batch has run would lose the created keys.
+                results[i]["error"] = 'links must be a list of {"issue_key": ..., "link_type": ...} objects.'
+                continue
+            try:
+                fields = _build_create_fields(client, name, dict(
+                    {"project_key": project_key}, **{k: v for k, v in spec.items() if v is not None}
+                ))
+            except JiraValidationError as e:
+                results[i]["error"] = str(e)
+                continue
+            payloads.append((i, {"fields": fields}))
+
+        batches = [payloads[j:j + BULK_CREATE_BATCH_SIZE] for j in range(0, len(payloads), BULK_CREATE_BATCH_SIZE)]
+
+        def send(batch: list[tuple[int, dict]]) -> dict:
+            return _create_batch(client, [payload for _, payload in batch])
+
+        for batch, (response, error) in zip(batches, map_concurrently(send, batches, BULK_MAX_WORKERS)):
+            if error is not None:
+                for i, _ in batch:
+                    results[i]["error"] = f"Batch failed: {error}"
+                continue
+            failed = {}
+            for err in response.get("errors", []) or []:
+                failed[err.get("failedElementNumber")] = _bulk_create_error(err)
+            created = iter(response.get("issues", []) or [])
+            for position, (i, _) in enumerate(batch):
+                if position in failed:
+                    results[i]["error"] = failed[position]
+                    continue
+                issue = next(created, None)
+                if issue is None:
+                    results[i]["error"] = "No result returned for this issue."
+                else:
+                    results[i].update({"key": issue.get("key", ""), "id": issue.get("id", "")})
+
+        link_pairs = []
+        link_errors = []
+        for i, spec in enumerate(issues):
+            if not isinstance(spec, dict) or not spec.get("links") or "key" not in results[i]:
+                continue
+            for link_spec in spec["links"]:
+                target = str(link_spec.get("issue_key", "")).strip()
+                if target.startswith("#"):
+                    ref = int(target[1:]) if target[1:].isdigit() else -1
+                    target = results[ref].get("key", "") if 0 <= ref < len(results) else ""
+                    if not target:
+                        link_errors.append(f"{results[i]['key']}: link target {link_spec.get('issue_key')} was not created")
+                        continue
+                if target:
+                    try:
+                        link_type, reverse = resolve_link_type(client, name, link_spec.get("link_type", "Relates"))
+                    except Exception as e:
+                        link_errors.append(f"{results[i]['key']}: {e}")
+                        continue
+                    ends = (target.upper(), results[i]["key"]) if reverse else (results[i]["key"], target.upper())
+                    link_pairs.append((*ends, link_type))
+
+        links_created = 0
+        for (from_key, to_key, link_type), (_, error) in zip(link_pairs, create_links(client, name, link_pairs)):
+            if error is None:
+                links_created += 1
+            else:
+                link_errors.append(f"Failed to link {from_key} to {to_key}: {error}")
+
+        for r in results:
+            if "key" in r:
+                invalidate_issue(name, r["key"])
+        created_count = sum(1 for r in results if "key" in r)
+        response = {
+            "instance": name,
+            "issues": results,
+            "count": len(results),
+            "created": created_count,
+            "failed": len(results) - created_count,
+            "requests": len(batches),
+            "links_created": links_created,
+            "elapsed_seconds": round(time.monotonic() - started, 3),
+        }
+        if link_errors:
+            response["link_errors"] = link_errors
+        return response
+    except JiraError:
+        raise
+    except Exception as e:
+        raise JiraApiError(f"Failed to create issues: {e}", instance_name=name)
+
+
 def update_jira_issue(
     issue_key: str, summary: str = None, description: str = None,
     priority: str = None, assignee: str = None, labels: list = None,
-    components: list = None, instance_name: str = None, **kwargs
+    components: list = None, custom_fields: dict = None,
+    instance_name: str = None, **kwargs
 ) -> dict:
-    """Update an existing Jira issue with new field values."""
+    """Update an existing Jira issue with new field values.
+
+    `custom_fields` maps field display names or ids to raw values.
+    """
     key = validate_issue_key(issue_key)
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
@@ -217,11 +549,14 @@ def update_jira_issue(
         for k, v in kwargs.items():
             if k.startswith("customfield_"):
                 fields[k] = v
+        if custom_fields:
+            fields.update(get_field_catalog(client, name).resolve_values(custom_fields))
 
         if not fields:
             raise JiraValidationError("No fields to update. Provide at least one field.")
 
         client.issue_update(key, fields=fields)
+        invalidate_issue(name, key)
         return {
             "key": key,
             "instance": name,
@@ -238,46 +573,196 @@ def transition_jira_issue(
     issue_key: str, transition_name: str = None, transition_id: str = None,
     instance_name: str = None, **kwargs
 ) -> dict:
-    """Transition a Jira issue through its workflow."""
+    """Transition a Jira issue through its workflow.
+
+    When the issue's status and the transitions available from it are
+    cached, the transition is posted directly (one request). Otherwise, or
+    if Jira rejects the cached transition with a 400, the issue's transitions
+    are fetched first.
+    """
     key = validate_issue_key(issue_key)
     if not transition_name and not transition_id:
         raise JiraValidationError("Either transition_name or transition_id is required.")
+    if transition_id is not None:
+        transition_id = str(transition_id)
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        transitions = client.get_issue_transitions(key)
         target = None
+        context = transition_cache.issue_context(name, key)
+        if context:
+            cached = transition_cache.lookup(name, *context)
+            if cached:
+                target = transition_cache.find_transition(cached, transition_name, transition_id)
+        from_cache = target is not None
+
+        if target is not None:
+            try:
+                client.set_issue_status_by_transition_id(key, target["id"])
+            except Exception as e:
+                if getattr(getattr(e, "response", None), "status_code", None) != 400:
+                    raise
+                logger.info(f"Cached transition '{target['name']}' rejected for {key}, refetching")
+                transition_cache.forget_issue(name, key)
+                target = None
+                from_cache = False
+
+        if target is None:
+            issue = client.issue(key, fields=CONTEXT_FIELDS, expand="transitions")
+            context, transitions = transition_cache.learn_from_issue(name, issue)
+            target = transition_cache.find_transition(transitions, transition_name, transition_id)
+            if not target:
+                available = [t["name"] for t in transitions]
+                raise JiraValidationError(
+                    f"Transition not found. Available transitions: {available}"
+                )
+            client.set_issue_status_by_transition_id(key, target["id"])
+
+        transition_cache.remember_issue(name, key, context[0], context[1], target["to_status"])
+        invalidate_issue(name, key)
+        return {
+            "key": key,
+            "instance": name,
+            "transition": target["name"],
+            "transition_id": target["id"],
+            "to_status": target["to_status"],
+            "from_cache": from_cache,
+            "message": f"Successfully transitioned {key} via '{target['name']}'",
+        }
+    except JiraError:
+        raise
+    except Exception as e:
+        raise JiraApiError(f"Failed to transition issue {key}: {e}", instance_name=name)
+
 
-        if transition_id:
-            for t in transitions:
-                if str(t.get("id")) == str(transition_id):
-                    target = t
-                    break
-        elif transition_name:
-            transition_lower = transition_name.lower()
-            for t in transitions:
-                if t.get("name", "").lower() == transition_lower:
-                    target = t
-                    break
-
-        if not target:
-            available = [t.get("name", "") for t in transitions]
-            raise JiraValidationError(
-                f"Transition not found. Available transitions: {available}"
+def transition_issues_bulk(
+    transition_name: str = None, issue_keys: list = None, jql: str = None,
+    transition_id: str = None, instance_name: str = None, **kwargs
+) -> dict:
+    """Transition many issues, selected by `issue_keys` or `jql`.
+
+    Issues are fetched in bulk with their project, type and status, the
+    available transitions are resolved once per distinct (project, issue
+    type, status), and transitions run on a bounded worker pool. Returns one
+    row per issue; a failure on one issue does not stop the others.
+    """
+    if not transition_name and not transition_id:
+        raise JiraValidationError("Either transition_name or transition_id is required.")
+    if bool(issue_keys) == bool(jql and jql.strip()):
+        raise JiraValidationError("Provide exactly one of issue_keys or jql.")
+    if transition_id is not None:
+        transition_id = str(transition_id)
+    name = resolve_instance_name(instance_name)
+    client = get_jira_client(name)
+    started = time.monotonic()
+    try:
+        errors: dict[str, str] = {}
+        if jql:
+            found_issues, paging = fetch_all_pages(client, jql, CONTEXT_FIELDS, MAX_BULK_ISSUES)
+            if paging.get("truncated"):
+                raise JiraValidationError(
+                    f"JQL matches more than {MAX_BULK_ISSUES} issues; narrow the query."
+                )
+            keys = [i.get("key", "") for i in found_issues]
+            found = {i.get("key", ""): i for i in found_issues}
+        else:
+            keys = _parse_issue_keys(issue_keys, errors)
+            if len(keys) > MAX_BULK_ISSUES:
+                raise JiraValidationError(f"At most {MAX_BULK_ISSUES} issue keys per call.")
+            found, _ = _search_keys(client, keys, CONTEXT_FIELDS, errors)
+
+        contexts: dict[str, tuple[str, str, str]] = {}
+        for k in keys:
+            if k not in found:
+                continue
+            f = found[k].get("fields", {})
+            contexts[k] = (
+                (f.get("project") or {}).get("key", ""),
+                (f.get("issuetype") or {}).get("name", ""),
+                (f.get("status") or {}).get("name", ""),
             )
 
-        client.set_issue_status_by_transition_id(key, target["id"])
+        # One transitions lookup per distinct workflow position.
+        groups: dict[tuple, str] = {}
+        for k, ctx in contexts.items():
+            groups.setdefault(ctx, k)
+        available: dict[tuple, list[dict]] = {}
+        to_fetch = []
+        for ctx, sample_key in groups.items():
+            cached = transition_cache.lookup(name, *ctx)
+            if cached is None:
+                to_fetch.append(sample_key)
+            else:
+                available[ctx] = cached
+
+        def fetch_transitions(sample_key: str) -> list[dict]:
+            issue = client.issue(sample_key, fields=CONTEXT_FIELDS, expand="transitions")
+            return transition_cache.learn_from_issue(name, issue)[1]
+
+        for sample_key, (transitions, error) in zip(
+            to_fetch, map_concurrently(fetch_transitions, to_fetch, BULK_MAX_WORKERS)
+        ):
+            if error is None:
+                available[contexts[sample_key]] = transitions
+
+        targets: dict[str, dict] = {}
+        for k, ctx in contexts.items():
+            if ctx not in available:
+                errors[k] = f"Could not load transitions for status '{ctx[2]}'."
+                continue
+            target = transition_cache.find_transition(available[ctx], transition_name, transition_id)
+            if target is None:
+                names = [t["name"] for t in available[ctx]]
+                errors[k] = f"Transition not available from '{ctx[2]}'. Available: {names}"
+            else:
+                targets[k] = target
+
+        def apply(k: str) -> float:
+            t0 = time.monotonic()
+            client.set_issue_status_by_transition_id(k, targets[k]["id"])
+            return round((time.monotonic() - t0) * 1000, 1)
+
+        to_apply = [k for k in keys if k in targets]
+        timings: dict[str, float] = {}
+        for k, (elapsed_ms, error) in zip(to_apply, map_concurrently(apply, to_apply, TRANSITION_MAX_WORKERS)):
+            if error is not None:
+                errors[k] = f"Transition failed: {error}"
+                transition_cache.forget_issue(name, k)
+                continue
+            timings[k] = elapsed_ms
+            ctx = contexts[k]
+            transition_cache.remember_issue(name, k, ctx[0], ctx[1], targets[k]["to_status"])
+            invalidate_issue(name, k)
+
+        rows = []
+        for k in keys + [k for k in errors if k not in keys]:
+            row = {"key": k, "from_status": contexts.get(k, ("", "", ""))[2]}
+            if k in timings:
+                row.update({
+                    "status": "ok",
+                    "to_status": targets[k]["to_status"],
+                    "transition_id": targets[k]["id"],
+                    "elapsed_ms": timings[k],
+                })
+            else:
+                row.update({"status": "error", "error": errors.get(k, "Issue not found or not visible.")})
+            rows.append(row)
+
+        succeeded = len(timings)
         return {
-            "key": key,
             "instance": name,
-            "transition": target.get("name", ""),
-            "transition_id": target.get("id", ""),
-            "message": f"Successfully transitioned {key} via '{target.get('name', '')}'",
+            "transition": transition_name or transition_id,
+            "results": rows,
+            "count": len(rows),
+            "succeeded": succeeded,
+            "failed": len(rows) - succeeded,
+            "transition_lookups": len(to_fetch),
+            "elapsed_seconds": round(time.monotonic() - started, 3),
         }
     except JiraError:
         raise
     except Exception as e:
-        raise JiraApiError(f"Failed to transition issue {key}: {e}", instance_name=name)
+        raise JiraApiError(f"Failed to transition issues: {e}", instance_name=name)
 
 
 def change_issue_assignee(
@@ -291,6 +776,7 @@ def change_issue_assignee(
     client = get_jira_client(name)
     try:
         client.issue_update(key, fields={"assignee": {"name": assignee}})
+        invalidate_issue(name, key)
         return {
             "key": key,
             "instance": name,
@@ -311,20 +797,22 @@ def list_jira_instances(**kwargs) -> dict:
 
 
 def get_custom_field_mappings(instance_name: str = None, **kwargs) -> dict:
-    """Get mappings between Jira custom field IDs and their names."""
+    """Get mappings between Jira custom field IDs and their names.
+
+    The field catalog is cached per instance (`cache.field_catalog_ttl_seconds`).
+    """
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        all_fields = client.get_all_fields()
+        catalog = get_field_catalog(client, name)
         mappings = []
-        for field in all_fields:
-            if field.get("custom", False):
-                mappings.append({
-                    "id": field.get("id", ""),
-                    "name": field.get("name", ""),
-                    "type": field.get("schema", {}).get("type", "") if field.get("schema") else "",
-                    "custom_type": field.get("schema", {}).get("custom", "") if field.get("schema") else "",
-                })
+        for field in catalog.custom_fields():
+            mappings.append({
+                "id": field.get("id", ""),
+                "name": field.get("name", ""),
+                "type": field.get("schema", {}).get("type", "") if field.get("schema") else "",
+                "custom_type": field.get("schema", {}).get("custom", "") if field.get("schema") else "",
+            })
         return {"instance": name, "custom_fields": mappings, "count": len(mappings)}
     except JiraError:
         raise
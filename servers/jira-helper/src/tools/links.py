@@ -1,12 +1,95 @@
 """Issue link operations: create, query, and bulk-link on creation."""
 
 import logging
+import time
 
+from cache import TTLCache
+from concurrency import map_concurrently
+from config import settings
+from issue_cache import get_issue, invalidate_issue
 from jira_client import get_jira_client, validate_issue_key, resolve_instance_name
 from exceptions import JiraError, JiraValidationError, JiraApiError
+from projection import ISSUE_LINK_FIELDS, build_fields_param, extract_links
 
 logger = logging.getLogger(__name__)
 
+LINK_MAX_WORKERS = 8
+
+# instance -> {lower-cased name or description: (link type name, reversed)}
+_link_types = TTLCache(max_entries=32, ttl=settings.link_types_ttl)
+settings.add_reload_listener(lambda names: _link_types.invalidate(lambda k: k in names))
+
+
+def _get_link_type_index(client, name: str) -> dict[str, tuple[str, bool]] | None:
+    """Get the cached link type index for an instance, or None if unavailable."""
+    index = _link_types.get(name)
+    if index is None:
+        try:
+            link_types = client.get_issue_link_types() or []
+        except Exception as e:
+            logger.warning(f"Could not load issue link types for '{name}', skipping validation: {e}")
+            return None
+        index = {}
+        # Names and outward descriptions first, so a symmetric type
+        # ("relates to" both ways) is never treated as reversed.
+        for lt in link_types:
+            for label in (lt.get("name"), lt.get("outward")):
+                if label:
+                    index.setdefault(label.strip().lower(), (lt["name"], False))
+        for lt in link_types:
+            if lt.get("inward"):
+                index.setdefault(lt["inward"].strip().lower(), (lt["name"], True))
+        _link_types.put(name, index)
+    return index
+
+
+def resolve_link_type(client, name: str, link_type: str) -> tuple[str, bool]:
+    """
+    Resolve a link type by name or inward/outward description (e.g.
+    "blocks", "is blocked by") to `(canonical name, reversed)`.
+
+    `reversed` is True when an inward description matched: "A is blocked
+    by B" is the `Blocks` link from B to A, so the caller swaps the ends.
+
+    Raises:
+        JiraValidationError: The instance has no such link type.
+    """
+    index = _get_link_type_index(client, name)
+    if index is None:
+        return link_type, False
+    resolved = index.get(str(link_type).strip().lower())
+    if resolved is None:
+        available = sorted({type_name for type_name, _ in index.values()})
+        raise JiraValidationError(f"Unknown link type '{link_type}'. Available: {available}")
+    return resolved
+
+
+def get_link_type_cache_stats() -> dict:
+    return _link_types.stats()
+
+
+def create_links(client, name: str, links: list[tuple[str, str, str]]) -> list[tuple]:
+    """
+    Create `(from key, to key, link type)` links concurrently, reading
+    "from <outward description> to" (e.g. "A blocks B").
+
+    Returns ``(elapsed_ms, None)`` or ``(None, error)`` per link, in input
+    order. Both ends of each created link are dropped from the issue cache.
+    """
+    def create(link: tuple[str, str, str]) -> float:
+        from_key, to_key, link_type = link
+        started = time.monotonic()
+        client.create_issue_link({
+            "type": {"name": link_type},
+            "inwardIssue": {"key": from_key},
+            "outwardIssue": {"key": to_key},
+        })
+        invalidate_issue(name, from_key)
+        invalidate_issue(name, to_key)
+        return round((time.monotonic() - started) * 1000, 1)
+
+    return map_concurrently(create, links, LINK_MAX_WORKERS)
+
 
 def create_issue_link(
     from_issue_key: str, to_issue_key: str, link_type: str = "Relates",
@@ -24,6 +107,8 @@ def create_issue_link(
             "outwardIssue": {"key": to_key},
         }
         client.create_issue_link(link_data)
+        invalidate_issue(name, from_key)
+        invalidate_issue(name, to_key)
         return {
             "from_issue": from_key, "to_issue": to_key, "link_type": link_type,
             "instance": name, "message": f"Successfully linked {from_key} -> {to_key} ({link_type})",
@@ -52,6 +137,8 @@ def create_epic_story_link(epic_key: str, story_key: str, instance_name: str = N
             # Fall back to generic "Relates" if Epic-Story Link type not available
             link_data["type"]["name"] = "Relates"
             client.create_issue_link(link_data)
+        invalidate_issue(name, e_key)
+        invalidate_issue(name, s_key)
         return {
             "epic_key": e_key, "story_key": s_key,
             "instance": name, "message": f"Successfully linked epic {e_key} to story {s_key}",
@@ -68,24 +155,8 @@ def get_issue_links(issue_key: str, instance_name: str = None, **kwargs) -> dict
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        issue = client.issue(key)
-        issue_links = issue.get("fields", {}).get("issuelinks", [])
-        links = []
-        for link in issue_links:
-            link_info = {"type": link.get("type", {}).get("name", "")}
-            if "outwardIssue" in link:
-                linked = link["outwardIssue"]
-                link_info["direction"] = "outward"
-                link_info["issue_key"] = linked.get("key", "")
-                link_info["summary"] = linked.get("fields", {}).get("summary", "")
-                link_info["status"] = linked.get("fields", {}).get("status", {}).get("name", "") if linked.get("fields", {}).get("status") else ""
-            elif "inwardIssue" in link:
-                linked = link["inwardIssue"]
-                link_info["direction"] = "inward"
-                link_info["issue_key"] = linked.get("key", "")
-                link_info["summary"] = linked.get("fields", {}).get("summary", "")
-                link_info["status"] = linked.get("fields", {}).get("status", {}).get("name", "") if linked.get("fields", {}).get("status") else ""
-            links.append(link_info)
+        issue = get_issue(client, name, key, build_fields_param(ISSUE_LINK_FIELDS))
+        links = extract_links(issue.get("fields", {}).get("issuelinks"))
         return {"key": key, "instance": name, "links": links, "count": len(links)}
     except JiraError:
         raise
@@ -98,12 +169,24 @@ def create_issue_with_links(
     description: str = "", links: list = None,
     instance_name: str = None, **kwargs
 ) -> dict:
-    """Create a new Jira issue with links to other issues."""
+    """Create a new Jira issue with links to other issues.
+
+    Link types are validated against the instance's cached link type list
+    before the issue is created. Links are then created concurrently, and
+    each is reported with its own timing or error.
+    """
     if not project_key or not summary:
         raise JiraValidationError("project_key and summary are required.")
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
+        link_specs = []
+        for link_spec in links or []:
+            target_key = str(link_spec.get("issue_key", "")).strip().upper()
+            if target_key:
+                link_type, reverse = resolve_link_type(client, name, link_spec.get("link_type", "Relates"))
+                link_specs.append((target_key, link_type, reverse))
+
         fields = {
             "project": {"key": project_key.strip().upper()},
             "summary": summary.strip(),
@@ -114,28 +197,29 @@ def create_issue_with_links(
 
         result = client.issue_create(fields=fields)
         new_key = result.get("key", "")
+        invalidate_issue(name, new_key)
 
         links_created = 0
         link_errors = []
-        if links:
-            for link_spec in links:
-                target_key = link_spec.get("issue_key", "")
-                link_type = link_spec.get("link_type", "Relates")
-                if target_key:
-                    try:
-                        link_data = {
-                            "type": {"name": link_type},
-                            "inwardIssue": {"key": new_key},
-                            "outwardIssue": {"key": target_key.strip().upper()},
-                        }
-                        client.create_issue_link(link_data)
-                        links_created += 1
-                    except Exception as le:
-                        link_errors.append(f"Failed to link to {target_key}: {le}")
+        link_results = []
+        pairs = [
+            (target_key, new_key, link_type) if reverse else (new_key, target_key, link_type)
+            for target_key, link_type, reverse in link_specs
+        ]
+        for (target_key, link_type, _), (elapsed_ms, error) in zip(link_specs, create_links(client, name, pairs)):
+            entry = {"issue_key": target_key, "link_type": link_type}
+            if error is None:
+                links_created += 1
+                entry["elapsed_ms"] = elapsed_ms
+            else:
+                entry["error"] = str(error)
+                link_errors.append(f"Failed to link to {target_key}: {error}")
+            link_results.append(entry)
 
         response = {
             "key": new_key, "instance": name,
             "links_created": links_created,
+            "links": link_results,
             "message": f"Created {new_key} with {links_created} links",
         }
         if link_errors:
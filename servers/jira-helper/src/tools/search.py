@@ -1,11 +1,21 @@
-"""Search operations: JQL search, project ticket listing, JQL validation."""
+"""Search operations: JQL search, project ticket listing, JQL validation.
+
+`fetch_page` and `fetch_all_pages` are the shared paging helpers for any
+module that runs JQL (bulk transitions, the local mirror).
+"""
 
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
 
-from jira_client import get_jira_client, resolve_instance_name
+from concurrency import map_concurrently
+from config import settings
+from jira_client import get_jira_client, get_instances_info, is_cloud_url, resolve_instance_name
+from mirror import get_mirror
 from exceptions import JiraError, JiraValidationError, JiraApiError
-from output_sanitizer import sanitize_string, truncate_string
+from projection import SEARCH_RESULT_FIELDS, build_fields_param, extract_search_row, to_table
 
 logger = logging.getLogger(__name__)
 
@@ -14,48 +24,320 @@ _FORBIDDEN_PATTERNS = re.compile(
 )
 MAX_JQL_LENGTH = 4000
 
+# all_pages mode: rows per request, hard cap on total rows, parallel page fetches
+PAGE_SIZE = 100
+MAX_ALL_PAGES_RESULTS = 1000
+PAGE_MAX_WORKERS = 4
+
+RESULT_FORMATS = ("rows", "table")
+TABLE_INTERNED_COLUMNS = ("status", "assignee", "priority", "issue_type", "project")
+
+FEDERATED_SORT_KEYS = ("updated", "created", "key", "instance")
+MAX_FEDERATED_RESULTS = 200  # per instance
+
+
+def fetch_page(
+    client, jql: str, fields: str, limit: int,
+    start_at: int = 0, next_page_token: str = None,
+) -> dict:
+    """Fetch one page of search results and normalize the paging metadata.
+
+    Jira Cloud's enhanced search pages with an opaque `nextPageToken` and
+    reports no total; Server/Data Center pages by `startAt` with a total.
+    """
+    if client.cloud:
+        if start_at:
+            raise JiraValidationError(
+                "Jira Cloud paginates with next_page_token; start_at is not supported."
+            )
+        result = client.enhanced_jql(jql, fields=fields, nextPageToken=next_page_token, limit=limit) or {}
+        issues = result.get("issues", [])
+        token = result.get("nextPageToken")
+        return {
+            "issues": issues,
+            "total": None,
+            "is_last": bool(result.get("isLast", token is None)),
+            "next_page_token": token,
+            "next_start_at": None,
+        }
 
-def _extract_issue(issue: dict) -> dict:
-    """Extract standard fields from a raw Jira issue dict."""
-    fields = issue.get("fields", {})
-    raw_summary = fields.get("summary", "")
+    result = client.jql(jql, fields=fields, start=start_at, limit=limit)
+    result = result if isinstance(result, dict) else {}
+    issues = result.get("issues", [])
+    total = result.get("total", start_at + len(issues))
+    end = start_at + len(issues)
+    is_last = not issues or end >= total
     return {
-        "key": issue.get("key", ""),
-        "summary": truncate_string(sanitize_string(raw_summary), 200),
-        "status": fields.get("status", {}).get("name", "") if fields.get("status") else "",
-        "assignee": fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
-        "priority": fields.get("priority", {}).get("name", "") if fields.get("priority") else "",
-        "issue_type": fields.get("issuetype", {}).get("name", "") if fields.get("issuetype") else "",
-        "project": fields.get("project", {}).get("key", "") if fields.get("project") else "",
+        "issues": issues,
+        "total": total,
+        "is_last": is_last,
+        "next_page_token": None,
+        "next_start_at": None if is_last else end,
     }
 
 
-def search_jira_issues(jql: str, max_results: int = 20, instance_name: str = None, **kwargs) -> dict:
-    """Execute a JQL search query to find Jira issues."""
+def fetch_all_pages(client, jql: str, fields: str, max_total: int) -> tuple[list, dict]:
+    """Fetch pages until exhausted or `max_total` rows.
+
+    On Server/DC the first page reveals the total, so the remaining pages are
+    fetched concurrently. Cloud's token chain has to be walked in order.
+    """
+    page_size = min(PAGE_SIZE, max_total)
+    first = fetch_page(client, jql, fields, page_size)
+    issues = list(first["issues"])
+    last = first
+
+    if first["total"] is not None:
+        target = min(first["total"], max_total)
+        offsets = list(range(len(issues), target, page_size))
+
+        def fetch(offset: int) -> dict:
+            return fetch_page(client, jql, fields, min(page_size, target - offset), start_at=offset)
+
+        for page, error in map_concurrently(fetch, offsets, PAGE_MAX_WORKERS):
+            if error is not None:
+                raise error
+            issues.extend(page["issues"])
+            last = page
+    else:
+        while not last["is_last"] and last["next_page_token"] and len(issues) < max_total:
+            last = fetch_page(
+                client, jql, fields, min(page_size, max_total - len(issues)),
+                next_page_token=last["next_page_token"],
+            )
+            issues.extend(last["issues"])
+
+    # Pages fetched in parallel can overlap if issues change mid-search.
+    seen = set()
+    unique = []
+    for issue in issues[:max_total]:
+        key = issue.get("key", "")
+        if key not in seen:
+            seen.add(key)
+            unique.append(issue)
+
+    total = first["total"]
+    exhausted = len(unique) >= total if total is not None else last["is_last"]
+    return unique, {
+        # Cloud reports no total; it is only known once every page is read.
+        "total": total if total is not None else (len(unique) if exhausted else None),
+        "is_last": exhausted,
+        "truncated": not exhausted,
+        "next_start_at": len(unique) if total is not None and not exhausted else None,
+        "next_page_token": None if exhausted else last["next_page_token"],
+    }
+
+
+def _search_response(
+    name: str, jql: str, issues_raw: list, format: str, start: int, paging: dict, freshness: dict = None
+) -> dict:
+    issues = [extract_search_row(i) for i in issues_raw]
+    response = {
+        "instance": name,
+        "jql": jql,
+        "issues": to_table(issues, TABLE_INTERNED_COLUMNS) if format == "table" else issues,
+        "total": paging["total"],
+        "start_at": start,
+        "is_last": paging["is_last"],
+    }
+    if paging.get("next_start_at") is not None:
+        response["next_start_at"] = paging["next_start_at"]
+    if paging.get("next_page_token"):
+        response["next_page_token"] = paging["next_page_token"]
+    if paging.get("truncated"):
+        response["truncated"] = True
+    if freshness:
+        response["freshness"] = freshness
+    return response
+
+
+def search_jira_issues(
+    jql: str, max_results: int = 20, start_at: int = 0, next_page_token: str = None,
+    all_pages: bool = False, max_total: int = MAX_ALL_PAGES_RESULTS,
+    format: str = "rows", use_mirror: bool = True, instance_name: str = None, **kwargs
+) -> dict:
+    """Execute a JQL search query to find Jira issues.
+
+    Returns one page of `max_results` issues. To continue, pass the returned
+    `next_start_at` as `start_at` (Jira Server/DC) or `next_page_token`
+    (Jira Cloud). With `all_pages=True`, fetches every page up to `max_total`
+    rows (hard cap 1000), in parallel where the server reports a total.
+
+    `format="table"` returns `issues` as `columns` plus value `rows`, with
+    repeated status/assignee/priority/type/project names stored once under
+    `values` and referenced by index.
+
+    Queries in the local mirror's JQL subset on fresh mirrored projects are
+    answered from the mirror and carry a `freshness` entry. On Jira Cloud
+    only results that fit in one response are served locally, since a
+    `start_at` cursor could not be continued against Jira.
+    """
     if not jql or not jql.strip():
         raise JiraValidationError("JQL query is required.")
+    if format not in RESULT_FORMATS:
+        raise JiraValidationError(f"format must be one of: {', '.join(RESULT_FORMATS)}.")
+    max_results = max(1, min(int(max_results), MAX_ALL_PAGES_RESULTS))
+    max_total = max(1, min(int(max_total or MAX_ALL_PAGES_RESULTS), MAX_ALL_PAGES_RESULTS))
+    start = 0 if all_pages else max(0, int(start_at or 0))
     name = resolve_instance_name(instance_name)
+    mirror = get_mirror() if use_mirror and not next_page_token else None
+    if mirror is not None:
+        instance = settings.get_jira_instance(name)
+        cloud = instance is not None and is_cloud_url(instance.url)
+        mirrored = None
+        if not (cloud and start):
+            mirrored = mirror.search(
+                name, jql, start, max_total if all_pages else max_results, complete_only=cloud and not all_pages
+            )
+        if mirrored is not None:
+            issues_raw, total, freshness = mirrored
+            end = start + len(issues_raw)
+            return _search_response(name, jql, issues_raw, format, start, {
+                "total": total,
+                "is_last": end >= total,
+                "truncated": all_pages and end < total,
+                "next_start_at": end if end < total and not all_pages else None,
+                "next_page_token": None,
+            }, freshness)
     client = get_jira_client(name)
+    fields = build_fields_param(SEARCH_RESULT_FIELDS)
     try:
-        result = client.jql(jql, limit=max_results)
-        issues_raw = result.get("issues", []) if isinstance(result, dict) else []
-        issues = [_extract_issue(i) for i in issues_raw]
-        return {
-            "instance": name,
-            "jql": jql,
-            "issues": issues,
-            "total": result.get("total", len(issues)) if isinstance(result, dict) else len(issues),
-        }
+        if all_pages:
+            issues_raw, paging = fetch_all_pages(client, jql, fields, max_total)
+        else:
+            page = fetch_page(
+                client, jql, fields, max_results,
+                start_at=start, next_page_token=next_page_token,
+            )
+            issues_raw = page["issues"]
+            paging = {
+                # Cloud reports no total; a lone first page is the whole result.
+                "total": page["total"] if page["total"] is not None else (
+                    len(issues_raw) if page["is_last"] and not next_page_token else None
+                ),
+                "is_last": page["is_last"],
+                "next_start_at": page["next_start_at"],
+                "next_page_token": page["next_page_token"],
+            }
+        return _search_response(name, jql, issues_raw, format, start, paging)
     except JiraError:
         raise
     except Exception as e:
         raise JiraApiError(f"JQL search failed: {e}", instance_name=name)
 
 
+def _timestamp(value: str) -> float:
+    """Jira timestamp (`2026-01-31T10:00:00.000+0200`) as epoch seconds; 0 if unparseable."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _key_order(key: str) -> tuple[str, int]:
+    project, _, number = key.rpartition("-")
+    return project, int(number) if number.isdigit() else 0
+
+
+def _search_instance(name: str, jql: str, fields: str, limit: int) -> dict:
+    started = time.monotonic()
+    client = get_jira_client(name)
+    issues_raw, paging = fetch_all_pages(client, jql, fields, limit)
+    rows = []
+    for issue in issues_raw:
+        row = extract_search_row(issue)
+        row["instance"] = name
+        issue_fields = issue.get("fields") or {}
+        row["updated"] = issue_fields.get("updated", "")
+        row["created"] = issue_fields.get("created", "")
+        rows.append(row)
+    return {
+        "issues": rows,
+        "total": paging["total"],
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+    }
+
+
+def search_all_instances(
+    jql: str, max_results_per_instance: int = 50, instances: list = None,
+    timeout_seconds: float = None, sort_by: str = "updated", format: str = "rows", **kwargs
+) -> dict:
+    """Run one JQL search on every configured Jira instance concurrently.
+
+    Each instance gets `timeout_seconds` (default
+    `server.federated_search_timeout`); instances that fail or time out are
+    reported under `instances` without failing the call. Results are merged,
+    tagged with their instance and sorted by `sort_by` (`updated` and
+    `created` newest first).
+    """
+    if not jql or not jql.strip():
+        raise JiraValidationError("JQL query is required.")
+    if sort_by not in FEDERATED_SORT_KEYS:
+        raise JiraValidationError(f"sort_by must be one of: {', '.join(FEDERATED_SORT_KEYS)}.")
+    if format not in RESULT_FORMATS:
+        raise JiraValidationError(f"format must be one of: {', '.join(RESULT_FORMATS)}.")
+    limit = max(1, min(int(max_results_per_instance or 50), MAX_FEDERATED_RESULTS))
+    timeout = float(timeout_seconds or settings.federated_search_timeout)
+
+    configured = [i["name"] for i in get_instances_info()]
+    if isinstance(instances, str):
+        instances = [n.strip() for n in instances.split(",") if n.strip()]
+    if instances:
+        unknown = [n for n in instances if n not in configured]
+        if unknown:
+            raise JiraValidationError(
+                f"Unknown instance(s): {', '.join(unknown)}. Available: {', '.join(configured)}"
+            )
+        configured = [n for n in configured if n in instances]
+    if not configured:
+        raise JiraValidationError("No Jira instances are configured.")
+
+    fields = build_fields_param(SEARCH_RESULT_FIELDS, ["updated", "created"])
+    started = time.monotonic()
+    # Not a context manager: a hung instance must not hold up the response.
+    pool = ThreadPoolExecutor(max_workers=len(configured), thread_name_prefix="jira-federated")
+    futures = {pool.submit(_search_instance, n, jql, fields, limit): n for n in configured}
+    wait(futures, timeout=timeout)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    issues, report = [], []
+    for future, name in futures.items():
+        if not future.done():
+            report.append({"instance": name, "status": "timeout",
+                           "error": f"No response within {timeout:g}s"})
+            continue
+        error = future.exception()
+        if error is not None:
+            report.append({"instance": name, "status": "error", "error": str(error)})
+            continue
+        result = future.result()
+        issues.extend(result["issues"])
+        report.append({"instance": name, "status": "ok", "count": len(result["issues"]),
+                       "total": result["total"], "elapsed_ms": result["elapsed_ms"]})
+
+    if sort_by in ("updated", "created"):
+        issues.sort(key=lambda r: _timestamp(r[sort_by]), reverse=True)
+    elif sort_by == "key":
+        issues.sort(key=lambda r: (_key_order(r["key"]), r["instance"]))
+    else:
+        issues.sort(key=lambda r: (r["instance"], _key_order(r["key"])))
+
+    succeeded = sum(1 for r in report if r["status"] == "ok")
+    return {
+        "jql": jql,
+        "issues": to_table(issues, TABLE_INTERNED_COLUMNS + ("instance",)) if format == "table" else issues,
+        "count": len(issues),
+        "instances": report,
+        "succeeded": succeeded,
+        "failed": len(report) - succeeded,
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+    }
+
+
 def list_project_tickets(
     project_key: str, status: str = None, assignee: str = None,
-    issue_type: str = None, max_results: int = 20,
-    instance_name: str = None, **kwargs
+    issue_type: str = None, max_results: int = 20, start_at: int = 0,
+    next_page_token: str = None, format: str = "rows", instance_name: str = None, **kwargs
 ) -> dict:
     """List tickets in a Jira project with optional filtering."""
     if not project_key:
@@ -68,7 +350,10 @@ def list_project_tickets(
     if issue_type:
         clauses.append(f'issuetype = "{issue_type}"')
     jql = " AND ".join(clauses) + " ORDER BY updated DESC"
-    return search_jira_issues(jql=jql, max_results=max_results, instance_name=instance_name)
+    return search_jira_issues(
+        jql=jql, max_results=max_results, start_at=start_at,
+        next_page_token=next_page_token, format=format, instance_name=instance_name,
+    )
 
 
 def validate_jql_query(jql: str, **kwargs) -> dict:
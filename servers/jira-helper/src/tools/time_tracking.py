@@ -3,6 +3,7 @@
 import logging
 import re
 
+from issue_cache import get_issue, invalidate_issue
 from jira_client import get_jira_client, validate_issue_key, resolve_instance_name
 from exceptions import JiraError, JiraValidationError, JiraApiError
 
@@ -30,6 +31,7 @@ def log_work(
         if started:
             worklog_data["started"] = started
         client.issue_worklog(key, **worklog_data)
+        invalidate_issue(name, key)
         return {
             "key": key, "instance": name, "time_spent": time_spent.strip(),
             "message": f"Successfully logged {time_spent.strip()} on {key}",
@@ -77,7 +79,7 @@ def get_time_tracking_info(issue_key: str, instance_name: str = None, **kwargs)
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
     try:
-        issue = client.issue(key, fields="timetracking")
+        issue = get_issue(client, name, key, "timetracking")
         tt = issue.get("fields", {}).get("timetracking", {})
         return {
             "key": key, "instance": name,
@@ -113,6 +115,7 @@ def update_time_estimates(
         if remaining_estimate:
             tt["remainingEstimate"] = remaining_estimate
         client.issue_update(key, fields={"timetracking": tt})
+        invalidate_issue(name, key)
         return {
             "key": key, "instance": name, "updated": tt,
             "message": f"Successfully updated time estimates for {key}",
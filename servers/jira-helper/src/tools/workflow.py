@@ -5,149 +5,263 @@ import io
 import json
 import logging
 
+import transition_cache
+import workflow_render
+from cache import TTLCache
+from concurrency import map_concurrently
+from config import settings
+from disk_cache import DiskCache, content_key
 from jira_client import get_jira_client, resolve_instance_name
 from exceptions import JiraError, JiraValidationError, JiraApiError, JiraGraphError
 
 logger = logging.getLogger(__name__)
 
+OUTPUT_FORMATS = ("svg", "mermaid", "dot", "json", "png")
+WORKFLOW_MAX_WORKERS = 4
+RENDER_VERSION = "1"  # bump when rendered output changes, to orphan old cache files
+
+# (instance, project, issue type) -> extracted workflow
+_workflow_cache = TTLCache(max_entries=256, ttl=settings.workflow_cache_ttl)
+# Rendered SVG/PNG bytes keyed by a hash of format, title and workflow content
+_render_cache = DiskCache(settings.cache_dir / "renders", settings.render_cache_max_bytes)
+settings.add_reload_listener(lambda names: _workflow_cache.invalidate(lambda k: k[0] in names))
+
 
 def generate_project_workflow_graph(
-    project_key: str, issue_type: str = "Task", output_format: str = "png",
-    instance_name: str = None, **kwargs
+    project_key: str, issue_type: str = "Task", output_format: str = "svg",
+    all_issue_types: bool = False, instance_name: str = None, **kwargs
 ) -> dict:
-    """Generate a visual workflow graph for a project and issue type."""
+    """Generate a visual workflow graph for a project and issue type.
+
+    `output_format` is one of "svg" (default), "mermaid", "dot", "json" or
+    "png". All but "png" are rendered in pure Python; "png" uses matplotlib
+    and networkx, which are only imported for that format.
+
+    With `all_issue_types=True`, `issue_type` is ignored and one graph is
+    returned per issue type of the project. Statuses for every type come
+    from a single request, and sample issues are read concurrently.
+    """
     if not project_key:
         raise JiraValidationError("project_key is required.")
+    output_format = (output_format or "svg").lower()
+    if output_format not in OUTPUT_FORMATS:
+        raise JiraValidationError(f"output_format must be one of {list(OUTPUT_FORMATS)}.")
     name = resolve_instance_name(instance_name)
     client = get_jira_client(name)
 
     try:
-        # Get workflow data using multi-strategy approach
-        workflow = _extract_workflow_data(client, project_key, issue_type)
+        if all_issue_types:
+            return _generate_all_issue_types(client, name, project_key, output_format)
 
-        if output_format == "json":
-            return {
-                "project_key": project_key, "issue_type": issue_type,
-                "instance": name, "format": "json", "workflow": workflow,
-            }
-
-        # Generate visual graph
-        try:
-            import matplotlib
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
-            import networkx as nx
-        except ImportError:
-            raise JiraGraphError("matplotlib and networkx are required for graph generation.")
-
-        G = nx.DiGraph()
-        statuses = workflow.get("statuses", [])
-        transitions = workflow.get("transitions", [])
-
-        for s in statuses:
-            G.add_node(s["name"], category=s.get("category", ""))
-
-        for t in transitions:
-            if t.get("from_status") and t.get("to_status"):
-                G.add_edge(t["from_status"], t["to_status"], label=t.get("name", ""))
-
-        if not G.nodes():
-            return {
+        workflow, workflow_cached = _get_workflow_data(client, name, project_key, issue_type)
+        return dict(
+            {
                 "project_key": project_key, "issue_type": issue_type,
                 "instance": name, "format": output_format,
-                "message": "No workflow data available for this project/issue type.",
-            }
-
-        # Layout and draw
-        fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-        pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-
-        # Color by category
-        color_map = {"To Do": "#4A90D9", "In Progress": "#F6C342", "Done": "#14892C"}
-        node_colors = [
-            color_map.get(G.nodes[n].get("category", ""), "#C0C0C0") for n in G.nodes()
-        ]
-
-        nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors, node_size=2000, alpha=0.9)
-        nx.draw_networkx_labels(G, pos, ax=ax, font_size=8, font_weight="bold")
-        nx.draw_networkx_edges(G, pos, ax=ax, edge_color="#666666", arrows=True, arrowsize=20)
-
-        edge_labels = nx.get_edge_attributes(G, "label")
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, ax=ax, font_size=6)
-
-        ax.set_title(f"Workflow: {project_key} - {issue_type}", fontsize=14, fontweight="bold")
-        ax.axis("off")
-        plt.tight_layout()
-
-        buf = io.BytesIO()
-        fmt = "svg" if output_format == "svg" else "png"
-        fig.savefig(buf, format=fmt, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        buf.seek(0)
-        encoded = base64.b64encode(buf.read()).decode("utf-8")
-
-        return {
-            "project_key": project_key, "issue_type": issue_type,
-            "instance": name, "format": fmt,
-            "image_base64": encoded,
-            "message": f"Generated {fmt.upper()} workflow graph for {project_key}/{issue_type}",
-        }
+                "workflow_cached": workflow_cached,
+            },
+            **_render_workflow(workflow, output_format, project_key, issue_type),
+        )
     except (JiraError, JiraGraphError):
         raise
     except Exception as e:
         raise JiraGraphError(f"Failed to generate workflow graph: {e}", instance_name=name)
 
 
-def _extract_workflow_data(client, project_key: str, issue_type: str) -> dict:
-    """Extract workflow data using multiple strategies."""
+def _generate_all_issue_types(client, name: str, project_key: str, output_format: str) -> dict:
+    """Render one graph per issue type of a project."""
+    project_statuses = _get_project_statuses(client, project_key)
+    if not project_statuses:
+        raise JiraValidationError(f"No issue types found for project {project_key}.")
+    issue_types = [type_name for type_name, _ in project_statuses.values()]
+
+    def render(issue_type: str) -> dict:
+        workflow, workflow_cached = _get_workflow_data(
+            client, name, project_key, issue_type, project_statuses=project_statuses
+        )
+        return dict(
+            {"issue_type": issue_type, "workflow_cached": workflow_cached},
+            **_render_workflow(workflow, output_format, project_key, issue_type),
+        )
+
+    graphs = []
+    for issue_type, (graph, error) in zip(
+        issue_types, map_concurrently(render, issue_types, WORKFLOW_MAX_WORKERS)
+    ):
+        graphs.append(graph if error is None else {"issue_type": issue_type, "error": str(error)})
+    return {
+        "project_key": project_key, "instance": name, "format": output_format,
+        "issue_types": graphs, "count": len(graphs),
+    }
+
+
+def _render_workflow(workflow: dict, output_format: str, project_key: str, issue_type: str) -> dict:
+    """Render a workflow in `output_format`, returning the response fields to add."""
+    if output_format == "json":
+        return {"workflow": workflow}
+
+    if not workflow.get("statuses") and not workflow.get("transitions"):
+        return {"message": "No workflow data available for this project/issue type."}
+
+    title = f"Workflow: {project_key} - {issue_type}"
+    if output_format == "mermaid":
+        return {"diagram": workflow_render.to_mermaid(workflow)}
+    if output_format == "dot":
+        return {"diagram": workflow_render.to_dot(workflow, title)}
+    render_key = content_key(
+        RENDER_VERSION, output_format, title, json.dumps(workflow, sort_keys=True)
+    )
+    data = _render_cache.get(render_key)
+    render_cached = data is not None
+    if data is None:
+        if output_format == "svg":
+            data = workflow_render.to_svg(workflow, title).encode("utf-8")
+        else:
+            data = _render_png(workflow, title)
+        _render_cache.put(render_key, data)
+
+    return {
+        "render_cached": render_cached,
+        "image_base64": base64.b64encode(data).decode("utf-8"),
+        "message": f"Generated {output_format.upper()} workflow graph for {project_key}/{issue_type}",
+    }
+
+
+def _get_workflow_data(
+    client, name: str, project_key: str, issue_type: str, project_statuses: dict = None
+) -> tuple[dict, bool]:
+    """Extract workflow data through the TTL cache. Returns (workflow, was_cached)."""
+    cache_key = (name, project_key.upper(), issue_type.lower())
+    workflow = _workflow_cache.get(cache_key)
+    if workflow is not None:
+        return workflow, True
+    workflow = _extract_workflow_data(
+        client, project_key, issue_type, instance_name=name, project_statuses=project_statuses
+    )
+    if workflow.get("statuses"):
+        _workflow_cache.put(cache_key, workflow)
+    return workflow, False
+
+
+def get_stats() -> dict:
+    return {"workflows": _workflow_cache.stats(), "renders": _render_cache.stats()}
+
+
+def _render_png(workflow: dict, title: str) -> bytes:
+    """Render a PNG with matplotlib/networkx (imported on demand)."""
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        import networkx as nx
+    except ImportError:
+        raise JiraGraphError("matplotlib and networkx are required for PNG graph generation.")
+
+    G = nx.DiGraph()
+    for s in workflow.get("statuses", []):
+        G.add_node(s["name"], category=s.get("category", ""))
+    for t in workflow.get("transitions", []):
+        if t.get("from_status") and t.get("to_status"):
+            G.add_edge(t["from_status"], t["to_status"], label=t.get("name", ""))
+
+    # Layout and draw
+    fig, ax = plt.subplots(1, 1, figsize=(12, 8))
+    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+
+    # Color by category
+    node_colors = [
+        workflow_render.CATEGORY_COLORS.get(G.nodes[n].get("category", ""), workflow_render.DEFAULT_COLOR)
+        for n in G.nodes()
+    ]
+
+    nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors, node_size=2000, alpha=0.9)
+    nx.draw_networkx_labels(G, pos, ax=ax, font_size=8, font_weight="bold")
+    nx.draw_networkx_edges(G, pos, ax=ax, edge_color="#666666", arrows=True, arrowsize=20)
+
+    edge_labels = nx.get_edge_attributes(G, "label")
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, ax=ax, font_size=6)
+
+    ax.set_title(title, fontsize=14, fontweight="bold")
+    ax.axis("off")
+    plt.tight_layout()
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def _get_project_statuses(client, project_key: str) -> dict[str, tuple[str, list[dict]]]:
+    """
+    Statuses of every issue type in a project, from one
+    `project/{key}/statuses` request. Returns
+    ``{lower-cased type name: (type name, statuses)}``.
+    """
+    data = client.get(f"rest/api/2/project/{project_key}/statuses") or []
+    result = {}
+    for itype in data if isinstance(data, list) else []:
+        statuses = []
+        for s in itype.get("statuses", []):
+            category = s.get("statusCategory", {}).get("name", "") if s.get("statusCategory") else ""
+            statuses.append({"name": s.get("name", ""), "id": s.get("id", ""), "category": category})
+        type_name = itype.get("name", "")
+        if type_name:
+            result[type_name.lower()] = (type_name, statuses)
+    return result
+
+
+def _extract_workflow_data(
+    client, project_key: str, issue_type: str, instance_name: str = None,
+    project_statuses: dict = None,
+) -> dict:
+    """Extract workflow data using multiple strategies.
+
+    Statuses come from the project statuses API (`project_statuses`, if
+    already fetched). Real transitions come from the most recent issue of
+    the type; they are also recorded in the transition cache for
+    `instance_name`.
+    """
     statuses = []
     transitions = []
 
-    # Strategy 1: Try project statuses API
+    # Strategy 1: Project statuses API
     try:
-        project_statuses = client.get_project_issue_statuses(project_key)
-        if isinstance(project_statuses, list):
-            for itype in project_statuses:
-                if itype.get("name", "").lower() == issue_type.lower():
-                    for s in itype.get("statuses", []):
-                        category = s.get("statusCategory", {}).get("name", "") if s.get("statusCategory") else ""
-                        statuses.append({
-                            "name": s.get("name", ""),
-                            "id": s.get("id", ""),
-                            "category": category,
-                        })
-                    break
+        if project_statuses is None:
+            project_statuses = _get_project_statuses(client, project_key)
+        statuses = [dict(s) for s in project_statuses.get(issue_type.lower(), ("", []))[1]]
     except Exception:
         pass
 
-    # Strategy 2: Try getting statuses from a sample issue
-    if not statuses:
-        try:
-            jql = f'project = "{project_key}" AND issuetype = "{issue_type}" ORDER BY created DESC'
-            result = client.jql(jql, limit=1)
-            issues = result.get("issues", []) if isinstance(result, dict) else []
-            if issues:
-                sample_key = issues[0].get("key", "")
-                if sample_key:
-                    trans = client.get_issue_transitions(sample_key)
-                    current = issues[0].get("fields", {}).get("status", {})
-                    if current:
-                        cat = current.get("statusCategory", {}).get("name", "") if current.get("statusCategory") else ""
-                        statuses.append({"name": current.get("name", ""), "id": current.get("id", ""), "category": cat})
-                    for t in trans:
-                        to_status = t.get("to", {})
-                        if to_status:
-                            cat = to_status.get("statusCategory", {}).get("name", "") if to_status.get("statusCategory") else ""
-                            s = {"name": to_status.get("name", ""), "id": to_status.get("id", ""), "category": cat}
-                            if s not in statuses:
-                                statuses.append(s)
-                            transitions.append({
-                                "name": t.get("name", ""),
-                                "from_status": current.get("name", "") if current else "",
-                                "to_status": to_status.get("name", ""),
-                            })
-        except Exception:
-            pass
+    # Strategy 2: Transitions (and statuses, if still missing) from a sample issue
+    try:
+        jql = f'project = "{project_key}" AND issuetype = "{issue_type}" ORDER BY created DESC'
+        result = client.jql(jql, fields="status", limit=1)
+        issues = result.get("issues", []) if isinstance(result, dict) else []
+        sample_key = issues[0].get("key", "") if issues else ""
+        if sample_key:
+            sample = client.issue(sample_key, fields="project,issuetype,status", expand="transitions")
+            current = sample.get("fields", {}).get("status") or {}
+            if instance_name:
+                trans = transition_cache.learn_from_issue(instance_name, sample)[1]
+            else:
+                trans = transition_cache.normalize_transitions(sample.get("transitions", []))
+            seen = {s["name"] for s in statuses}
+            if current and current.get("name") not in seen:
+                cat = current.get("statusCategory", {}).get("name", "") if current.get("statusCategory") else ""
+                statuses.append({"name": current.get("name", ""), "id": current.get("id", ""), "category": cat})
+                seen.add(current.get("name"))
+            for t in trans:
+                if t["to_status"]:
+                    if t["to_status"] not in seen:
+                        seen.add(t["to_status"])
+                        statuses.append({"name": t["to_status"], "id": "", "category": t["to_category"]})
+                    transitions.append({
+                        "name": t["name"],
+                        "from_status": current.get("name", ""),
+                        "to_status": t["to_status"],
+                    })
+    except Exception:
+        pass
 
     # Generate logical transitions if we have statuses but no transitions
     if statuses and not transitions:
@@ -0,0 +1,111 @@
+"""
+Workflow transition cache.
+
+The transitions available to an issue depend only on its workflow and
+current status, so they are cached per (instance, project, issue type,
+status). The last known (project, issue type, status) of each transitioned
+issue is cached as well, which lets `transition_jira_issue` post a cached
+transition id straight away. A stale guess costs a 400 and one refetch.
+"""
+
+import logging
+
+from cache import TTLCache
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_transitions = TTLCache(max_entries=1024, ttl=settings.transition_cache_ttl)
+_issue_context = TTLCache(max_entries=4096, ttl=settings.transition_cache_ttl)
+
+
+def _key(instance_name: str, project: str, issue_type: str, status: str) -> tuple:
+    return (instance_name, project.upper(), issue_type.lower(), status.lower())
+
+
+def normalize_transitions(raw: list) -> list[dict]:
+    """
+    Normalize transitions to ``{"id", "name", "to_status", "to_category"}``.
+
+    Accepts both the raw REST shape (``to`` is a status object, as returned
+    by ``expand=transitions``) and atlassian-python-api's
+    `get_issue_transitions` shape (``to`` is the status name).
+    """
+    result = []
+    for t in raw or []:
+        to = t.get("to")
+        if isinstance(to, dict):
+            to_status = to.get("name", "")
+            to_category = to.get("statusCategory", {}).get("name", "") if to.get("statusCategory") else ""
+        else:
+            to_status, to_category = to or "", ""
+        result.append({
+            "id": str(t.get("id", "")),
+            "name": t.get("name", ""),
+            "to_status": to_status,
+            "to_category": to_category,
+        })
+    return result
+
+
+def find_transition(transitions: list[dict], name: str = None, transition_id: str = None) -> dict | None:
+    """Find a normalized transition by id or case-insensitive name."""
+    for t in transitions:
+        if transition_id is not None and t["id"] == str(transition_id):
+            return t
+        if transition_id is None and name and t["name"].lower() == name.lower():
+            return t
+    return None
+
+
+def remember(instance_name: str, project: str, issue_type: str, status: str, transitions: list[dict]) -> None:
+    if project and issue_type and status:
+        _transitions.put(_key(instance_name, project, issue_type, status), transitions)
+
+
+def lookup(instance_name: str, project: str, issue_type: str, status: str) -> list[dict] | None:
+    return _transitions.get(_key(instance_name, project, issue_type, status))
+
+
+def remember_issue(instance_name: str, issue_key: str, project: str, issue_type: str, status: str) -> None:
+    _issue_context.put((instance_name, issue_key), (project, issue_type, status))
+
+
+def issue_context(instance_name: str, issue_key: str) -> tuple[str, str, str] | None:
+    """Last known (project, issue type, status) of an issue, or None."""
+    return _issue_context.get((instance_name, issue_key))
+
+
+def forget_issue(instance_name: str, issue_key: str) -> None:
+    _issue_context.invalidate(lambda k: k == (instance_name, issue_key))
+
+
+def learn_from_issue(instance_name: str, issue: dict) -> tuple[tuple[str, str, str], list[dict]]:
+    """
+    Record the context and transitions of an issue fetched with
+    ``fields=project,issuetype,status`` and ``expand=transitions``.
+
+    Returns ``((project, issue type, status), transitions)``.
+    """
+    fields = issue.get("fields", {})
+    context = (
+        (fields.get("project") or {}).get("key", ""),
+        (fields.get("issuetype") or {}).get("name", ""),
+        (fields.get("status") or {}).get("name", ""),
+    )
+    transitions = normalize_transitions(issue.get("transitions", []))
+    remember(instance_name, *context, transitions)
+    remember_issue(instance_name, issue.get("key", ""), *context)
+    return context, transitions
+
+
+def _on_config_reload(names: set[str]) -> None:
+    _transitions.invalidate(lambda k: k[0] in names)
+    _issue_context.invalidate(lambda k: k[0] in names)
+
+
+settings.add_reload_listener(_on_config_reload)
+
+
+def get_stats() -> dict:
+    return {"transitions": _transitions.stats(), "issue_context": _issue_context.stats()}
@@ -0,0 +1,183 @@
+"""
+Dependency-free workflow graph rendering.
+
+Renders the `{"statuses": [...], "transitions": [...]}` structure produced
+by `tools.workflow._extract_workflow_data` as Mermaid, Graphviz DOT or SVG
+text. The SVG layout is deterministic: one column per status category
+(To Do, In Progress, Done, then anything else), statuses stacked in the
+order Jira returned them, and transitions drawn as curved arrows.
+"""
+
+from xml.sax.saxutils import escape
+
+CATEGORY_ORDER = ("To Do", "In Progress", "Done")
+CATEGORY_COLORS = {"To Do": "#4A90D9", "In Progress": "#F6C342", "Done": "#14892C"}
+DEFAULT_COLOR = "#C0C0C0"
+
+NODE_WIDTH = 160
+NODE_HEIGHT = 40
+COLUMN_GAP = 120
+ROW_GAP = 50
+MARGIN = 40
+TITLE_HEIGHT = 40
+EDGE_BEND = 24
+
+
+def _nodes(workflow: dict) -> list[dict]:
+    """Statuses in input order, plus any transition endpoint not listed as a status."""
+    nodes, seen = [], set()
+    for s in workflow.get("statuses", []):
+        if s.get("name") and s["name"] not in seen:
+            seen.add(s["name"])
+            nodes.append({"name": s["name"], "category": s.get("category", "")})
+    for t in workflow.get("transitions", []):
+        for end in (t.get("from_status"), t.get("to_status")):
+            if end and end not in seen:
+                seen.add(end)
+                nodes.append({"name": end, "category": ""})
+    return nodes
+
+
+def _edges(workflow: dict) -> list[tuple[str, str, str]]:
+    return [
+        (t["from_status"], t["to_status"], t.get("name", ""))
+        for t in workflow.get("transitions", [])
+        if t.get("from_status") and t.get("to_status")
+    ]
+
+
+def to_mermaid(workflow: dict) -> str:
+    """Render a Mermaid `flowchart` definition."""
+    nodes = _nodes(workflow)
+    ids = {n["name"]: f"s{i}" for i, n in enumerate(nodes)}
+
+    def quote(text: str) -> str:
+        return '"' + text.replace('"', "#quot;") + '"'
+
+    lines = ["flowchart LR"]
+    for n in nodes:
+        lines.append(f"    {ids[n['name']]}[{quote(n['name'])}]")
+    for src, dst, label in _edges(workflow):
+        arrow = f"-->|{quote(label)}|" if label else "-->"
+        lines.append(f"    {ids[src]} {arrow} {ids[dst]}")
+    for i, category in enumerate(CATEGORY_ORDER):
+        members = [ids[n["name"]] for n in nodes if n["category"] == category]
+        if members:
+            lines.append(f"    classDef c{i} fill:{CATEGORY_COLORS[category]},stroke:#333")
+            lines.append(f"    class {','.join(members)} c{i}")
+    return "\n".join(lines) + "\n"
+
+
+def to_dot(workflow: dict, title: str = "") -> str:
+    """Render a Graphviz DOT digraph."""
+    def quote(text: str) -> str:
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+    lines = [
+        "digraph workflow {",
+        "    rankdir=LR;",
+        '    node [shape=box, style="rounded,filled", fontname="Helvetica", fontsize=10];',
+        '    edge [fontname="Helvetica", fontsize=8, color="#666666"];',
+    ]
+    if title:
+        lines.append(f"    label={quote(title)};")
+        lines.append("    labelloc=t;")
+    for n in _nodes(workflow):
+        color = CATEGORY_COLORS.get(n["category"], DEFAULT_COLOR)
+        lines.append(f'    {quote(n["name"])} [fillcolor="{color}"];')
+    for src, dst, label in _edges(workflow):
+        attrs = f" [label={quote(label)}]" if label else ""
+        lines.append(f"    {quote(src)} -> {quote(dst)}{attrs};")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _layout(nodes: list[dict]) -> tuple[dict[str, tuple[float, float]], float, float]:
+    """Place node centers in category columns. Returns (centers, width, height)."""
+    columns: list[list[str]] = [[] for _ in range(len(CATEGORY_ORDER) + 1)]
+    for n in nodes:
+        cat = n["category"]
+        columns[CATEGORY_ORDER.index(cat) if cat in CATEGORY_ORDER else -1].append(n["name"])
+    columns = [c for c in columns if c]
+
+    centers = {}
+    for col, names in enumerate(columns):
+        x = MARGIN + col * (NODE_WIDTH + COLUMN_GAP) + NODE_WIDTH / 2
+        for row, node_name in enumerate(names):
+            y = TITLE_HEIGHT + MARGIN + row * (NODE_HEIGHT + ROW_GAP) + NODE_HEIGHT / 2
+            centers[node_name] = (x, y)
+    rows = max((len(c) for c in columns), default=0)
+    width = 2 * MARGIN + len(columns) * NODE_WIDTH + max(len(columns) - 1, 0) * COLUMN_GAP
+    height = TITLE_HEIGHT + 2 * MARGIN + rows * NODE_HEIGHT + max(rows - 1, 0) * ROW_GAP
+    return centers, width, height
+
+
+def _box_exit(center: tuple[float, float], toward: tuple[float, float]) -> tuple[float, float]:
+    """Point where the ray from a node center toward `toward` leaves the node box."""
+    dx, dy = toward[0] - center[0], toward[1] - center[1]
+    if dx == 0 and dy == 0:
+        return center
+    scale = min(
+        (NODE_WIDTH / 2) / abs(dx) if dx else float("inf"),
+        (NODE_HEIGHT / 2) / abs(dy) if dy else float("inf"),
+    )
+    return center[0] + dx * scale, center[1] + dy * scale
+
+
+def to_svg(workflow: dict, title: str = "") -> str:
+    """Render a standalone SVG document with a deterministic layout."""
+    nodes = _nodes(workflow)
+    centers, width, height = _layout(nodes)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+        f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="Helvetica, Arial, sans-serif">',
+        '<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="8" '
+        'markerHeight="8" orient="auto-start-reverse"><path d="M0,0 L10,5 L0,10 z" fill="#666666"/>'
+        "</marker></defs>",
+        '<rect width="100%" height="100%" fill="#FFFFFF"/>',
+    ]
+    if title:
+        parts.append(
+            f'<text x="{width / 2:.1f}" y="{TITLE_HEIGHT - 10}" text-anchor="middle" '
+            f'font-size="16" font-weight="bold">{escape(title)}</text>'
+        )
+
+    for src, dst, label in _edges(workflow):
+        (sx, sy), (tx, ty) = centers[src], centers[dst]
+        if src == dst:
+            top = sy - NODE_HEIGHT / 2
+            path = (f"M{sx - 15:.1f},{top:.1f} C{sx - 25:.1f},{top - 30:.1f} "
+                    f"{sx + 25:.1f},{top - 30:.1f} {sx + 15:.1f},{top:.1f}")
+            lx, ly = sx, top - 26
+        else:
+            # Bend each edge to its right so A->B and B->A do not overlap.
+            mx, my = (sx + tx) / 2, (sy + ty) / 2
+            length = ((tx - sx) ** 2 + (ty - sy) ** 2) ** 0.5
+            cx = mx + EDGE_BEND * (ty - sy) / length
+            cy = my - EDGE_BEND * (tx - sx) / length
+            x0, y0 = _box_exit((sx, sy), (cx, cy))
+            x1, y1 = _box_exit((tx, ty), (cx, cy))
+            path = f"M{x0:.1f},{y0:.1f} Q{cx:.1f},{cy:.1f} {x1:.1f},{y1:.1f}"
+            lx, ly = 0.25 * x0 + 0.5 * cx + 0.25 * x1, 0.25 * y0 + 0.5 * cy + 0.25 * y1
+        parts.append(
+            f'<path d="{path}" fill="none" stroke="#666666" stroke-width="1.2" marker-end="url(#arrow)"/>'
+        )
+        if label:
+            parts.append(
+                f'<text x="{lx:.1f}" y="{ly - 3:.1f}" text-anchor="middle" font-size="9" '
+                f'fill="#333333">{escape(label)}</text>'
+            )
+
+    for n in nodes:
+        x, y = centers[n["name"]]
+        color = CATEGORY_COLORS.get(n["category"], DEFAULT_COLOR)
+        parts.append(
+            f'<rect x="{x - NODE_WIDTH / 2:.1f}" y="{y - NODE_HEIGHT / 2:.1f}" width="{NODE_WIDTH}" '
+            f'height="{NODE_HEIGHT}" rx="8" fill="{color}" stroke="#333333"/>'
+        )
+        parts.append(
+            f'<text x="{x:.1f}" y="{y + 4:.1f}" text-anchor="middle" font-size="11" '
+            f'font-weight="bold">{escape(n["name"])}</text>'
+        )
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
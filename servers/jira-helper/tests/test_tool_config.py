@@ -8,10 +8,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 
 def test_tool_config_has_all_tools():
-    """Verify all 32 tools are registered."""
+    """Verify all 42 tools are registered."""
     from tool_config import get_tools_config
     config = get_tools_config()
-    assert len(config) == 32, f"Expected 32 tools, got {len(config)}"
+    assert len(config) == 42, f"Expected 42 tools, got {len(config)}"
 
 
 def test_all_tools_have_function_and_description():
@@ -43,5 +43,29 @@ def test_tool_names_match_expected():
         "list_issue_attachments", "delete_issue_attachment", "list_confluence_spaces",
         "list_confluence_pages", "get_confluence_page", "search_confluence_pages",
         "create_confluence_page", "update_confluence_page",
+        "get_connection_pool_stats", "get_issues_bulk", "get_cache_stats", "get_mirror_status",
+        "transition_issues_bulk", "create_issues_bulk", "download_issue_attachment",
+        "upload_files_to_jira", "get_elided_content",
+        "search_all_instances",
     }
-    assert set(config.keys()) == expected
\ No newline at end of file
+    assert set(config.keys()) == expected
+
+def test_tools_are_registered_as_coroutines():
+    """Blocking tool bodies must be wrapped so they don't stall the event loop."""
+    import inspect
+    from tool_config import get_tools_config
+    config = get_tools_config()
+    for name, tool in config.items():
+        fn = tool["function"]
+        assert inspect.iscoroutinefunction(fn), f"Tool '{name}' is not async"
+        assert fn.__name__ == name, f"Tool '{name}' lost its function name"
+
+
+def test_async_wrapper_preserves_signature():
+    """MCP schema generation reads the wrapped function's parameters."""
+    import inspect
+    from tool_config import get_tools_config
+    fn = get_tools_config()["get_issue_details"]["function"]
+    params = inspect.signature(fn).parameters
+    assert "issue_key" in params
+    assert "instance_name" in params
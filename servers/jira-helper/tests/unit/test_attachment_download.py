@@ -0,0 +1,109 @@
+"""Unit tests for cached and ranged attachment downloads."""
+
+import hashlib
+
+import pytest
+
+from disk_cache import DiskCache
+from tools import files
+
+LOG = b"".join(f"line {i}\n".encode() for i in range(10_000))
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+
+    def iter_content(self, size):
+        for i in range(0, len(self.body), size):
+            yield self.body[i:i + size]
+
+    def close(self):
+        pass
+
+
+class FakeClient:
+    def __init__(self, honour_range=True):
+        self.honour_range = honour_range
+        self.mime_type = "text/plain"
+        self.requests = []
+        self.session = self
+
+    def get_attachment(self, attachment_id):
+        self.requests.append(("meta", attachment_id))
+        return {"filename": "build.log", "size": len(LOG), "mimeType": self.mime_type,
+                "content": f"https://jira.example.com/secure/attachment/{attachment_id}/build.log"}
+
+    def get(self, url, stream, headers):
+        self.requests.append(("content", headers.get("Range")))
+        spec = headers.get("Range")
+        if spec and self.honour_range:
+            start, _, end = spec[len("bytes="):].partition("-")
+            return FakeResponse(LOG[int(start):int(end) + 1 if end else None], 206)
+        return FakeResponse(LOG)
+
+    def raise_for_status(self, response):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    client = FakeClient()
+    monkeypatch.setattr(files, "get_jira_client", lambda name: client)
+    monkeypatch.setattr(files, "resolve_instance_name", lambda name: "primary")
+    monkeypatch.setattr(files, "_attachment_store", DiskCache(tmp_path, 10 * len(LOG)))
+    return client
+
+
+def test_full_download_is_cached_by_content_hash(client):
+    first = files.download_issue_attachment("10001")
+    assert first["sha256"] == hashlib.sha256(LOG).hexdigest()
+    assert first["cached"] is False
+    with open(first["path"], "rb") as f:
+        assert f.read() == LOG
+
+    second = files.download_issue_attachment("10001", max_lines=3)
+    assert second["cached"] is True
+    assert second["content"] == "line 0\nline 1\nline 2\n"
+    assert len(client.requests) == 2  # metadata + content, once
+
+
+def test_uncached_head_uses_range_request(client):
+    result = files.download_issue_attachment("10001", max_bytes=14, offset=7)
+    assert client.requests[-1] == ("content", "bytes=7-20")
+    assert result["range_request"] is True
+    assert result["content"] == "line 1\nline 2\n"
+    assert result["truncated"] is True
+    assert "path" not in result
+
+
+def test_offset_is_applied_when_server_ignores_range(client):
+    client.honour_range = False
+    result = files.download_issue_attachment("10001", max_lines=2, offset=7)
+    assert result["range_request"] is False
+    assert result["content"] == "line 1\nline 2\n"
+
+
+def test_evicted_content_is_downloaded_again(monkeypatch, tmp_path, client):
+    store = DiskCache(tmp_path / "small", len(LOG) + 500)
+    monkeypatch.setattr(files, "_attachment_store", store)
+    files.download_issue_attachment("10001")
+    store.put("f" * 64, b"x" * 1000)  # pushes the store over its budget
+    assert store.stats()["bytes"] <= store.max_bytes
+
+    result = files.download_issue_attachment("10001")
+    assert result["cached"] is False
+    assert len(client.requests) == 4
+
+
+@pytest.mark.parametrize("mime_type, inline", [("text/plain", True), ("application/zip", False)])
+def test_oversized_file_without_slice(monkeypatch, tmp_path, client, mime_type, inline):
+    client.mime_type = mime_type
+    monkeypatch.setattr(files, "_attachment_store", DiskCache(tmp_path / "tiny", 1024))
+    result = files.download_issue_attachment("10001")
+    assert "path" not in result and result["cached"] is False
+    assert ("content" in result) is inline
+    assert "max_bytes" in result["message"]
+    if not inline:
+        assert client.requests == [("meta", "10001")]  # nothing downloaded
@@ -0,0 +1,114 @@
+"""Unit tests for streamed multipart attachment uploads."""
+
+import email.parser
+import email.policy
+import json
+
+import pytest
+
+from config import settings
+from exceptions import JiraValidationError
+from tools import files
+from tools.files import MultipartFileStream
+
+
+def _parse(body: bytes, content_type: str):
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return list(message.iter_parts())
+
+
+def test_stream_is_valid_multipart_read_in_small_blocks(tmp_path):
+    path = tmp_path / 'build "log".txt'
+    payload = bytes(range(256)) * 1000
+    path.write_bytes(payload)
+    stream = MultipartFileStream(str(path))
+    chunks = []
+    while True:
+        chunk = stream.read(4096)
+        if not chunk:
+            break
+        assert len(chunk) <= 4096
+        chunks.append(chunk)
+    stream.close()
+    body = b"".join(chunks)
+    assert len(body) == len(stream)
+    (part,) = _parse(body, stream.content_type)
+    assert part.get_filename() == 'build %22log%22.txt'
+    assert part.get_content_type() == "text/plain"
+    assert part.get_payload(decode=True) == payload
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, body):
+        self.content = json.dumps(body).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    def __init__(self):
+        self.sent = None
+
+    def post(self, url, data, headers):
+        self.sent = (url, headers, len(data), data.read())
+        return FakeResponse([{"id": "10001", "filename": "big.bin"}])
+
+
+class FakeClient:
+    url = "https://jira.example.com"
+
+    def __init__(self, upload_limit):
+        self.session = FakeSession()
+        self.upload_limit = upload_limit
+
+    def get_attachment_meta(self):
+        return {"enabled": True, "uploadLimit": self.upload_limit}
+
+    def resource_url(self, resource):
+        return f"rest/api/2/{resource}"
+
+    @staticmethod
+    def url_joiner(url, path):
+        return f"{url}/{path}"
+
+    def raise_for_status(self, response):
+        pass
+
+
+@pytest.fixture
+def upload(monkeypatch, tmp_path):
+    path = tmp_path / "big.bin"
+    path.write_bytes(b"x" * 3000)
+
+    def run(upload_limit, config_limit=None):
+        client = FakeClient(upload_limit)
+        monkeypatch.setattr(files, "get_jira_client", lambda name: client)
+        monkeypatch.setattr(files, "resolve_instance_name", lambda name: "primary")
+        monkeypatch.setattr(settings, "attachment_max_upload_bytes", config_limit)
+        files._attachment_meta.clear()
+        return client, files.upload_file_to_jira("PROJ-1", str(path))
+
+    return run
+
+
+def test_upload_streams_body_and_reports_throughput(upload):
+    client, result = upload(upload_limit=10_000)
+    url, headers, length, body = client.session.sent
+    assert url == "https://jira.example.com/rest/api/2/issue/PROJ-1/attachments"
+    assert headers["X-Atlassian-Token"] == "no-check"
+    assert length == len(body) and b"x" * 3000 in body
+    assert result["attachment_id"] == "10001"
+    assert result["size"] == 3000
+    assert "throughput_mb_s" in result
+
+
+def test_upload_honours_instance_and_config_limits(upload):
+    with pytest.raises(JiraValidationError, match="too large"):
+        upload(upload_limit=2000)
+    with pytest.raises(JiraValidationError, match="too large"):
+        upload(upload_limit=10_000, config_limit=1000)
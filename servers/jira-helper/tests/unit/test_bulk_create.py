@@ -0,0 +1,103 @@
+"""Unit tests for create_issues_bulk batching and partial-failure mapping."""
+
+import json
+
+import pytest
+from requests import HTTPError, Response
+
+from tools import issues
+
+
+class FakeClient:
+    def __init__(self):
+        self.batches = []
+        self.links = []
+        self.next_id = 1
+
+    def create_issues(self, payloads):
+        self.batches.append(len(payloads))
+        created, errors = [], []
+        for position, payload in enumerate(payloads):
+            if payload["fields"]["summary"].startswith("bad"):
+                errors.append({
+                    "status": 400, "failedElementNumber": position,
+                    "elementErrors": {"errorMessages": [], "errors": {"summary": "rejected"}},
+                })
+            else:
+                created.append({"id": str(self.next_id), "key": f"PROJ-{self.next_id}"})
+                self.next_id += 1
+        body = {"issues": created, "errors": errors}
+        if not created:
+            response = Response()
+            response.status_code = 400
+            response._content = json.dumps(body).encode()
+            raise HTTPError("400", response=response)
+        return body
+
+    def create_issue_link(self, data):
+        self.links.append((data["inwardIssue"]["key"], data["outwardIssue"]["key"], data["type"]["name"]))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(issues, "get_jira_client", lambda name: fake)
+    monkeypatch.setattr(issues, "resolve_instance_name", lambda name: "primary")
+    return fake
+
+
+def test_partial_failures_map_back_to_inputs(client):
+    specs = [{"summary": "one"}, {"summary": "bad two"}, {"summary": "three"}, {"project_key": "X"}]
+    result = issues.create_issues_bulk(specs, project_key="PROJ")
+    assert [r.get("key") for r in result["issues"]] == ["PROJ-1", None, "PROJ-2", None]
+    assert result["issues"][1]["error"] == "summary: rejected"
+    assert "required" in result["issues"][3]["error"]
+    assert (result["created"], result["failed"], result["requests"]) == (2, 2, 1)
+
+
+def test_batches_of_fifty_and_all_failed_batch(client):
+    specs = [{"summary": f"s{i}"} for i in range(50)] + [{"summary": "bad"}] * 3
+    result = issues.create_issues_bulk(specs, project_key="PROJ")
+    assert sorted(client.batches) == [3, 50]
+    assert result["created"] == 50
+    assert all(r["error"] == "summary: rejected" for r in result["issues"][50:])
+
+
+def test_links_resolve_references_to_created_issues(client):
+    specs = [
+        {"summary": "design"},
+        {"summary": "build", "links": [{"issue_key": "#0", "link_type": "Blocks"}, {"issue_key": "proj-99"}]},
+        {"summary": "bad", "links": [{"issue_key": "#0"}]},
+        {"summary": "docs", "links": [{"issue_key": "#2"}]},
+    ]
+    result = issues.create_issues_bulk(specs, project_key="PROJ")
+    assert sorted(client.links) == [("PROJ-2", "PROJ-1", "Blocks"), ("PROJ-2", "PROJ-99", "Relates")]
+    assert result["links_created"] == 2
+    assert len(result["link_errors"]) == 1
+
+
+def test_inward_link_type_swaps_ends(client, monkeypatch):
+    monkeypatch.setattr(issues, "resolve_link_type", lambda c, n, t: ("Blocks", t == "is blocked by"))
+    specs = [{"summary": "design"}, {"summary": "build", "links": [{"issue_key": "#0", "link_type": "is blocked by"}]}]
+    issues.create_issues_bulk(specs, project_key="PROJ")
+    assert client.links == [("PROJ-1", "PROJ-2", "Blocks")]
+
+
+def test_malformed_links_fail_only_their_spec(client, monkeypatch):
+    specs = [
+        {"summary": "string links", "links": "PROJ-1"},
+        {"summary": "scalar items", "links": ["PROJ-1"]},
+        {"summary": "ok", "links": [{"issue_key": "PROJ-9"}]},
+    ]
+    result = issues.create_issues_bulk(specs, project_key="PROJ")
+    assert [r.get("key") for r in result["issues"]] == [None, None, "PROJ-1"]
+    assert "links must be a list" in result["issues"][0]["error"]
+    assert client.batches == [1]
+
+    def broken(c, n, t):
+        raise RuntimeError("link type lookup failed")
+
+    monkeypatch.setattr(issues, "resolve_link_type", broken)
+    result = issues.create_issues_bulk([{"summary": "x", "links": [{"issue_key": "PROJ-9"}]}], project_key="PROJ")
+    assert result["created"] == 1 and result["issues"][0]["key"] == "PROJ-2"
+    assert "link type lookup failed" in result["link_errors"][0]
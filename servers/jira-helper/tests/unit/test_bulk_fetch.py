@@ -0,0 +1,71 @@
+"""Unit tests for get_issues_bulk chunking and per-key errors."""
+
+import re
+
+import pytest
+from requests import HTTPError, Response
+
+from tools import issues
+
+
+def _http_error(status):
+    response = Response()
+    response.status_code = status
+    return HTTPError(str(status), response=response)
+
+
+class FakeClient:
+    """Behaves like Jira Cloud: one unknown key rejects the whole search."""
+
+    def __init__(self, existing, status=400):
+        self.existing = set(existing)
+        self.status = status
+        self.searches = []
+
+    def jql(self, jql, fields=None, limit=50, validate_query=None):
+        keys = re.findall(r"[A-Z]+-\d+", jql)
+        self.searches.append(keys)
+        if any(k not in self.existing for k in keys):
+            raise _http_error(self.status)
+        return {"issues": [{"key": k, "fields": {"summary": f"Summary of {k}"}} for k in keys]}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient({f"PROJ-{i}" for i in range(1, 121)})
+    monkeypatch.setattr(issues, "get_jira_client", lambda name: fake)
+    monkeypatch.setattr(issues, "resolve_instance_name", lambda name: "primary")
+    return fake
+
+
+def test_input_order_duplicates_and_invalid_keys(client):
+    result = issues.get_issues_bulk(["proj-3", "PROJ-1", "not a key", "PROJ-3"])
+    assert [r["key"] for r in result["issues"]] == ["PROJ-3", "PROJ-1", "not a key", "PROJ-3"]
+    assert result["issues"][0]["summary"] == "Summary of PROJ-3"
+    assert "error" in result["issues"][2]
+    assert client.searches == [["PROJ-3", "PROJ-1"]]
+    assert (result["found"], result["errors"], result["requests"]) == (3, 1, 1)
+
+
+def test_chunks_of_fifty(client):
+    keys = [f"PROJ-{i}" for i in range(1, 121)]
+    result = issues.get_issues_bulk(keys)
+    assert sorted(len(s) for s in client.searches) == [20, 50, 50]
+    assert result["requests"] == 3 and result["found"] == 120
+
+
+def test_missing_keys_only_fail_themselves(client):
+    keys = [f"PROJ-{i}" for i in range(1, 51)] + ["PROJ-999"]
+    keys[10] = "PROJ-404"
+    result = issues.get_issues_bulk(keys)
+    errors = {r["key"]: r["error"] for r in result["issues"] if "error" in r}
+    assert errors == {"PROJ-404": "Issue not found or not visible.", "PROJ-999": "Issue not found or not visible."}
+    assert result["found"] == 49
+    assert result["requests"] == len(client.searches) < 20
+
+
+def test_other_errors_fail_the_chunk_without_retrying(client):
+    client.status = 500
+    result = issues.get_issues_bulk(["PROJ-1", "PROJ-404"])
+    assert len(client.searches) == 1
+    assert all(r["error"].startswith("Failed to fetch") for r in result["issues"])
@@ -0,0 +1,57 @@
+"""Unit tests for the TTLCache used by the issue and catalog caches."""
+
+import time
+
+from cache import TTLCache
+
+
+def test_get_returns_stored_value_and_counts_hit():
+    c = TTLCache(max_entries=4, ttl=60)
+    c.put("a", 1)
+    assert c.get("a") == 1
+    assert c.stats()["hits"] == 1
+
+
+def test_missing_key_counts_miss():
+    c = TTLCache()
+    assert c.get("nope") is None
+    assert c.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    c = TTLCache(max_entries=2, ttl=60)
+    c.put("a", 1)
+    c.put("b", 2)
+    c.get("a")
+    c.put("c", 3)
+    assert c.get("b") is None
+    assert c.get("a") == 1
+    assert c.stats()["evictions"] == 1
+
+
+def test_expired_entry_is_a_miss():
+    c = TTLCache(ttl=0.01)
+    c.put("a", 1)
+    time.sleep(0.02)
+    assert c.get_entry("a") is None
+    assert len(c) == 0
+
+
+def test_get_entry_reports_age_and_touch_resets_it():
+    c = TTLCache(ttl=60)
+    c.put("a", 1)
+    time.sleep(0.02)
+    _, age = c.get_entry("a")
+    assert age >= 0.02
+    c.touch("a")
+    _, age = c.get_entry("a")
+    assert age < 0.02
+
+
+def test_invalidate_by_predicate():
+    c = TTLCache()
+    c.put(("i1", "PROJ-1", "summary"), 1)
+    c.put(("i1", "PROJ-1", "status"), 2)
+    c.put(("i1", "PROJ-2", "summary"), 3)
+    assert c.invalidate(lambda k: k[1] == "PROJ-1") == 2
+    assert len(c) == 1
@@ -0,0 +1,75 @@
+"""Unit tests for the concurrency module.
+
+A wrapped blocking tool must run off the event loop, so two concurrent
+calls overlap instead of serializing.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from concurrency import as_async_tool, map_concurrently
+
+
+def _slow_tool(issue_key: str, delay: float = 0.2, **kwargs) -> dict:
+    """Blocking stand-in for a tool doing network I/O."""
+    time.sleep(delay)
+    return {"key": issue_key}
+
+
+def test_as_async_tool_returns_result():
+    tool = as_async_tool(_slow_tool)
+    assert asyncio.run(tool(issue_key="PROJ-1", delay=0)) == {"key": "PROJ-1"}
+
+
+def test_as_async_tool_overlaps_concurrent_calls():
+    tool = as_async_tool(_slow_tool, ThreadPoolExecutor(max_workers=4))
+
+    async def run_both():
+        return await asyncio.gather(tool(issue_key="PROJ-1"), tool(issue_key="PROJ-2"))
+
+    start = time.perf_counter()
+    results = asyncio.run(run_both())
+    elapsed = time.perf_counter() - start
+    assert [r["key"] for r in results] == ["PROJ-1", "PROJ-2"]
+    assert elapsed < 0.35  # serialized would be ~0.4s
+
+
+def test_as_async_tool_propagates_exceptions():
+    def failing(**kwargs):
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(as_async_tool(failing)())
+
+
+def test_as_async_tool_preserves_name_and_doc():
+    tool = as_async_tool(_slow_tool)
+    assert tool.__name__ == "_slow_tool"
+    assert tool.__doc__ == _slow_tool.__doc__
+
+
+def test_map_concurrently_preserves_input_order():
+    def delayed(n):
+        time.sleep(0.05 * (3 - n))
+        return n * 10
+
+    assert map_concurrently(delayed, [0, 1, 2]) == [(0, None), (10, None), (20, None)]
+
+
+def test_map_concurrently_captures_per_item_errors():
+    def maybe_fail(n):
+        if n == 1:
+            raise ValueError("bad item")
+        return n
+
+    results = map_concurrently(maybe_fail, [0, 1, 2])
+    assert results[0] == (0, None)
+    assert results[1][0] is None and isinstance(results[1][1], ValueError)
+    assert results[2] == (2, None)
+
+
+def test_map_concurrently_empty_input():
+    assert map_concurrently(lambda x: x, []) == []
@@ -0,0 +1,116 @@
+"""Unit tests for Settings instance indexing and mtime-based hot reload."""
+
+import os
+
+import pytest
+
+from config import Settings
+
+BASE_CONFIG = """
+default_jira_instance: primary
+instances:
+  primary:
+    jira:
+      url: https://primary.atlassian.net
+      username: a@example.com
+      api_token: token-a
+  other:
+    jira:
+      url: https://other.atlassian.net
+      username: b@example.com
+      api_token: token-b
+"""
+
+
+def _write(path, text, mtime_offset=0):
+    path.write_text(text)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + mtime_offset))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    _write(path, BASE_CONFIG)
+    return path
+
+
+def test_instances_are_indexed_once(config_file):
+    s = Settings(config_file=config_file)
+    assert s.get_jira_instances() is s.get_jira_instances()
+    assert s.get_default_instance_name() == "primary"
+    assert s.get_jira_instance().url == "https://primary.atlassian.net"
+
+
+def test_instance_index_is_read_only(config_file):
+    s = Settings(config_file=config_file)
+    with pytest.raises(TypeError):
+        s.get_jira_instances()["new"] = None
+
+
+def test_unchanged_mtime_does_not_reload(config_file):
+    s = Settings(config_file=config_file)
+    assert s.reload_if_changed(force=True) is False
+
+
+def test_reload_picks_up_new_instance_and_reports_changes(config_file):
+    s = Settings(config_file=config_file)
+    changes = []
+    s.add_reload_listener(changes.append)
+
+    _write(config_file, BASE_CONFIG + """
+  added:
+    jira:
+      url: https://added.atlassian.net
+      username: c@example.com
+      api_token: token-c
+""", mtime_offset=10**9)
+
+    assert s.reload_if_changed(force=True) is True
+    assert "added" in s.get_jira_instances()
+    assert changes == [{"added"}]
+
+
+def test_reload_reports_modified_instance(config_file):
+    s = Settings(config_file=config_file)
+    changes = []
+    s.add_reload_listener(changes.append)
+
+    _write(config_file, BASE_CONFIG.replace("token-b", "token-b2"), mtime_offset=10**9)
+
+    assert s.reload_if_changed(force=True) is True
+    assert s.get_jira_instance("other").token == "token-b2"
+    assert changes == [{"other"}]
+
+
+def test_invalid_yaml_keeps_previous_index(config_file):
+    s = Settings(config_file=config_file)
+    _write(config_file, "instances: [unclosed", mtime_offset=10**9)
+    assert s.reload_if_changed(force=True) is False
+    assert set(s.get_jira_instances()) == {"primary", "other"}
+
+
+def test_reload_check_is_throttled(config_file):
+    s = Settings(config_file=config_file)
+    _write(config_file, BASE_CONFIG.replace("token-a", "token-a2"), mtime_offset=10**9)
+    assert s.reload_if_changed() is False
+    assert s.get_jira_instance("primary").token == "token-a"
+
+
+def test_explicit_instance_name_picks_up_edited_credentials(config_file, monkeypatch):
+    import jira_client
+
+    s = Settings(config_file=config_file)
+    s.RELOAD_CHECK_INTERVAL = 0
+    s.add_reload_listener(jira_client._invalidate_instances)
+    monkeypatch.setattr(jira_client, "settings", s)
+    monkeypatch.setattr(jira_client, "_jira_clients", {})
+    monkeypatch.setattr(jira_client, "_sessions", {})
+
+    before = jira_client.get_jira_client("other")
+    assert jira_client.get_jira_client("other") is before
+
+    _write(config_file, BASE_CONFIG.replace("token-b", "token-b2"), mtime_offset=10**9)
+    after = jira_client.get_jira_client("other")
+    assert after is not before
+    assert after.password == "token-b2"
@@ -0,0 +1,36 @@
+"""Unit tests for the size-bounded on-disk cache."""
+
+import os
+import time
+
+from disk_cache import DiskCache, content_key
+
+
+def test_round_trip_and_miss(tmp_path):
+    cache = DiskCache(tmp_path, 1000)
+    key = content_key("svg", "title", "{}")
+    assert cache.get(key) is None
+    cache.put(key, b"<svg/>")
+    assert cache.get(key) == b"<svg/>"
+    stats = cache.stats()
+    assert (stats["files"], stats["bytes"], stats["hits"], stats["misses"]) == (1, 6, 1, 1)
+
+
+def test_evicts_least_recently_used_when_over_budget(tmp_path):
+    cache = DiskCache(tmp_path, 350)
+    keys = [content_key(str(i)) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, bytes(100))
+        os.utime(cache.path_for(key), (time.time() - 100 + i, time.time() - 100 + i))
+    cache.get(keys[0])  # refresh: keys[1] is now the oldest
+    cache.put(content_key("new"), bytes(100))
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats()["bytes"] <= 350
+
+
+def test_disabled_and_oversized_values_are_not_stored(tmp_path):
+    assert DiskCache(tmp_path, 0).put("ab" * 32, b"x") is None
+    cache = DiskCache(tmp_path, 10)
+    assert cache.put("cd" * 32, bytes(11)) is None
+    assert cache.stats()["files"] == 0
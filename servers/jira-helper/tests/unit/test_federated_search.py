@@ -0,0 +1,60 @@
+"""Unit tests for search_all_instances."""
+
+import threading
+
+import pytest
+
+from tools import search
+
+
+def _issue(key, updated):
+    return {"key": key, "fields": {"summary": key, "updated": updated, "status": {"name": "Open"}}}
+
+
+class Client:
+    cloud = False
+
+    def __init__(self, issues=(), error=None, block=None):
+        self.issues = list(issues)
+        self.error = error
+        self.block = block
+
+    def jql(self, jql, fields, start, limit):
+        if self.block is not None:
+            self.block.wait(5)
+        if self.error:
+            raise RuntimeError(self.error)
+        return {"startAt": start, "total": len(self.issues), "issues": self.issues[start:start + limit]}
+
+
+@pytest.fixture
+def instances(monkeypatch):
+    release = threading.Event()
+    clients = {
+        "alpha": Client([_issue("A-1", "2026-03-01T10:00:00.000+0000"), _issue("A-2", "2026-01-01T10:00:00.000+0000")]),
+        # 11:00 at +0200 is 09:00 UTC, i.e. older than A-1.
+        "beta": Client([_issue("B-1", "2026-03-01T11:00:00.000+0200")]),
+        "broken": Client(error="401 Unauthorized"),
+        "slow": Client([_issue("S-1", "2026-04-01T00:00:00.000+0000")], block=release),
+    }
+    monkeypatch.setattr(search, "get_instances_info", lambda: [{"name": n} for n in clients])
+    monkeypatch.setattr(search, "get_jira_client", lambda name: clients[name])
+    yield clients
+    release.set()
+
+
+def test_results_are_merged_and_failures_reported(instances):
+    result = search.search_all_instances("status = Open", timeout_seconds=0.5)
+    assert [i["key"] for i in result["issues"]] == ["A-1", "B-1", "A-2"]
+    assert {i["instance"] for i in result["issues"]} == {"alpha", "beta"}
+    status = {r["instance"]: r["status"] for r in result["instances"]}
+    assert status == {"alpha": "ok", "beta": "ok", "broken": "error", "slow": "timeout"}
+    assert result["succeeded"] == 2 and result["failed"] == 2
+    assert result["elapsed_seconds"] < 2
+
+
+def test_instance_subset_and_unknown_names(instances):
+    result = search.search_all_instances("status = Open", instances="beta", sort_by="key")
+    assert [r["instance"] for r in result["instances"]] == ["beta"]
+    with pytest.raises(search.JiraValidationError, match="Unknown instance"):
+        search.search_all_instances("status = Open", instances=["gamma"])
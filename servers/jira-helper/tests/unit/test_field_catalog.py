@@ -0,0 +1,67 @@
+"""Unit tests for the cached field catalog and value rendering."""
+
+import pytest
+
+import field_catalog
+from exceptions import JiraValidationError
+from field_catalog import FieldCatalog, render_field_value
+
+FIELDS = [
+    {"id": "summary", "name": "Summary", "custom": False, "schema": {"type": "string"}},
+    {"id": "customfield_10016", "name": "Story Points", "custom": True, "schema": {"type": "number"}},
+    {"id": "customfield_10020", "name": "Team", "custom": True, "schema": {"type": "option"}},
+    {"id": "customfield_10030", "name": "Team", "custom": True, "schema": {"type": "string"}},
+    {"id": "customfield_10040", "name": "Reviewers", "custom": True,
+     "schema": {"type": "array", "items": "user"}},
+]
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+
+    def get_all_fields(self):
+        self.calls += 1
+        return FIELDS
+
+
+@pytest.fixture(autouse=True)
+def clean_catalogs():
+    field_catalog._catalogs.clear()
+    yield
+    field_catalog._catalogs.clear()
+
+
+def test_resolve_by_id_and_case_insensitive_name():
+    catalog = FieldCatalog(FIELDS)
+    assert catalog.resolve("customfield_10016") == "customfield_10016"
+    assert catalog.resolve("story points") == "customfield_10016"
+    assert catalog.resolve_values({"Story Points": 3}) == {"customfield_10016": 3}
+
+
+def test_resolve_rejects_unknown_and_ambiguous_names():
+    catalog = FieldCatalog(FIELDS)
+    with pytest.raises(JiraValidationError, match="Unknown"):
+        catalog.resolve("Nope")
+    with pytest.raises(JiraValidationError, match="ambiguous"):
+        catalog.resolve("Team")
+
+
+def test_catalog_is_fetched_once_per_instance():
+    client = FakeClient()
+    field_catalog.get_field_catalog(client, "primary")
+    field_catalog.get_field_catalog(client, "primary")
+    assert client.calls == 1
+    assert len(field_catalog.get_field_catalog(client, "primary").custom_fields()) == 4
+
+
+def test_render_field_value():
+    assert render_field_value({"value": "Red"}, {"type": "option"}) == "Red"
+    assert render_field_value(
+        {"value": "EU", "child": {"value": "Berlin"}}, {"type": "option-with-child"}
+    ) == "EU / Berlin"
+    assert render_field_value(
+        [{"displayName": "Ann"}, {"displayName": "Bo"}], {"type": "array", "items": "user"}
+    ) == ["Ann", "Bo"]
+    assert render_field_value(5.0, {"type": "number"}) == 5.0
+    assert render_field_value(None) is None
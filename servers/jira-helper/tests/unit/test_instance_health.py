@@ -0,0 +1,144 @@
+"""Unit tests for cached instance health in jira_client.
+
+No network: health state is recorded directly (or by a pooled adapter whose
+underlying send is replaced) and get_jira_client must fail fast (or not)
+based on it.
+"""
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+import jira_client
+from config import HttpSettings, settings
+from exceptions import JiraAuthenticationError, JiraConnectionError
+
+
+@pytest.fixture(autouse=True)
+def clean_health():
+    jira_client._health.clear()
+    yield
+    jira_client._health.clear()
+
+
+def test_recent_connection_failure_fails_fast():
+    jira_client._record_health(("primary", "jira"), False, "connection", "refused")
+    with pytest.raises(JiraConnectionError, match="refused"):
+        jira_client.get_jira_client("primary")
+
+
+def test_recent_auth_failure_raises_authentication_error():
+    jira_client._record_health(("primary", "jira"), False, "auth", "HTTP 401 Unauthorized")
+    with pytest.raises(JiraAuthenticationError):
+        jira_client.get_jira_client("primary")
+
+
+def test_expired_failure_allows_retry(monkeypatch):
+    monkeypatch.setattr(settings, "health_check_ttl", 0)
+    jira_client._record_health(("primary", "jira"), False, "connection", "refused")
+    assert jira_client.get_jira_client("primary") is not None
+
+
+def test_client_creation_makes_no_request():
+    client = jira_client.get_jira_client("primary")
+    assert client is jira_client.get_jira_client("primary")
+    assert jira_client.get_instance_health("primary") is None
+
+
+def _adapter(monkeypatch, outcomes):
+    """A pooled adapter whose underlying sends return or raise `outcomes` in order."""
+    calls = []
+
+    def send(self, request, **kwargs):
+        calls.append(request.method)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = requests.Response()
+        response.status_code = outcome
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    adapter = jira_client._PooledHTTPAdapter(HttpSettings(), ("primary", "jira"))
+    return adapter, calls
+
+
+def _request(method="GET"):
+    return requests.Request(method, "https://primary.atlassian.net/rest/api/2/myself").prepare()
+
+
+def _stale_connection():
+    return requests.ConnectionError(ProtocolError("Connection aborted.", ConnectionResetError(104, "reset")))
+
+
+def _refused():
+    return requests.ConnectionError(MaxRetryError(None, "/", NewConnectionError(None, "refused")))
+
+
+def test_stale_keep_alive_get_is_resent(monkeypatch):
+    adapter, calls = _adapter(monkeypatch, [_stale_connection(), 200])
+    assert adapter.send(_request()).status_code == 200
+    assert calls == ["GET", "GET"]
+    assert jira_client._health[("primary", "jira")]["healthy"] is True
+
+
+def test_non_connect_failures_trip_only_after_several_in_a_row(monkeypatch):
+    adapter, calls = _adapter(monkeypatch, [_stale_connection()] * jira_client.FAIL_FAST_AFTER)
+    for _ in range(jira_client.FAIL_FAST_AFTER - 1):
+        with pytest.raises(requests.ConnectionError):
+            adapter.send(_request("POST"))
+        jira_client._raise_if_unhealthy(("primary", "jira"))
+    with pytest.raises(requests.ConnectionError):
+        adapter.send(_request("POST"))
+    assert calls == ["POST"] * jira_client.FAIL_FAST_AFTER
+    with pytest.raises(JiraConnectionError):
+        jira_client._raise_if_unhealthy(("primary", "jira"))
+
+
+def test_connect_failure_trips_and_success_resets(monkeypatch):
+    adapter, _ = _adapter(monkeypatch, [_refused(), 200])
+    with pytest.raises(requests.ConnectionError):
+        adapter.send(_request())
+    state = jira_client._health[("primary", "jira")]
+    assert state["healthy"] is False and state["failures"] == 1
+    adapter.send(_request())
+    assert jira_client._health[("primary", "jira")] | {"checked_at": 0} == {
+        "healthy": True, "kind": "", "error": "", "failures": 0, "checked_at": 0,
+    }
+
+
+def test_one_probe_per_interval_while_failing_fast(monkeypatch):
+    key = ("primary", "jira")
+    jira_client._record_health(key, False, "connection", "refused")
+    jira_client._health[key]["checked_at"] -= jira_client.PROBE_INTERVAL_SECONDS
+    jira_client._raise_if_unhealthy(key)  # the probe
+    with pytest.raises(JiraConnectionError):
+        jira_client._raise_if_unhealthy(key)
+
+
+def test_warm_up_records_each_instance(monkeypatch):
+    class Client:
+        def __init__(self, error=None):
+            self.error = error
+
+        def myself(self):
+            if self.error:
+                raise RuntimeError(self.error)
+
+    clients = {"good": Client(), "locked": Client("401 Unauthorized"), "down": Client("timed out")}
+    monkeypatch.setattr(jira_client, "_create_jira_client", clients.__getitem__)
+    results = jira_client.warm_up_instances(list(clients))
+    assert results["good"]["healthy"] is True and "latency_ms" in results["good"]
+    assert results["locked"]["kind"] == "auth"
+    assert results["down"]["kind"] == "connection"
+    assert jira_client.get_instance_health("down")["healthy"] is False
+
+
+def test_pool_stats_report_configured_size(monkeypatch):
+    monkeypatch.setattr(jira_client, "_sessions", {})
+    jira_client._get_session("primary", "jira")
+    stats = jira_client.get_pool_stats()
+    assert stats[0]["instance"] == "primary" and stats[0]["product"] == "jira"
+    assert stats[0]["pool_maxsize"] == settings.get_http_settings("primary").pool_maxsize
+    assert stats[0]["pools"] == []
@@ -0,0 +1,73 @@
+"""Unit tests for the issue read cache and its `updated` revalidation."""
+
+import pytest
+
+import issue_cache
+from config import settings
+
+
+class FakeClient:
+    def __init__(self):
+        self.updated = "2026-01-01T00:00:00.000+0000"
+        self.calls = []
+
+    def issue(self, key, fields="*all"):
+        self.calls.append(fields)
+        return {"key": key, "fields": {"summary": "s", "updated": self.updated}}
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(monkeypatch):
+    monkeypatch.setattr(settings, "issue_cache_enabled", True)
+    monkeypatch.setattr(settings, "issue_cache_fresh_seconds", 30)
+    issue_cache._cache.clear()
+    yield
+    issue_cache._cache.clear()
+
+
+def test_fresh_entry_is_served_without_request():
+    client = FakeClient()
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    assert client.calls == ["summary,updated"]
+
+
+def test_stale_unchanged_entry_is_revalidated_with_updated_only(monkeypatch):
+    client = FakeClient()
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    monkeypatch.setattr(settings, "issue_cache_fresh_seconds", 0)
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    assert client.calls == ["summary,updated", "updated"]
+
+
+def test_stale_changed_entry_is_refetched(monkeypatch):
+    client = FakeClient()
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    monkeypatch.setattr(settings, "issue_cache_fresh_seconds", 0)
+    client.updated = "2026-01-02T00:00:00.000+0000"
+    issue = issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    assert client.calls == ["summary,updated", "updated", "summary,updated"]
+    assert issue["fields"]["updated"] == client.updated
+
+
+def test_invalidate_issue_forces_refetch():
+    client = FakeClient()
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    issue_cache.invalidate_issue("primary", "PROJ-1")
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    assert client.calls == ["summary,updated", "summary,updated"]
+
+
+def test_different_field_sets_are_cached_separately():
+    client = FakeClient()
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    issue_cache.get_issue(client, "primary", "PROJ-1", "attachment")
+    assert len(client.calls) == 2
+
+
+def test_disabled_cache_always_fetches(monkeypatch):
+    monkeypatch.setattr(settings, "issue_cache_enabled", False)
+    client = FakeClient()
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    issue_cache.get_issue(client, "primary", "PROJ-1", "summary")
+    assert len(client.calls) == 2
@@ -0,0 +1,59 @@
+"""Unit tests for paginated comment loading in get_full_issue_details."""
+
+import pytest
+
+from config import settings
+from tools import issues
+
+COMMENTS = [{"id": str(i), "body": f"comment {i}", "created": f"2026-01-{i + 1:02d}"} for i in range(12)]
+
+
+class FakeClient:
+    def __init__(self):
+        self.comment_requests = []
+
+    def issue(self, key, fields="*all"):
+        return {"key": key, "fields": {"summary": "s", "updated": "u"}}
+
+    def resource_url(self, resource):
+        return f"rest/api/2/{resource}"
+
+    def get(self, path, params=None):
+        self.comment_requests.append((path, params))
+        ordered = COMMENTS[::-1] if params["orderBy"] == "-created" else COMMENTS
+        start = params["startAt"]
+        return {"comments": ordered[start:start + params["maxResults"]], "total": len(COMMENTS)}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(issues, "get_jira_client", lambda name: client)
+    monkeypatch.setattr(issues, "resolve_instance_name", lambda name: "primary")
+    monkeypatch.setattr(settings, "issue_cache_enabled", False)
+    return client
+
+
+def test_comments_are_paged_with_cursor(client):
+    result = issues.get_full_issue_details("PROJ-1", comment_limit=5)
+    assert [c["id"] for c in result["comments"]] == ["0", "1", "2", "3", "4"]
+    assert result["comment_total"] == 12
+    assert result["next_comment_offset"] == 5
+
+    last = issues.get_full_issue_details("PROJ-1", comment_limit=5, comment_offset=10)
+    assert [c["id"] for c in last["comments"]] == ["10", "11"]
+    assert last["next_comment_offset"] is None
+    assert client.comment_requests[0] == (
+        "rest/api/2/issue/PROJ-1/comment", {"startAt": 0, "maxResults": 5, "orderBy": "created"}
+    )
+
+
+def test_newest_first(client):
+    result = issues.get_full_issue_details("PROJ-1", comment_limit=2, newest_first=True)
+    assert [c["id"] for c in result["comments"]] == ["11", "10"]
+
+
+def test_comments_can_be_skipped(client):
+    result = issues.get_full_issue_details("PROJ-1", include_comments=False)
+    assert "comments" not in result
+    assert client.comment_requests == []
@@ -0,0 +1,75 @@
+"""Unit tests for link type validation and concurrent link creation."""
+
+import pytest
+
+from exceptions import JiraValidationError
+from tools import links
+
+LINK_TYPES = [
+    {"id": "1", "name": "Blocks", "inward": "is blocked by", "outward": "blocks"},
+    {"id": "2", "name": "Relates", "inward": "relates to", "outward": "relates to"},
+]
+
+
+class FakeClient:
+    def __init__(self):
+        self.type_calls = 0
+        self.links = []
+        self.created = []
+
+    def get_issue_link_types(self):
+        self.type_calls += 1
+        return LINK_TYPES
+
+    def issue_create(self, fields):
+        self.created.append(fields)
+        return {"key": "PROJ-100", "id": "100"}
+
+    def create_issue_link(self, data):
+        if data["outwardIssue"]["key"] == "PROJ-404":
+            raise RuntimeError("Issue does not exist")
+        self.links.append((data["inwardIssue"]["key"], data["outwardIssue"]["key"], data["type"]["name"]))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(links, "get_jira_client", lambda name: fake)
+    monkeypatch.setattr(links, "resolve_instance_name", lambda name: "primary")
+    links._link_types.clear()
+    yield fake
+    links._link_types.clear()
+
+
+def test_resolve_link_type_by_name_or_description(client):
+    assert links.resolve_link_type(client, "primary", "blocks") == ("Blocks", False)
+    assert links.resolve_link_type(client, "primary", "Is Blocked By") == ("Blocks", True)
+    assert links.resolve_link_type(client, "primary", "relates") == ("Relates", False)
+    assert links.resolve_link_type(client, "primary", "relates to") == ("Relates", False)
+    assert client.type_calls == 1
+
+
+def test_inward_description_swaps_link_ends(client):
+    links.create_issue_with_links("PROJ", "s", links=[
+        {"issue_key": "PROJ-1", "link_type": "blocks"},
+        {"issue_key": "PROJ-2", "link_type": "is blocked by"},
+    ])
+    # PROJ-100 blocks PROJ-1; PROJ-2 blocks PROJ-100.
+    assert sorted(client.links) == [("PROJ-100", "PROJ-1", "Blocks"), ("PROJ-2", "PROJ-100", "Blocks")]
+
+
+def test_unknown_link_type_fails_before_creating_issue(client):
+    with pytest.raises(JiraValidationError, match="Unknown link type"):
+        links.create_issue_with_links("PROJ", "s", links=[{"issue_key": "PROJ-1", "link_type": "Duplicates"}])
+    assert client.created == []
+
+
+def test_links_created_with_per_link_results(client):
+    specs = [{"issue_key": f"proj-{i}", "link_type": "blocks"} for i in range(1, 21)]
+    specs.append({"issue_key": "PROJ-404"})
+    result = links.create_issue_with_links("PROJ", "s", links=specs)
+    assert result["links_created"] == 20
+    assert len(client.links) == 20
+    assert [entry["issue_key"] for entry in result["links"]][:2] == ["PROJ-1", "PROJ-2"]
+    assert all("elapsed_ms" in entry for entry in result["links"][:20])
+    assert "does not exist" in result["links"][20]["error"]
@@ -0,0 +1,197 @@
+"""Unit tests for the local SQLite mirror."""
+
+import pytest
+
+import jira_client
+import mirror
+from config import settings
+from tools import issues as issue_tools
+from tools import search
+
+
+def _issue(key, status="Open", assignee=None, updated="2026-03-01T10:00:00.000+0000"):
+    return {"key": key, "fields": {
+        "summary": f"Summary of {key}",
+        "status": {"name": status},
+        "assignee": {"accountId": assignee, "displayName": assignee.title()} if assignee else None,
+        "issuetype": {"name": "Task"},
+        "priority": {"name": "Medium"},
+        "created": "2026-01-01T10:00:00.000+0000",
+        "updated": updated,
+    }}
+
+
+class Client:
+    cloud = False
+
+    def __init__(self, issues):
+        self.issues = list(issues)
+        self.queries = []
+        self.on_page = None
+
+    def jql(self, jql, fields, start, limit):
+        self.queries.append(jql)
+        issues = list(self.issues)
+        if "ORDER BY key" in jql:
+            issues.sort(key=lambda i: int(i["key"].split("-")[1]))
+        elif "ORDER BY updated" in jql:
+            issues.sort(key=lambda i: i["fields"]["updated"])
+        page = {"startAt": start, "total": len(issues), "issues": issues[start:start + limit]}
+        if self.on_page:
+            self.on_page()
+        return page
+
+
+@pytest.fixture
+def local(tmp_path, monkeypatch):
+    client = Client([_issue("PROJ-1", assignee="ann"), _issue("PROJ-2", status="Done"), _issue("PROJ-10")])
+    monkeypatch.setattr(jira_client, "get_jira_client", lambda name: client)
+    monkeypatch.setattr(search, "get_jira_client", lambda name: client)
+    monkeypatch.setattr(search, "is_cloud_url", lambda url: client.cloud)
+    m = mirror.Mirror(tmp_path / "m.sqlite3", {"primary": ["proj"]})
+    monkeypatch.setattr(search, "get_mirror", lambda: m)
+    monkeypatch.setattr(issue_tools, "get_mirror", lambda: m)
+    monkeypatch.setattr(mirror, "get_mirror", lambda: m)
+    m.client = client
+    return m
+
+
+@pytest.mark.parametrize("jql", [
+    "project = PROJ OR status = Done",
+    "summary ~ login",
+    "assignee = currentUser()",
+    "project = PROJ AND (status = Done)",
+    "project = PROJ ORDER BY rank",
+    "",
+    "project = PROJ AND assignee = EMPTY",
+    "project = PROJ AND assignee != null",
+    "project = PROJ AND assignee in (EMPTY, bob)",
+    "project = PROJ AND priority not in (High, NULL)",
+    "project = PROJ AND status = 10001",
+    "project = PROJ AND priority in (High, '3')",
+    "project = 10000",
+])
+def test_unsupported_jql(jql):
+    assert mirror.parse_jql(jql) is None
+
+
+def test_supported_jql():
+    q = mirror.parse_jql('project = PROJ AND status in ("In Progress", \'Done, really\') ORDER BY updated DESC')
+    assert q["projects"] == {"PROJ"}
+    assert q["params"] == ["PROJ", "In Progress", "Done, really"]
+    assert q["order"] == "updated_ts DESC"
+
+
+def test_quoted_empty_and_non_id_numbers_are_literals():
+    q = mirror.parse_jql('project = PROJ AND assignee = "EMPTY" AND reporter = 12345')
+    assert q["params"] == ["PROJ", "EMPTY", "EMPTY", "12345", "12345"]
+    assert mirror.parse_jql("project = PROJ AND assignee is EMPTY")["where"][-1] == (
+        "(assignee_id IS NULL AND assignee_name IS NULL)"
+    )
+
+
+def test_sync_loop_survives_errors(local, monkeypatch, caplog):
+    calls = []
+
+    def sync_due():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        raise SystemExit  # stop the loop
+
+    monkeypatch.setattr(local, "sync_due", sync_due)
+    monkeypatch.setattr(settings, "mirror_interval", 0)
+    with pytest.raises(SystemExit):
+        local.run_forever()
+    assert len(calls) == 2
+    assert "Mirror sync pass failed" in caplog.text
+
+
+def test_first_sync_is_full_then_delta(local):
+    assert local.sync_project("primary", "PROJ")["full"] is True
+    assert local.client.queries[-1] == 'project = "PROJ" ORDER BY key ASC'
+    assert local.sync_project("primary", "PROJ")["full"] is False
+    assert 'AND updated >= "-2m"' in local.client.queries[-1]
+
+
+def test_search_and_issue_served_from_mirror(local):
+    local.sync_due()
+    result = search.search_jira_issues("project = PROJ AND status != Done", max_results=1)
+    assert result["freshness"]["source"] == "mirror"
+    assert [i["key"] for i in result["issues"]] == ["PROJ-10"]
+    assert result["total"] == 2 and result["next_start_at"] == 1
+
+    result = search.search_jira_issues("project = PROJ AND assignee = ann")
+    assert [i["key"] for i in result["issues"]] == ["PROJ-1"]
+
+    detail = issue_tools.get_issue_details("PROJ-2")
+    assert detail["status"] == "Done" and "freshness" in detail
+    assert local.status()["reads_served"] == 3
+
+
+def test_unsupported_or_unmirrored_queries_go_to_jira(local):
+    local.sync_due()
+    queries = len(local.client.queries)
+    result = search.search_jira_issues("project = OTHER")
+    assert "freshness" not in result
+    result = search.search_jira_issues("project = PROJ", use_mirror=False)
+    assert "freshness" not in result
+    assert len(local.client.queries) == queries + 2
+
+
+def test_stale_or_dirty_projects_are_bypassed(local, monkeypatch):
+    local.sync_due()
+    local.mark_dirty("primary", "PROJ-1")
+    assert local.search("primary", "project = PROJ", 0, 10) is None
+    assert local.status()["projects"][0]["dirty"] is True
+
+    local.sync_due()
+    assert local.search("primary", "project = PROJ", 0, 10) is not None
+    monkeypatch.setattr(settings, "mirror_max_staleness", -1)
+    assert local.get_issue("primary", "PROJ-1") is None
+
+
+def test_full_resync_drops_removed_issues(local):
+    local.sync_due()
+    local.client.issues = local.client.issues[1:]
+    local.sync_project("primary", "PROJ")
+    assert local.get_issue("primary", "PROJ-1") is not None
+    local.sync_project("primary", "PROJ", full=True)
+    assert local.get_issue("primary", "PROJ-1") is None
+    assert local.status()["projects"][0]["issue_count"] == 2
+
+
+def test_issue_edited_during_paging_is_not_skipped(local, monkeypatch):
+    local.client.issues = [_issue(f"PROJ-{i}") for i in range(1, 6)]
+    monkeypatch.setattr(mirror, "SYNC_PAGE_SIZE", 2)
+
+    def edit_first_issue():
+        # After the first page, PROJ-1 is edited and would move to the end of
+        # an updated-ordered result set.
+        local.client.issues[0] = _issue("PROJ-1", updated="2026-05-01T10:00:00.000+0000")
+
+    local.client.on_page = edit_first_issue
+    result = local.sync_project("primary", "PROJ", full=True)
+    assert result["issue_count"] == 5
+    assert all(local.get_issue("primary", f"PROJ-{i}") for i in range(1, 6))
+
+
+def test_cloud_only_serves_complete_first_pages(local):
+    local.sync_due()
+    local.client.cloud = True
+    local.client.enhanced_jql = lambda jql, fields, nextPageToken, limit: {
+        "issues": [_issue("PROJ-1")], "nextPageToken": "t2", "isLast": False,
+    }
+    result = search.search_jira_issues("project = PROJ", max_results=1)
+    assert "freshness" not in result and result["next_page_token"] == "t2"
+    result = search.search_jira_issues("project = PROJ", max_results=3)
+    assert result["freshness"]["source"] == "mirror" and result["is_last"]
+    assert "next_start_at" not in result
+
+
+@pytest.mark.parametrize("max_results, returned", [(-5, 1), (0, 1), (10**6, 3)])
+def test_mirror_page_size_is_clamped(local, max_results, returned):
+    local.sync_due()
+    result = search.search_jira_issues("project = PROJ", max_results=max_results)
+    assert len(result["issues"]) == returned
+    assert result.get("next_start_at") in (None, 1)
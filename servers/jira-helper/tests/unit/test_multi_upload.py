@@ -0,0 +1,73 @@
+"""Unit tests for concurrent multi-file uploads."""
+
+import threading
+
+import pytest
+
+from config import settings
+from exceptions import JiraValidationError
+from tools import files
+
+
+class FakeClient:
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.uploaded = []
+        self.lock = threading.Lock()
+
+    def get_attachment_meta(self):
+        return {"enabled": True, "uploadLimit": 1000}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeClient()
+
+    def fake_stream(c, key, path):
+        name = path.rsplit("/", 1)[-1]
+        if name in c.fail:
+            raise RuntimeError("500 Server Error")
+        with c.lock:
+            c.uploaded.append(name)
+        return {"attachment_id": str(len(c.uploaded)), "filename": name, "size": 10,
+                "duration_seconds": 0.01, "throughput_mb_s": 0.0}
+
+    monkeypatch.setattr(files, "get_jira_client", lambda name: client)
+    monkeypatch.setattr(files, "resolve_instance_name", lambda name: "primary")
+    monkeypatch.setattr(files, "stream_attachment", fake_stream)
+    monkeypatch.setattr(settings, "attachment_max_upload_bytes", None)
+    files._attachment_meta.clear()
+    return client
+
+
+@pytest.fixture
+def shots(tmp_path):
+    for i in range(5):
+        (tmp_path / f"shot{i}.png").write_bytes(b"x" * 10)
+    (tmp_path / "notes.txt").write_bytes(b"x" * 10)
+    return tmp_path
+
+
+def test_glob_uploads_matching_files_in_order(client, shots):
+    result = files.upload_files_to_jira("PROJ-1", glob_pattern=str(shots / "*.png"), max_workers=3)
+    assert [f["filename"] for f in result["files"]] == [f"shot{i}.png" for i in range(5)]
+    assert result["uploaded"] == 5 and result["failed"] == 0
+    assert result["total_bytes"] == 50
+    assert sorted(client.uploaded) == [f"shot{i}.png" for i in range(5)]
+
+
+def test_files_are_validated_before_any_upload(client, shots):
+    (shots / "huge.png").write_bytes(b"x" * 2000)
+    with pytest.raises(JiraValidationError, match="Nothing was uploaded") as exc:
+        files.upload_files_to_jira("PROJ-1", file_paths=[str(shots / "shot0.png"), str(shots / "huge.png"),
+                                                         str(shots / "missing.png")])
+    assert "huge.png" in str(exc.value) and "missing.png" in str(exc.value)
+    assert client.uploaded == []
+
+
+def test_failures_are_reported_per_file(client, shots):
+    client.fail = {"shot1.png"}
+    result = files.upload_files_to_jira("PROJ-1", file_paths=f"{shots / 'shot0.png'},{shots / 'shot1.png'}")
+    assert [f["status"] for f in result["files"]] == ["ok", "error"]
+    assert "500" in result["files"][1]["error"]
+    assert result["uploaded"] == 1 and result["failed"] == 1
@@ -0,0 +1,70 @@
+"""Unit tests for response size budgets and elided-content cursors."""
+
+import json
+
+import pytest
+
+import output_budget
+from exceptions import JiraValidationError
+from output_budget import apply_budget, read_elided
+
+
+def _size(value):
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    output_budget._elided.clear()
+    yield
+    output_budget._elided.clear()
+
+
+def test_small_response_is_returned_unchanged():
+    result = {"key": "PROJ-1", "description": "short"}
+    assert apply_budget(result, "get_issue_details", 8192) is result
+
+
+def test_long_strings_are_cut_to_fit_and_reported():
+    cached = {"description": "d" * 30_000, "comments": [{"body": "c" * 20_000}, {"body": "short"}]}
+    result = apply_budget({"key": "PROJ-1", "issue": cached}, "get_full_issue_details", 8192)
+
+    assert _size(result) <= 8192
+    assert cached["description"] == "d" * 30_000  # input (possibly cached) is not modified
+    paths = {e["path"]: e for e in result["elided"]}
+    assert set(paths) == {"issue.description", "issue.comments[0].body"}
+    assert paths["issue.description"]["original_chars"] == 30_000
+    assert result["issue"]["comments"][1]["body"] == "short"
+    assert result["response_budget"]["original_bytes"] > 50_000
+
+
+def test_cursor_reads_the_rest_in_chunks():
+    text = "".join(str(i % 10) for i in range(20_000))
+    result = apply_budget({"body": text}, "get_confluence_page", 4096)
+    entry = result["elided"][0]
+    assert text.startswith(result["body"][:-3])
+
+    pieces, cursor = [result["body"][:-3]], entry["cursor"]
+    while cursor:
+        page = read_elided(cursor, 7000)
+        pieces.append(page["content"])
+        cursor = page["next_cursor"]
+    assert "".join(pieces) == text
+
+
+def test_unknown_cursor_and_tiny_budget_are_rejected():
+    with pytest.raises(JiraValidationError, match="expired"):
+        read_elided("deadbeef.0:10", 100)
+    with pytest.raises(JiraValidationError, match="at least"):
+        apply_budget({}, "get_issue_details", 100)
+
+
+def test_many_elided_strings_keep_their_cursors():
+    comments = [{"body": f"{i:03d}" + "x" * 2000} for i in range(300)]
+    result = apply_budget({"comments": comments}, "get_full_issue_details", 200_000)
+    assert len(result["elided"]) == 300
+    for i in (0, 150, 299):
+        entry = result["elided"][i]
+        page = read_elided(entry["cursor"], 10_000)
+        assert page["content"] == comments[i]["body"][entry["returned_chars"]:]
+    assert output_budget.get_stats()["entries"] == 1
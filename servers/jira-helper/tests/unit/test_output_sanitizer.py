@@ -7,7 +7,8 @@ corrupting content.
 
 import pytest
 
-from output_sanitizer import sanitize_string, truncate_string
+from output_sanitizer import sanitize_string, sanitize_value, truncate_string
+from projection import extract_extra_fields
 
 
 # ---------------------------------------------------------------------------
@@ -95,4 +96,17 @@ def test_truncate_string_uses_custom_suffix():
     long_string = "B" * 300
     result = truncate_string(long_string, max_length=100, suffix=" [truncated]")
     assert result.endswith(" [truncated]")
-    assert len(result) == 112  # 100 + len(" [truncated]")
\ No newline at end of file
+    assert len(result) == 112  # 100 + len(" [truncated]")
+
+def test_sanitize_value_escapes_nested_strings_without_mutating_input():
+    raw = {"notes": ["<b>bold</b>", {"text": "<environment_details>"}], "points": 3, "empty": None}
+    result = sanitize_value(raw)
+    assert result == {"notes": ["&lt;b>bold&lt;/b>", {"text": "&lt;environment_details>"}], "points": 3, "empty": None}
+    assert raw["notes"][0] == "<b>bold</b>"
+
+
+def test_extra_fields_are_sanitized():
+    fields = {"customfield_1": "<environment_details>", "customfield_2": [{"value": "<x>"}]}
+    assert extract_extra_fields(fields, ["customfield_1", "customfield_2"]) == {
+        "customfield_1": "&lt;environment_details>", "customfield_2": [{"value": "&lt;x>"}],
+    }
@@ -0,0 +1,105 @@
+"""Unit tests for the projection module."""
+
+from output_sanitizer import sanitize_string, truncate_string
+from projection import (
+    ISSUE_DETAIL_FIELDS,
+    attr,
+    build_fields_param,
+    compile_projection,
+    extract_extra_fields,
+    extract_issue_detail,
+    extract_links,
+    extract_search_row,
+    normalize_field_list,
+    raw,
+    to_table,
+)
+
+
+def test_build_fields_param_joins_base_fields():
+    assert build_fields_param(("summary", "status")) == "summary,status"
+
+
+def test_build_fields_param_appends_extras_without_duplicates():
+    param = build_fields_param(("summary", "status"), ["status", "customfield_1"])
+    assert param == "summary,status,customfield_1"
+
+
+def test_build_fields_param_accepts_comma_separated_extras():
+    param = build_fields_param(("summary",), " duedate , customfield_2,")
+    assert param == "summary,duedate,customfield_2"
+
+
+def test_issue_detail_fields_never_request_everything():
+    param = build_fields_param(ISSUE_DETAIL_FIELDS)
+    assert "*all" not in param
+    assert "summary" in param.split(",")
+
+
+def test_normalize_field_list_handles_none():
+    assert normalize_field_list(None) == []
+
+
+def test_extract_extra_fields_returns_requested_values_only():
+    issue_fields = {"summary": "x", "customfield_1": 5}
+    assert extract_extra_fields(issue_fields, ["customfield_1", "missing"]) == {
+        "customfield_1": 5, "missing": None,
+    }
+
+
+ISSUE = {
+    "key": "PROJ-1",
+    "fields": {
+        "summary": "<b>" + "x" * 300,
+        "status": {"name": "Open"},
+        "assignee": None,
+        "priority": {"name": "High"},
+        "issuetype": {"name": "Bug"},
+        "project": {"key": "PROJ"},
+        "description": None,
+        "components": [{"name": "api"}, {"name": "ui"}],
+    },
+}
+
+
+def test_search_row_matches_sanitize_then_truncate():
+    row = extract_search_row(ISSUE)
+    assert row["summary"] == truncate_string(sanitize_string(ISSUE["fields"]["summary"]), 200)
+    assert row["assignee"] == "Unassigned"
+    assert row["status"] == "Open"
+    assert list(row) == ["key", "summary", "status", "assignee", "priority", "issue_type", "project"]
+
+
+def test_issue_detail_handles_missing_and_empty_fields():
+    detail = extract_issue_detail(ISSUE)
+    assert detail["summary"].startswith("&lt;b>")
+    assert detail["description"] == ""
+    assert detail["reporter"] == ""
+    assert detail["labels"] == []
+    assert detail["components"] == ["api", "ui"]
+    assert extract_issue_detail({})["key"] == ""
+
+
+def test_extract_links_sanitizes_linked_summaries():
+    links = extract_links([
+        {"type": {"name": "Blocks"}, "outwardIssue": {"key": "PROJ-2", "fields": {"summary": "<x>"}}},
+        {"type": {"name": "Relates"}, "inwardIssue": {"key": "PROJ-3", "fields": {"status": {"name": "Done"}}}},
+    ])
+    assert links[0] == {"type": "Blocks", "direction": "outward", "issue_key": "PROJ-2",
+                        "summary": "&lt;x>", "status": ""}
+    assert links[1]["direction"] == "inward" and links[1]["status"] == "Done"
+
+
+def test_compile_projection_without_nesting():
+    extract = compile_projection({"id": raw("id"), "who": attr("author", "displayName", "?")}, nested=None)
+    assert extract({"id": "1", "author": None}) == {"id": "1", "who": "?"}
+
+
+def test_to_table_interns_repeated_values_only():
+    rows = [{"key": f"P-{i}", "status": "Open" if i % 3 else "Done", "summary": f"s{i}"} for i in range(6)]
+    table = to_table(rows, intern=("status", "summary"))
+    assert table["columns"] == ["key", "status", "summary"]
+    assert table["values"] == {"status": ["Done", "Open"]}  # summary is unique per row, so not interned
+    assert table["rows"][0] == ["P-0", 0, "s0"]
+    assert table["rows"][1] == ["P-1", 1, "s1"]
+    assert to_table([]) == {"columns": [], "rows": [], "values": {}}
@@ -0,0 +1,114 @@
+"""Unit tests for search pagination against in-memory fake clients."""
+
+import json
+
+from tools import search
+from tools.search import MAX_ALL_PAGES_RESULTS, fetch_all_pages, fetch_page
+
+ISSUES = [{"key": f"PROJ-{i}", "fields": {}} for i in range(1, 251)]
+
+
+class ServerClient:
+    """Jira Server/DC: startAt pagination with a total."""
+
+    cloud = False
+
+    def __init__(self):
+        self.starts = []
+
+    def jql(self, jql, fields, start, limit):
+        self.starts.append(start)
+        return {"startAt": start, "total": len(ISSUES), "issues": ISSUES[start:start + limit]}
+
+
+class CloudClient:
+    """Jira Cloud: opaque nextPageToken chain, no total."""
+
+    cloud = True
+
+    def enhanced_jql(self, jql, fields, nextPageToken, limit):
+        start = int(nextPageToken or 0)
+        page = ISSUES[start:start + limit]
+        end = start + len(page)
+        if end < len(ISSUES):
+            return {"issues": page, "nextPageToken": str(end)}
+        return {"issues": page, "isLast": True}
+
+
+def test_server_page_reports_next_start_at():
+    page = fetch_page(ServerClient(), "project = PROJ", "summary", 20, start_at=40)
+    assert len(page["issues"]) == 20
+    assert page["next_start_at"] == 60
+    assert page["is_last"] is False
+
+
+def test_server_last_page_has_no_cursor():
+    page = fetch_page(ServerClient(), "project = PROJ", "summary", 100, start_at=200)
+    assert page["is_last"] is True
+    assert page["next_start_at"] is None
+
+
+def test_cloud_page_reports_next_page_token():
+    page = fetch_page(CloudClient(), "project = PROJ", "summary", 20)
+    assert page["next_page_token"] == "20"
+    assert page["total"] is None
+
+
+def test_server_all_pages_fetches_every_offset_in_order():
+    client = ServerClient()
+    issues, paging = fetch_all_pages(client, "project = PROJ", "summary", MAX_ALL_PAGES_RESULTS)
+    assert [i["key"] for i in issues] == [i["key"] for i in ISSUES]
+    assert sorted(client.starts) == [0, 100, 200]
+    assert paging["is_last"] is True
+
+
+def test_all_pages_respects_row_cap():
+    issues, paging = fetch_all_pages(ServerClient(), "project = PROJ", "summary", 120)
+    assert len(issues) == 120
+    assert paging["truncated"] is True
+    assert paging["next_start_at"] == 120
+
+
+def test_cloud_all_pages_follows_token_chain():
+    issues, paging = fetch_all_pages(CloudClient(), "project = PROJ", "summary", MAX_ALL_PAGES_RESULTS)
+    assert len(issues) == len(ISSUES)
+    assert paging["is_last"] is True
+
+
+def test_table_format_is_smaller_and_round_trips(monkeypatch):
+    issues = [
+        {"key": f"PROJ-{i}", "fields": {
+            "summary": f"Issue {i}", "status": {"name": ("To Do", "Done")[i % 2]},
+            "assignee": {"displayName": f"User {i % 3}"}, "priority": {"name": "Medium"},
+            "issuetype": {"name": "Task"}, "project": {"key": "PROJ"},
+        }}
+        for i in range(100)
+    ]
+
+    class Client(ServerClient):
+        def jql(self, jql, fields, start, limit):
+            return {"startAt": start, "total": len(issues), "issues": issues[start:start + limit]}
+
+    monkeypatch.setattr(search, "get_jira_client", lambda name: Client())
+    monkeypatch.setattr(search, "resolve_instance_name", lambda name: "primary")
+    rows = search.search_jira_issues("project = PROJ", max_results=100)
+    table = search.search_jira_issues("project = PROJ", max_results=100, format="table")
+
+    t = table["issues"]
+    decoded = [
+        {c: t["values"][c][v] if c in t["values"] else v for c, v in zip(t["columns"], r)}
+        for r in t["rows"]
+    ]
+    assert decoded == rows["issues"]
+    assert len(json.dumps(table)) < 0.6 * len(json.dumps(rows))
+
+
+def test_cloud_total_is_none_until_known(monkeypatch):
+    monkeypatch.setattr(search, "get_jira_client", lambda name: CloudClient())
+    monkeypatch.setattr(search, "resolve_instance_name", lambda name: "primary")
+    page = search.search_jira_issues("project = PROJ", max_results=20)
+    assert page["total"] is None and page["is_last"] is False
+    capped = search.search_jira_issues("project = PROJ", all_pages=True, max_total=120)
+    assert capped["total"] is None and capped["truncated"] is True
+    full = search.search_jira_issues("project = PROJ", all_pages=True)
+    assert full["total"] == len(ISSUES)
@@ -0,0 +1,140 @@
+"""Unit tests for cached workflow transitions in `transition_jira_issue`."""
+
+import pytest
+from requests import HTTPError, Response
+
+import transition_cache
+from tools import issues
+
+WORKFLOW = {
+    "To Do": [{"id": "11", "name": "Start", "to": {"name": "In Progress"}}],
+    "In Progress": [
+        {"id": "21", "name": "Stop", "to": {"name": "To Do"}},
+        {"id": "31", "name": "Done", "to": {"name": "Done"}},
+    ],
+    "Done": [{"id": "41", "name": "Stop", "to": {"name": "To Do"}}],
+}
+
+
+class FakeClient:
+    def __init__(self, status="To Do"):
+        self.status = status
+        self.requests = []
+
+    def issue(self, key, fields=None, expand=None):
+        self.requests.append("GET")
+        return {
+            "key": key,
+            "fields": {
+                "project": {"key": "PROJ"},
+                "issuetype": {"name": "Task"},
+                "status": {"name": self.status},
+            },
+            "transitions": WORKFLOW[self.status],
+        }
+
+    def set_issue_status_by_transition_id(self, key, transition_id):
+        self.requests.append("POST")
+        for t in WORKFLOW[self.status]:
+            if t["id"] == transition_id:
+                self.status = t["to"]["name"]
+                return None
+        response = Response()
+        response.status_code = 400
+        raise HTTPError("400 Bad Request", response=response)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(issues, "get_jira_client", lambda name: fake)
+    monkeypatch.setattr(issues, "resolve_instance_name", lambda name: "primary")
+    transition_cache._transitions.clear()
+    transition_cache._issue_context.clear()
+    yield fake
+    transition_cache._transitions.clear()
+    transition_cache._issue_context.clear()
+
+
+def test_normalize_accepts_both_to_shapes():
+    raw = [{"id": 11, "name": "Start", "to": "In Progress"},
+           {"id": "21", "name": "Stop", "to": {"name": "To Do", "statusCategory": {"name": "To Do"}}}]
+    assert transition_cache.normalize_transitions(raw) == [
+        {"id": "11", "name": "Start", "to_status": "In Progress", "to_category": ""},
+        {"id": "21", "name": "Stop", "to_status": "To Do", "to_category": "To Do"},
+    ]
+
+
+def test_repeated_moves_use_one_request(client):
+    first = issues.transition_jira_issue("PROJ-1", transition_name="Start")
+    assert client.requests == ["GET", "POST"]
+    assert first["from_cache"] is False
+
+    # Learn "In Progress" transitions from another issue on the same workflow.
+    transition_cache.remember("primary", "PROJ", "Task", "In Progress",
+                              transition_cache.normalize_transitions(WORKFLOW["In Progress"]))
+    client.requests.clear()
+    second = issues.transition_jira_issue("PROJ-1", transition_name="Stop")
+    assert client.requests == ["POST"]
+    assert second["from_cache"] is True
+    assert client.status == "To Do"
+
+    client.requests.clear()
+    issues.transition_jira_issue("PROJ-1", transition_name="start")
+    assert client.requests == ["POST"]
+
+
+def test_stale_status_refetches_after_400(client):
+    issues.transition_jira_issue("PROJ-1", transition_name="Start")
+    transition_cache.remember("primary", "PROJ", "Task", "In Progress",
+                              transition_cache.normalize_transitions(WORKFLOW["In Progress"]))
+    client.status = "Done"  # moved by someone else
+    client.requests.clear()
+    result = issues.transition_jira_issue("PROJ-1", transition_name="Stop")
+    assert client.requests == ["POST", "GET", "POST"]
+    assert result["transition_id"] == "41"
+    assert result["from_cache"] is False
+
+
+class BulkClient(FakeClient):
+    def __init__(self, statuses):
+        super().__init__()
+        self.statuses = dict(statuses)
+
+    def jql(self, jql, fields=None, limit=50, validate_query=None):
+        self.requests.append("SEARCH")
+        return {"issues": [self._issue(k) for k in self.statuses if k in jql]}
+
+    def _issue(self, key):
+        return {"key": key, "fields": {
+            "project": {"key": "PROJ"}, "issuetype": {"name": "Task"},
+            "status": {"name": self.statuses[key]},
+        }}
+
+    def issue(self, key, fields=None, expand=None):
+        self.requests.append("GET")
+        return dict(self._issue(key), transitions=WORKFLOW[self.statuses[key]])
+
+    def set_issue_status_by_transition_id(self, key, transition_id):
+        self.requests.append("POST")
+        for t in WORKFLOW[self.statuses[key]]:
+            if t["id"] == transition_id:
+                self.statuses[key] = t["to"]["name"]
+                return None
+        raise AssertionError("unexpected transition")
+
+
+def test_bulk_resolves_transitions_once_per_status(monkeypatch, client):
+    bulk = BulkClient({"PROJ-1": "To Do", "PROJ-2": "To Do", "PROJ-3": "Done", "PROJ-4": "In Progress"})
+    monkeypatch.setattr(issues, "get_jira_client", lambda name: bulk)
+    result = issues.transition_issues_bulk("Stop", issue_keys=["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4", "bad"])
+
+    assert bulk.requests.count("SEARCH") == 1
+    assert bulk.requests.count("GET") == 3  # To Do, Done, In Progress
+    assert result["transition_lookups"] == 3
+    rows = {r["key"]: r for r in result["results"]}
+    assert rows["PROJ-1"]["status"] == "error" and "Available" in rows["PROJ-1"]["error"]
+    assert rows["PROJ-3"]["to_status"] == "To Do"
+    assert rows["PROJ-4"]["transition_id"] == "21"
+    assert rows["bad"]["status"] == "error"
+    assert (result["succeeded"], result["failed"]) == (2, 3)
@@ -0,0 +1,78 @@
+"""Unit tests for project-wide workflow extraction."""
+
+import threading
+
+import pytest
+
+import transition_cache
+from disk_cache import DiskCache
+from tools import workflow
+
+PROJECT_STATUSES = [
+    {"name": "Bug", "statuses": [
+        {"name": "Open", "id": "1", "statusCategory": {"name": "To Do"}},
+        {"name": "Fixed", "id": "2", "statusCategory": {"name": "Done"}},
+    ]},
+    {"name": "Story", "statuses": [
+        {"name": "To Do", "id": "3", "statusCategory": {"name": "To Do"}},
+        {"name": "Done", "id": "4", "statusCategory": {"name": "Done"}},
+    ]},
+]
+SAMPLES = {
+    "Bug": ("PROJ-1", "Open", [{"id": "5", "name": "Fix", "to": {"name": "Fixed"}}]),
+    "Story": ("PROJ-2", "To Do", [{"id": "6", "name": "Finish", "to": {"name": "Done"}}]),
+}
+
+
+class FakeClient:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.status_calls = 0
+        self.sample_calls = 0
+
+    def get(self, path):
+        assert path == "rest/api/2/project/PROJ/statuses"
+        self.status_calls += 1
+        return PROJECT_STATUSES
+
+    def jql(self, jql, fields=None, limit=None):
+        issue_type = jql.split('issuetype = "')[1].split('"')[0]
+        return {"issues": [{"key": SAMPLES[issue_type][0]}]}
+
+    def issue(self, key, fields=None, expand=None):
+        with self.lock:
+            self.sample_calls += 1
+        issue_type = next(t for t, sample in SAMPLES.items() if sample[0] == key)
+        _, status, transitions = SAMPLES[issue_type]
+        return {"key": key, "fields": {
+            "project": {"key": "PROJ"}, "issuetype": {"name": issue_type}, "status": {"name": status},
+        }, "transitions": transitions}
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    fake = FakeClient()
+    monkeypatch.setattr(workflow, "get_jira_client", lambda name: fake)
+    monkeypatch.setattr(workflow, "resolve_instance_name", lambda name: "primary")
+    monkeypatch.setattr(workflow, "_render_cache", DiskCache(tmp_path, 1024 * 1024))
+    workflow._workflow_cache.clear()
+    transition_cache._transitions.clear()
+    yield fake
+    workflow._workflow_cache.clear()
+    transition_cache._transitions.clear()
+
+
+def test_all_issue_types_use_one_statuses_request(client):
+    result = workflow.generate_project_workflow_graph("PROJ", output_format="json", all_issue_types=True)
+    assert client.status_calls == 1
+    assert client.sample_calls == 2
+    by_type = {g["issue_type"]: g["workflow"] for g in result["issue_types"]}
+    assert [s["name"] for s in by_type["Bug"]["statuses"]] == ["Open", "Fixed"]
+    assert by_type["Story"]["transitions"] == [{"name": "Finish", "from_status": "To Do", "to_status": "Done"}]
+    assert transition_cache.lookup("primary", "PROJ", "Bug", "Open")[0]["name"] == "Fix"
+
+
+def test_all_issue_types_renders_each_type(client):
+    result = workflow.generate_project_workflow_graph("PROJ", all_issue_types=True)
+    assert result["count"] == 2
+    assert all("image_base64" in g for g in result["issue_types"])
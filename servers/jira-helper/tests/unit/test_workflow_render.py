@@ -0,0 +1,86 @@
+"""Unit tests for the dependency-free workflow renderer."""
+
+import base64
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import workflow_render
+from disk_cache import DiskCache
+from tools import workflow
+
+WORKFLOW = {
+    "statuses": [
+        {"name": "To Do", "category": "To Do"},
+        {"name": "In Progress", "category": "In Progress"},
+        {"name": "Review", "category": "In Progress"},
+        {"name": "Done", "category": "Done"},
+    ],
+    "transitions": [
+        {"name": "Start", "from_status": "To Do", "to_status": "In Progress"},
+        {"name": "Submit", "from_status": "In Progress", "to_status": "Review"},
+        {"name": "Reject", "from_status": "Review", "to_status": "In Progress"},
+        {"name": "Approve \"&\" ship", "from_status": "Review", "to_status": "Done"},
+        {"name": "Reopen", "from_status": "Done", "to_status": "Blocked"},
+    ],
+}
+
+
+def test_svg_is_well_formed_and_deterministic():
+    svg = workflow_render.to_svg(WORKFLOW, "Workflow: PROJ - Task")
+    root = ET.fromstring(svg)
+    rects = [e for e in root.iter("{http://www.w3.org/2000/svg}rect") if e.get("rx")]
+    assert len(rects) == 5  # four statuses plus the unlisted "Blocked"
+    assert svg == workflow_render.to_svg(WORKFLOW, "Workflow: PROJ - Task")
+
+
+def test_svg_places_categories_in_columns():
+    centers, _, _ = workflow_render._layout(workflow_render._nodes(WORKFLOW))
+    assert centers["To Do"][0] < centers["In Progress"][0] == centers["Review"][0] < centers["Done"][0]
+    assert centers["Blocked"][0] > centers["Done"][0]
+
+
+def test_mermaid_and_dot_text():
+    mermaid = workflow_render.to_mermaid(WORKFLOW)
+    assert mermaid.startswith("flowchart LR")
+    assert 's0 -->|"Start"| s1' in mermaid
+    assert "#quot;" in mermaid
+    dot = workflow_render.to_dot(WORKFLOW, "T")
+    assert '"Review" -> "Done" [label="Approve \\"&\\" ship"];' in dot
+
+
+@pytest.fixture
+def extract_calls(monkeypatch, tmp_path):
+    calls = []
+
+    def extract(*args, **kwargs):
+        calls.append(args[1:3])
+        return WORKFLOW
+
+    monkeypatch.setattr(workflow, "get_jira_client", lambda name: object())
+    monkeypatch.setattr(workflow, "resolve_instance_name", lambda name: "primary")
+    monkeypatch.setattr(workflow, "_extract_workflow_data", extract)
+    monkeypatch.setattr(workflow, "_render_cache", DiskCache(tmp_path, 1024 * 1024))
+    workflow._workflow_cache.clear()
+    yield calls
+    workflow._workflow_cache.clear()
+
+
+def test_tool_svg_does_not_import_matplotlib(extract_calls, monkeypatch):
+    monkeypatch.delitem(sys.modules, "matplotlib", raising=False)
+    result = workflow.generate_project_workflow_graph("PROJ")
+    assert result["format"] == "svg"
+    assert base64.b64decode(result["image_base64"]).startswith(b"<svg")
+    assert "matplotlib" not in sys.modules
+
+
+def test_workflow_and_render_are_cached(extract_calls):
+    first = workflow.generate_project_workflow_graph("PROJ", "Task")
+    second = workflow.generate_project_workflow_graph("proj", "task")
+    assert extract_calls == [("PROJ", "Task")]
+    assert (first["workflow_cached"], first["render_cached"]) == (False, False)
+    assert (second["workflow_cached"], second["render_cached"]) == (True, False)  # title differs
+    third = workflow.generate_project_workflow_graph("PROJ", "Task")
+    assert third["render_cached"] is True
+    assert third["image_base64"] == first["image_base64"]